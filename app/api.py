@@ -10,18 +10,27 @@ ADVERTENCIA DE SEGURIDAD:
 Uso:
     python app/api.py
     
+    # Producción (Linux/Mac), equivalente a lo que hace main():
+    gunicorn -w 5 -k gthread --threads 4 -b 0.0.0.0:8080 wsgi:app
+    
     # Swagger UI disponible en:
     http://localhost:8080/apidocs
 """
 
+import atexit
+import functools
+import hashlib
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Dict, Optional, Tuple
 
 # Agregar el directorio raíz al path para importar src
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from flask import Flask, request, jsonify, send_file
-from flasgger import Swagger, swag_from
+from flasgger import Swagger
 import logging
 
 from src.config.logging_config import setup_logging
@@ -30,12 +39,14 @@ from src.config.constants import Constants
 from src.domain.use_cases import GenerateReportUseCase, ListLogsUseCase, DownloadReportUseCase
 from src.domain.analyze_use_case import AnalyzeLogUseCase
 from src.domain.dtos import AnalyzeRequest, ErrorResponse
-from src.domain.enums import OutputFormat
+from src.domain.enums import ErrorCode
+from src.ports.llm_port import LLMPort
 from src.adapters.log_reader_fs import FileSystemLogReader
 from src.domain.log_analyzer.analyzer import LogAnalyzer
 from src.adapters.llm_factory import create_llm
 from src.adapters.cache_memory import MemoryCache
 from src.adapters.report_writer_fs import FileSystemReportWriter
+from src.adapters.rate_limiter import SlidingWindowRateLimiter
 
 
 # Configurar logging
@@ -45,6 +56,13 @@ logger = logging.getLogger(__name__)
 # Crear app Flask
 app = Flask(__name__)
 
+# orjson es opcional: si no está instalado se usa el JSON de stdlib de Flask
+try:
+    from app.json_provider import OrjsonJSONProvider
+    app.json = OrjsonJSONProvider(app)
+except ImportError:
+    logger.debug("orjson no disponible, usando proveedor JSON por defecto")
+
 # Configurar Swagger
 swagger_config = {
     "headers": [],
@@ -85,44 +103,148 @@ swagger_template = {
     }
 }
 
-swagger = Swagger(app, config=swagger_config, template=swagger_template)
+# flasgger ya arma el spec de forma perezosa (primer /apispec.json) y lo cachea;
+# acá solo se registran sus vistas. Se puede desactivar en producción.
+swagger = (
+    Swagger(app, config=swagger_config, template=swagger_template)
+    if settings.SWAGGER_ENABLED
+    else None
+)
 
 # Componer dependencias (singleton para la app)
+# Los componentes baratos se crean al importar; el LLM y los casos de uso que
+# lo usan se crean perezosamente para que el worker arranque sin esperar al
+# proveedor (p.ej. si falta una API key o el host de Ollama no responde).
 log_reader = FileSystemLogReader()
 analyzer = LogAnalyzer()
-llm = create_llm()
-cache = MemoryCache()
+cache = MemoryCache(max_entries=settings.CACHE_MAX_ENTRIES)
 report_writer = FileSystemReportWriter()
 
-use_case = GenerateReportUseCase(
+list_logs_use_case = ListLogsUseCase(
     log_reader=log_reader,
-    analyzer=analyzer,
-    llm=llm,
-    report_writer=report_writer,
     cache=cache
 )
 
-list_logs_use_case = ListLogsUseCase(
-    log_reader=log_reader
-)
 
-download_report_use_case = DownloadReportUseCase(
-    log_reader=log_reader,
-    analyzer=analyzer,
-    llm=llm,
-    report_writer=report_writer,
-    cache=cache,
-    max_files=settings.REPORT_DOWNLOAD_MAX_FILES
+# Pool acotado para I/O de archivos (lecturas de varios logs por request)
+IO_EXECUTOR = ThreadPoolExecutor(
+    max_workers=settings.IO_MAX_WORKERS,
+    thread_name_prefix="log-io"
 )
 
-analyze_use_case = AnalyzeLogUseCase(
-    log_reader=log_reader,
-    analyzer=analyzer,
-    llm=llm,
-    cache=cache
+
+# Serializa la construcción de los singletons perezosos (RLock: los getters
+# de casos de uso llaman a get_llm con el lock tomado)
+_INIT_LOCK = threading.RLock()
+
+
+def _lazy_singleton(factory):
+    """
+    Como functools.lru_cache(maxsize=1), pero construye una sola vez aunque
+    el thread de warm-up y el primer request lo pidan a la vez.
+
+    Args:
+        factory: Función sin argumentos que crea la instancia
+
+    Returns:
+        Getter que devuelve siempre la misma instancia
+    """
+    instance = []
+
+    @functools.wraps(factory)
+    def getter():
+        if not instance:
+            with _INIT_LOCK:
+                if not instance:
+                    instance.append(factory())
+        return instance[0]
+
+    return getter
+
+
+@_lazy_singleton
+def get_llm() -> LLMPort:
+    """Crea (una sola vez) el cliente LLM configurado"""
+    llm = create_llm()
+    atexit.register(llm.close)
+    return llm
+
+
+@_lazy_singleton
+def get_report_use_case() -> GenerateReportUseCase:
+    """Caso de uso de generación de reportes (creado en el primer uso)"""
+    return GenerateReportUseCase(
+        log_reader=log_reader,
+        analyzer=analyzer,
+        llm=get_llm(),
+        report_writer=report_writer,
+        cache=cache
+    )
+
+
+@_lazy_singleton
+def get_download_report_use_case() -> DownloadReportUseCase:
+    """Caso de uso de descarga de reportes (creado en el primer uso)"""
+    return DownloadReportUseCase(
+        log_reader=log_reader,
+        analyzer=analyzer,
+        llm=get_llm(),
+        report_writer=report_writer,
+        cache=cache,
+        max_files=settings.REPORT_DOWNLOAD_MAX_FILES,
+        executor=IO_EXECUTOR
+    )
+
+
+@_lazy_singleton
+def get_analyze_use_case() -> AnalyzeLogUseCase:
+    """Caso de uso de /analyze (creado en el primer uso)"""
+    return AnalyzeLogUseCase(
+        log_reader=log_reader,
+        analyzer=analyzer,
+        llm=get_llm(),
+        cache=cache
+    )
+
+
+def _warm_up_llm() -> None:
+    """Crea y precalienta el LLM sin bloquear el arranque (si falla, solo loguea)"""
+    try:
+        get_llm().warm_up()
+    except Exception as e:
+        logger.warning(f"No se pudo precalentar el LLM: {e}")
+
+
+if settings.LLM_WARMUP_ENABLED:
+    threading.Thread(target=_warm_up_llm, name="llm-warmup", daemon=True).start()
+
+
+# Código HTTP para cada categoría de error de AnalyzeResponse
+ERROR_STATUS_CODES = {
+    ErrorCode.NOT_FOUND: 404,
+    ErrorCode.TIMEOUT: 504,
+    ErrorCode.CONNECTION: 503,
+    ErrorCode.INTERNAL: 500,
+}
+
+# Limita las llamadas concurrentes al LLM (por proceso) para no saturar al proveedor
+LLM_SEMAPHORE = threading.BoundedSemaphore(settings.LLM_MAX_CONCURRENCY)
+
+# Limita los requests a /analyze por cliente (por proceso)
+ANALYZE_RATE_LIMITER = SlidingWindowRateLimiter(
+    limit=settings.ANALYZE_RATE_LIMIT_PER_MINUTE,
+    window_seconds=60
 )
 
 
+def _too_many_requests(message: str, run_id: str = None):
+    """Construye una respuesta 429 con Retry-After"""
+    error = ErrorResponse(code=429, message=message, details=None, run_id=run_id)
+    response = jsonify(error.to_dict())
+    response.headers["Retry-After"] = "60"
+    return response, 429
+
+
 @app.route("/", methods=["GET"])
 def index():
     """
@@ -164,6 +286,38 @@ def index():
     })
 
 
+# Último listado serializado: (resultado del use case, body JSON, ETag)
+_datasets_payload: Tuple[Optional[Dict], bytes, str] = (None, b"", "")
+
+
+def _serialize_datasets(result: Dict) -> Tuple[bytes, str]:
+    """
+    Serializa el listado de /datasets una sola vez por resultado.
+    
+    ListLogsUseCase devuelve el mismo objeto mientras el listado está en
+    cache, así que mientras no cambie se reutilizan el body y su ETag.
+    
+    Args:
+        result: Resultado de ListLogsUseCase
+    
+    Returns:
+        Tupla (body JSON en bytes, ETag)
+    """
+    global _datasets_payload
+    
+    cached_result, body, etag = _datasets_payload
+    if cached_result is not result:
+        body = app.json.dumps({
+            Constants.API_RESPONSE_STATUS: Constants.STATUS_SUCCESS,
+            "files": result["files"],
+            "count": result["count"]
+        }).encode("utf-8")
+        etag = hashlib.sha1(body).hexdigest()
+        _datasets_payload = (result, body, etag)
+    
+    return body, etag
+
+
 @app.route("/datasets", methods=["GET"])
 def list_datasets():
     """
@@ -203,14 +357,14 @@ def list_datasets():
         description: Error interno del servidor
     """
     try:
-        # Usar el use case para listar logs
+        # Usar el use case para listar logs (cacheado mientras no cambie el directorio)
         result = list_logs_use_case.execute(str(settings.DATASETS_DIR))
+        body, etag = _serialize_datasets(result)
         
-        return jsonify({
-            Constants.API_RESPONSE_STATUS: Constants.STATUS_SUCCESS,
-            "files": result["files"],
-            "count": result["count"]
-        }), 200
+        # Respuesta pre-serializada con ETag: If-None-Match coincidente => 304 sin body
+        response = app.response_class(body, mimetype="application/json")
+        response.set_etag(etag)
+        return response.make_conditional(request)
         
     except FileNotFoundError as e:
         logger.error(f"Error al listar datasets: directorio no encontrado: {e}")
@@ -227,6 +381,105 @@ def list_datasets():
         }), 500
 
 
+def _download_error(code: int, message: str, details: Optional[str] = None):
+    """Respuesta de error de /reports/download (incluye status y error, según su contrato)"""
+    body = ErrorResponse(code=code, message=message, details=details).to_dict()
+    body.update(status="error", error=message)
+    return jsonify(body), code
+
+
+@app.route("/reports/download", methods=["POST"])
+def download_report():
+    """
+    Genera un reporte a partir de uno o varios logs y lo descarga
+    ---
+    tags:
+      - Reportes
+    parameters:
+      - in: body
+        name: body
+        required: true
+        schema:
+          type: object
+          required:
+            - report_name
+            - format
+            - files
+          properties:
+            report_name:
+              type: string
+              description: Nombre del archivo descargado (sin extensión)
+              example: analisis_mensual
+            format:
+              type: string
+              enum: [excel, txt, csv, doc]
+              example: csv
+            files:
+              type: array
+              description: Archivos de datasets/ a incluir (máximo REPORT_DOWNLOAD_MAX_FILES)
+              items:
+                type: string
+              example: [log1.txt, log2.txt]
+    responses:
+      200:
+        description: Descarga directa del archivo generado
+      400:
+        description: Error de validación
+      404:
+        description: Algún archivo no existe en datasets/
+      429:
+        description: LLM ocupado
+      503:
+        description: No se puede conectar al proveedor LLM
+      504:
+        description: Timeout del LLM
+    """
+    data = request.get_json(cache=False, silent=True)
+    if not isinstance(data, dict):
+        return _download_error(400, "Body JSON inválido", "Se esperaba un objeto JSON")
+    
+    files = data.get("files")
+    if not isinstance(files, list) or not all(isinstance(name, str) for name in files):
+        return _download_error(400, "Error de validación", "files debe ser una lista de nombres")
+    report_name = data.get("report_name")
+    format_str = data.get("format")
+    
+    # Backpressure: el reporte pasa por el LLM, igual que /analyze
+    if not LLM_SEMAPHORE.acquire(timeout=settings.LLM_QUEUE_TIMEOUT_SECONDS):
+        logger.warning("LLM ocupado, descarga de reporte rechazada")
+        return _too_many_requests("LLM ocupado, reintente más tarde")
+    try:
+        result = get_download_report_use_case().execute(
+            report_name=report_name,
+            format_str=format_str,
+            files=files,
+            datasets_dir=str(settings.DATASETS_DIR)
+        )
+    except ValueError as e:
+        return _download_error(400, "Error de validación", str(e))
+    except FileNotFoundError as e:
+        return _download_error(404, "Archivo no encontrado", str(e))
+    except ConnectionError as e:
+        logger.error(f"Error de conexión al generar reporte: {e}")
+        return _download_error(503, "No se puede conectar al proveedor LLM", str(e))
+    except TimeoutError as e:
+        logger.error(f"Timeout al generar reporte: {e}")
+        return _download_error(504, "Timeout al procesar request", str(e))
+    except Exception as e:
+        logger.error(f"Error inesperado al generar reporte: {e}", exc_info=True)
+        return _download_error(500, "Error interno del servidor", str(e))
+    finally:
+        LLM_SEMAPHORE.release()
+    
+    report_path = Path(result["path"])
+    return send_file(
+        str(report_path),
+        mimetype=Constants.FORMAT_MIME_TYPES.get(result["format"].lower(), "application/octet-stream"),
+        as_attachment=True,
+        download_name=f"{report_name}{report_path.suffix}"
+    )
+
+
 @app.route(Constants.API_ENDPOINT_ANALYZE, methods=["POST"])
 def analyze():
     """
@@ -247,6 +500,7 @@ def analyze():
           - `txt` - Archivo de texto plano
           - `markdown` - Archivo Markdown con formato
           - `doc` - Archivo Word (.docx) - requiere python-docx instalado
+          - `arrow` - Tabla Apache Arrow/Feather (.arrow) con los grupos de errores - requiere pyarrow instalado
         schema:
           type: object
           required:
@@ -265,7 +519,7 @@ def analyze():
             output_format:
               type: string
               description: Formato de salida del reporte
-              enum: [excel, csv, txt, markdown, doc]
+              enum: [excel, csv, txt, markdown, doc, arrow]
               example: excel
           example:
             input_log_filename: generated_logs.txt
@@ -323,6 +577,8 @@ def analyze():
               type: string
             run_id:
               type: string
+      429:
+        description: Límite de requests excedido o LLM ocupado (ver Retry-After)
       500:
         description: Error interno del servidor
         schema:
@@ -341,6 +597,9 @@ def analyze():
     """
     run_id = None
     
+    if not ANALYZE_RATE_LIMITER.allow(request.remote_addr or "unknown"):
+        return _too_many_requests("Límite de requests por minuto excedido", run_id)
+    
     try:
         # Validar Content-Type
         if not request.is_json:
@@ -351,8 +610,16 @@ def analyze():
             )
             return jsonify(error.to_dict()), 400
         
-        # Obtener datos del request
-        data = request.get_json()
+        # Obtener datos del request (sin cachear el body parseado en el request)
+        data = request.get_json(cache=False, silent=True)
+        if not isinstance(data, dict):
+            error = ErrorResponse(
+                code=400,
+                message="Body JSON inválido",
+                details="Se esperaba un objeto JSON",
+                run_id=run_id
+            )
+            return jsonify(error.to_dict()), 400
         
         # Parsear y validar request usando DTO
         try:
@@ -374,20 +641,25 @@ def analyze():
             f"output={analyze_request.output_filename}.{analyze_request.output_format.value}"
         )
         
-        # Ejecutar caso de uso
-        response = analyze_use_case.execute(analyze_request)
+        # Un reporte ya exportado para el mismo contenido no usa el LLM:
+        # se responde sin esperar cupo
+        use_case = get_analyze_use_case()
+        response = use_case.execute_cached(analyze_request)
+        
+        if response is None:
+            # Backpressure: si el LLM está saturado responder 429 en vez de ocupar el worker
+            if not LLM_SEMAPHORE.acquire(timeout=settings.LLM_QUEUE_TIMEOUT_SECONDS):
+                logger.warning(f"[{run_id}] LLM ocupado, request rechazado")
+                return _too_many_requests("LLM ocupado, reintente más tarde", run_id)
+            try:
+                response = use_case.execute(analyze_request)
+            finally:
+                LLM_SEMAPHORE.release()
         
         # Si la respuesta tiene status error, retornar el error apropiado
         if response.status == 'error':
-            # Determinar código de error según el mensaje
-            status_code = 500
-            
-            if "no encontrado" in response.errors.lower() or "no existe" in response.errors.lower():
-                status_code = 404
-            elif "timeout" in response.errors.lower():
-                status_code = 504
-            elif "conectar" in response.errors.lower():
-                status_code = 503
+            # Código HTTP según la categoría del error
+            status_code = ERROR_STATUS_CODES.get(response.error_code, 500)
             
             error = ErrorResponse(
                 code=status_code,
@@ -407,7 +679,6 @@ def analyze():
         )
         
         # Obtener extensión del archivo
-        from pathlib import Path
         output_file = Path(response.output_path)
         download_name = f"{analyze_request.output_filename}{output_file.suffix}"
         
@@ -486,9 +757,10 @@ def create_app():
 
 
 def main():
-    """Inicia el servidor Flask"""
-    import sys
+    """Inicia el servidor (gunicorn si está disponible, Flask como fallback)"""
     import io
+    import os
+    import shutil
     
     # Configurar encoding UTF-8 para stdout en Windows
     if sys.platform == 'win32':
@@ -519,11 +791,29 @@ def main():
     print("Iniciando servidor en http://0.0.0.0:8080")
     print()
     
-    # Iniciar servidor
+    # Iniciar servidor: gunicorn (multi-worker) si está disponible,
+    # servidor de desarrollo de Flask como fallback (p.ej. en Windows)
+    if sys.platform != 'win32' and shutil.which("gunicorn"):
+        print(
+            f"Servidor: gunicorn ({settings.API_WORKERS} workers x "
+            f"{settings.API_THREADS} threads)"
+        )
+        os.execvp("gunicorn", [
+            "gunicorn",
+            "--chdir", str(Path(__file__).parent.parent),
+            "-w", str(settings.API_WORKERS),
+            "-k", "gthread",
+            "--threads", str(settings.API_THREADS),
+            "-b", "0.0.0.0:8080",
+            "--timeout", str(settings.API_TIMEOUT_SECONDS),
+            "wsgi:app"
+        ])
+    
     app.run(
         host="0.0.0.0",
         port=8080,
-        debug=False
+        debug=False,
+        threaded=True
     )
 
 
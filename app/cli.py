@@ -14,15 +14,8 @@ from pathlib import Path
 # Agregar el directorio raíz al path para importar src
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from src.config.logging_config import setup_logging
-from src.config.settings import settings
-from src.config.constants import Constants
-from src.domain.use_cases import GenerateReportUseCase
-from src.adapters.log_reader_fs import FileSystemLogReader
-from src.domain.log_analyzer.analyzer import LogAnalyzer
-from src.adapters.llm_factory import create_llm
-from src.adapters.cache_memory import MemoryCache
-from src.adapters.report_writer_fs import FileSystemReportWriter
+# Los imports de src se hacen dentro de main(), después de parsear argumentos:
+# --help y los errores de uso no pagan la carga de adapters (requests, etc.)
 
 
 def main():
@@ -55,7 +48,7 @@ Variables de entorno soportadas:
     parser.add_argument(
         "--output",
         type=str,
-        help=f"Directorio de salida (default: {settings.OUT_DIR})"
+        help="Directorio de salida (default: OUT_DIR o ./out)"
     )
     
     parser.add_argument(
@@ -73,6 +66,10 @@ Variables de entorno soportadas:
     
     args = parser.parse_args()
     
+    from src.config.logging_config import setup_logging
+    from src.config.settings import settings
+    from src.config.constants import Constants
+    
     # Configurar logging
     setup_logging(level=args.log_level)
     
@@ -95,6 +92,13 @@ Variables de entorno soportadas:
     print()
     
     try:
+        from src.domain.use_cases import GenerateReportUseCase
+        from src.adapters.log_reader_fs import FileSystemLogReader
+        from src.domain.log_analyzer.analyzer import LogAnalyzer
+        from src.adapters.llm_factory import create_llm
+        from src.adapters.cache_memory import MemoryCache
+        from src.adapters.report_writer_fs import FileSystemReportWriter
+        
         # Componer dependencias (inyección manual)
         log_reader = FileSystemLogReader()
         analyzer = LogAnalyzer()
@@ -0,0 +1,45 @@
+"""
+Proveedor JSON de Flask basado en orjson.
+Serializa/parsea más rápido que json de stdlib (respuestas de /datasets, errores, Swagger).
+"""
+
+from typing import Any, Union
+
+import orjson
+from flask.json.provider import DefaultJSONProvider
+
+
+class OrjsonJSONProvider(DefaultJSONProvider):
+    """Reemplaza json de stdlib por orjson manteniendo el comportamiento de Flask"""
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        """
+        Serializa a JSON con orjson.
+
+        Args:
+            obj: Objeto a serializar
+            **kwargs: Opciones de Flask (solo se respetan indent y sort_keys)
+
+        Returns:
+            JSON como string
+        """
+        # Swagger usa códigos HTTP (int) como keys
+        option = orjson.OPT_NON_STR_KEYS
+        if kwargs.get("indent"):
+            option |= orjson.OPT_INDENT_2
+        if kwargs.get("sort_keys", self.sort_keys):
+            option |= orjson.OPT_SORT_KEYS
+
+        return orjson.dumps(obj, default=self.default, option=option).decode("utf-8")
+
+    def loads(self, s: Union[str, bytes], **kwargs: Any) -> Any:
+        """
+        Parsea JSON con orjson.
+
+        Args:
+            s: JSON como string o bytes
+
+        Returns:
+            Objeto deserializado
+        """
+        return orjson.loads(s)
@@ -0,0 +1,109 @@
+"""
+Cache en disco con TTL.
+
+Un archivo JSON por key dentro de un directorio: sobrevive reinicios del
+proceso (p.ej. re-ejecuciones del CLI sobre el mismo log). La expiracion usa
+el reloj del sistema, porque time.monotonic() no es comparable entre procesos.
+"""
+
+import logging
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Optional, Union
+
+from ..ports.cache_port import CachePort
+from .json_codec import dumps_json, loads_json
+
+
+logger = logging.getLogger(__name__)
+
+
+class FileCache(CachePort):
+    """Cache persistente en disco con expiracion por TTL"""
+
+    def __init__(self, directory: Union[str, Path]):
+        """
+        Args:
+            directory: Directorio donde se guardan las entradas
+        """
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Obtiene un valor del cache si existe y no expiro.
+
+        Args:
+            key: Identificador del cache
+
+        Returns:
+            Valor almacenado o None
+        """
+        path = self._path(key)
+        try:
+            entry = loads_json(path.read_bytes())
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning("Entrada de cache ilegible %s: %s", path, e)
+            return None
+
+        if time.time() >= entry["expires_at"]:
+            logger.debug("Cache expired: %s", key)
+            self.invalidate(key)
+            return None
+
+        return entry["value"]
+
+    def set(self, key: str, value: Any, ttl_seconds: int = 60) -> None:
+        """
+        Guarda un valor en cache con TTL.
+
+        Escribe a un archivo temporal propio (mkstemp, único aunque varios
+        threads guarden la misma key) y lo renombra, para que un lector
+        concurrente nunca vea una entrada a medio escribir. Un error de
+        escritura solo se registra: el cache no debe hacer fallar al llamador.
+
+        Args:
+            key: Identificador del cache
+            value: Valor a almacenar (serializable a JSON)
+            ttl_seconds: Tiempo de vida en segundos
+        """
+        path = self._path(key)
+        entry = {"value": value, "expires_at": time.time() + ttl_seconds}
+        # Serializar completo y escribir de una vez (json.dump hace un
+        # write por cada token)
+        payload = dumps_json(entry)
+
+        tmp_path = None
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                f.write(payload)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning("No se pudo guardar la entrada de cache %s: %s", path, e)
+            if tmp_path is not None:
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
+
+    def invalidate(self, key: str) -> None:
+        """
+        Invalida una entrada del cache.
+
+        Args:
+            key: Identificador del cache
+        """
+        # Sin unlink(missing_ok=True): requiere Python 3.8
+        try:
+            self._path(key).unlink()
+        except FileNotFoundError:
+            pass
+
+    def _path(self, key: str) -> Path:
+        """Ruta del archivo de una key (las keys son hashes hex, seguras como nombre)"""
+        return self.directory / f"{key}.json"
@@ -3,11 +3,15 @@ Generador de keys para cache de respuestas LLM.
 """
 
 import hashlib
-from typing import Optional
+from typing import Optional, Union
+
+
+# Tamaño de bloque al hashear inputs grandes (evita una copia completa codificada)
+HASH_CHUNK_SIZE = 1 << 20
 
 
 def build_cache_key(
-    input_text: str,
+    input_text: Union[str, bytes],
     provider: str,
     model: str,
     system_prompt: Optional[str] = None
@@ -16,14 +20,79 @@ def build_cache_key(
     Genera una key deterministica basada en input y configuracion.
 
     Args:
-        input_text: Texto de entrada del analisis
+        input_text: Texto de entrada del analisis (str o bytes UTF-8)
         provider: Proveedor LLM seleccionado
         model: Modelo LLM seleccionado
         system_prompt: Prompt de sistema opcional
 
     Returns:
-        Hash SHA-256 como string
+        Hash BLAKE2b de 256 bits como string hexadecimal
     """
     normalized_prompt = system_prompt or ""
-    payload = "\n".join([provider, model, normalized_prompt, input_text])
-    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+    hasher = hashlib.blake2b(digest_size=32)
+    # update() por partes: no se arma el string concatenado del payload
+    for part in (provider, model, normalized_prompt):
+        hasher.update(part.encode("utf-8"))
+        hasher.update(b"\n")
+    _update_chunked(hasher, input_text)
+    return hasher.hexdigest()
+
+
+def _update_chunked(hasher, data: Union[str, bytes]) -> None:
+    """
+    Alimenta el hasher por bloques sin copiar el input completo.
+
+    Los str se codifican de a HASH_CHUNK_SIZE caracteres (UTF-8 por partes
+    produce los mismos bytes que codificar todo junto); los bytes se recorren
+    con memoryview, sin copias.
+
+    Args:
+        hasher: Objeto hash de hashlib
+        data: Texto o bytes a hashear
+    """
+    if isinstance(data, str):
+        for start in range(0, len(data), HASH_CHUNK_SIZE):
+            hasher.update(data[start:start + HASH_CHUNK_SIZE].encode("utf-8"))
+        return
+
+    view = memoryview(data)
+    for start in range(0, len(view), HASH_CHUNK_SIZE):
+        hasher.update(view[start:start + HASH_CHUNK_SIZE])
+
+
+def file_sha256(path: str) -> str:
+    """
+    Calcula el SHA-256 del contenido de un archivo sin cargarlo entero en memoria.
+
+    Args:
+        path: Ruta del archivo
+
+    Returns:
+        Hash SHA-256 como string
+    """
+    hasher = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+            hasher.update(chunk)
+    return hasher.hexdigest()
+
+
+def build_artifact_cache_key(
+    file_digest: str,
+    provider: str,
+    model: str,
+    output_format: str
+) -> str:
+    """
+    Genera la key del reporte exportado para un mismo contenido de log.
+
+    Args:
+        file_digest: SHA-256 del archivo de log
+        provider: Proveedor LLM seleccionado
+        model: Modelo LLM seleccionado
+        output_format: Formato de salida del reporte
+
+    Returns:
+        Key del artefacto como string
+    """
+    return ":".join(["artifact", file_digest, provider, model, output_format])
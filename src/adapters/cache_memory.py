@@ -1,10 +1,17 @@
 """
 Cache in-memory con TTL.
+
+Acotado por cantidad de entradas: al llenarse descarta la entrada usada hace
+mas tiempo (LRU). La expiracion usa time.monotonic(), inmune a saltos del
+reloj del sistema. Las operaciones toman un lock: el cache se comparte entre
+los threads del worker.
 """
 
 import logging
+import threading
 import time
-from typing import Any, Dict, Optional, Tuple
+from collections import OrderedDict
+from typing import Any, Optional, Tuple
 
 from ..ports.cache_port import CachePort
 
@@ -13,10 +20,16 @@ logger = logging.getLogger(__name__)
 
 
 class MemoryCache(CachePort):
-    """Cache in-memory con expiracion por TTL"""
+    """Cache in-memory LRU con expiracion por TTL"""
 
-    def __init__(self):
-        self._store: Dict[str, Tuple[Any, float]] = {}
+    def __init__(self, max_entries: Optional[int] = 1024):
+        """
+        Args:
+            max_entries: Cantidad maxima de entradas (None = sin limite)
+        """
+        self._store: "OrderedDict[str, Tuple[Any, float]]" = OrderedDict()
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
 
     def get(self, key: str) -> Optional[Any]:
         """
@@ -28,17 +41,19 @@ class MemoryCache(CachePort):
         Returns:
             Valor almacenado o None
         """
-        entry = self._store.get(key)
-        if entry is None:
-            return None
+        with self._lock:
+            entry = self._store.get(key)
+            if entry is None:
+                return None
 
-        value, expires_at = entry
-        if time.time() >= expires_at:
-            logger.debug("Cache expired: %s", key)
-            self._store.pop(key, None)
-            return None
+            value, expires_at = entry
+            if time.monotonic() >= expires_at:
+                logger.debug("Cache expired: %s", key)
+                self._store.pop(key, None)
+                return None
 
-        return value
+            self._store.move_to_end(key)
+            return value
 
     def set(self, key: str, value: Any, ttl_seconds: int = 60) -> None:
         """
@@ -49,8 +64,13 @@ class MemoryCache(CachePort):
             value: Valor a almacenar
             ttl_seconds: Tiempo de vida en segundos
         """
-        expires_at = time.time() + ttl_seconds
-        self._store[key] = (value, expires_at)
+        with self._lock:
+            self._store[key] = (value, time.monotonic() + ttl_seconds)
+            self._store.move_to_end(key)
+
+            if self.max_entries is not None and len(self._store) > self.max_entries:
+                victim, _ = self._store.popitem(last=False)
+                logger.debug("Cache evict (LRU): %s", victim)
 
     def invalidate(self, key: str) -> None:
         """
@@ -59,4 +79,5 @@ class MemoryCache(CachePort):
         Args:
             key: Identificador del cache
         """
-        self._store.pop(key, None)
+        with self._lock:
+            self._store.pop(key, None)
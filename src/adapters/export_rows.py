@@ -0,0 +1,95 @@
+"""
+Filas aplanadas del análisis estructurado para los exporters.
+Resuelve una vez los .get() con sus valores por defecto, así cada exporter
+solo recorre tuplas de atributos al generar su formato.
+"""
+
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Tuple
+
+
+@dataclass
+class ErrorRow:
+    """Grupo de errores listo para exportar"""
+    __slots__ = ("exception", "count", "logger", "first_ts", "location")
+    exception: str
+    count: int
+    logger: str
+    first_ts: str
+    location: str
+
+
+@dataclass
+class WarningRow:
+    """Warning listo para exportar"""
+    __slots__ = ("timestamp", "logger", "message")
+    timestamp: str
+    logger: str
+    message: str
+
+
+def error_rows(error_groups: Iterable[Dict]) -> List[ErrorRow]:
+    """
+    Aplana grupos de errores del análisis.
+
+    Args:
+        error_groups: Grupos de errores (ya recortados si corresponde)
+
+    Returns:
+        Lista de ErrorRow en el mismo orden
+    """
+    rows = []
+    for error_group in error_groups:
+        # Ubicación probable a partir del top_frame si existe
+        frame = error_group.get("top_frame")
+        location = f"{frame.get('file', 'unknown')}:{frame.get('line', '?')}" if frame else ""
+        rows.append(ErrorRow(
+            error_group.get("exception", "Unknown"),
+            error_group.get("count", 0),
+            error_group.get("logger", "Unknown"),
+            error_group.get("first_ts", "N/A"),
+            location
+        ))
+    return rows
+
+
+def warning_rows(warnings: Iterable[Dict]) -> List[WarningRow]:
+    """
+    Aplana warnings del análisis.
+
+    Args:
+        warnings: Warnings (ya recortados si corresponde)
+
+    Returns:
+        Lista de WarningRow en el mismo orden
+    """
+    return [
+        WarningRow(
+            warning.get("timestamp", "N/A"),
+            warning.get("logger", "Unknown"),
+            warning.get("message", "")
+        )
+        for warning in warnings
+    ]
+
+
+def flatten(
+    analysis: Dict,
+    max_errors: Optional[int] = None,
+    max_warnings: Optional[int] = None
+) -> Tuple[List[ErrorRow], List[WarningRow]]:
+    """
+    Aplana errores y warnings del análisis en una sola pasada.
+
+    Args:
+        analysis: Análisis estructurado
+        max_errors: Máximo de grupos de errores (None = todos)
+        max_warnings: Máximo de warnings (None = todos)
+
+    Returns:
+        Tupla (errores, warnings); lista vacía si falta la clave
+    """
+    return (
+        error_rows(analysis.get("error_groups", ())[:max_errors]),
+        warning_rows(analysis.get("warnings", ())[:max_warnings])
+    )
@@ -0,0 +1,29 @@
+"""
+Apertura de archivos de salida para los writers de reportes.
+"""
+
+from pathlib import Path
+from typing import IO, Union
+
+
+def open_for_write(path: Union[str, Path], mode: str = "w", **kwargs) -> IO:
+    """
+    Abre un archivo para escritura creando su directorio solo si falta.
+
+    En el caso habitual el directorio ya existe: se abre directamente, sin el
+    mkdir + stat previos de Path.mkdir(parents=True, exist_ok=True) en cada
+    escritura. Si el directorio no existe (o fue borrado) se crea y se reintenta.
+
+    Args:
+        path: Path del archivo a escribir
+        mode: Modo de apertura ('w' o 'wb')
+        **kwargs: Argumentos adicionales para open (p.ej. encoding)
+
+    Returns:
+        Archivo abierto
+    """
+    try:
+        return open(path, mode, **kwargs)
+    except FileNotFoundError:
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        return open(path, mode, **kwargs)
@@ -0,0 +1,110 @@
+"""
+Sesiones HTTP compartidas para los adapters de LLM.
+Reutiliza conexiones (keep-alive) en lugar de abrir una por request.
+"""
+
+import time
+from typing import Iterable, Iterator, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import ReadTimeoutError
+from urllib3.util.retry import Retry
+
+from ..config.settings import settings
+
+
+# Jitter aleatorio sumado a cada espera de backoff y tope de la espera
+BACKOFF_JITTER_SECONDS = 0.5
+BACKOFF_MAX_SECONDS = 30
+
+def build_http_session(
+    pool_maxsize: Optional[int] = None,
+    max_retries: int = 0,
+    status_forcelist: Iterable[int] = (502, 503, 504)
+) -> requests.Session:
+    """
+    Crea una sesion HTTP con pool de conexiones acotado.
+
+    Los reintentos solo cubren fallos de conexion y los status indicados
+    (respetando Retry-After); un timeout de lectura no se reintenta para no
+    multiplicar la espera. El backoff exponencial lleva jitter y un tope,
+    para que varias llamadas limitadas a la vez no reintenten en rafaga.
+
+    Args:
+        pool_maxsize: Conexiones maximas por host (si es None, usa settings)
+        max_retries: Reintentos ante fallos transitorios (0 = sin reintentos)
+        status_forcelist: Status HTTP que disparan un reintento
+
+    Returns:
+        Sesion de requests lista para reutilizar
+    """
+    pool_maxsize = pool_maxsize or settings.HTTP_POOL_MAXSIZE
+    retry_options = dict(
+        total=max_retries,
+        read=0,
+        backoff_factor=0.5,
+        status_forcelist=tuple(status_forcelist),
+        allowed_methods=None,
+        raise_on_status=False
+    )
+    try:
+        retry = Retry(
+            **retry_options,
+            backoff_jitter=BACKOFF_JITTER_SECONDS,
+            backoff_max=BACKOFF_MAX_SECONDS
+        )
+    except TypeError:
+        # urllib3 < 2.0: sin jitter (el tope por defecto es 120 s)
+        retry = Retry(**retry_options)
+    adapter = HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=pool_maxsize,
+        max_retries=retry
+    )
+
+    session = requests.Session()
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def iter_stream_lines(
+    response: requests.Response,
+    deadline_seconds: float,
+    chunk_size: int
+) -> Iterator[bytes]:
+    """
+    Recorre una respuesta en streaming línea a línea con un tope de tiempo total.
+
+    Con stream=True el timeout de lectura solo acota la espera entre
+    fragmentos: una respuesta que gotea podría no terminar nunca. Además
+    requests reporta un timeout de lectura a mitad del stream como
+    ConnectionError; aquí se traduce a ReadTimeout para que el adapter lo
+    trate como timeout y no como servicio caído.
+
+    Args:
+        response: Respuesta abierta con stream=True
+        deadline_seconds: Tiempo máximo para recibir la respuesta completa
+        chunk_size: Tamaño de lectura del stream
+
+    Yields:
+        Líneas de la respuesta
+
+    Raises:
+        requests.exceptions.ReadTimeout: Si se excede el tope o vence la lectura
+        requests.exceptions.ConnectionError: Si se corta la conexión
+        requests.exceptions.ChunkedEncodingError: Si la respuesta llega truncada
+    """
+    deadline = time.monotonic() + deadline_seconds
+    try:
+        for line in response.iter_lines(chunk_size=chunk_size):
+            if time.monotonic() > deadline:
+                raise requests.exceptions.ReadTimeout(
+                    f"Respuesta incompleta después de {deadline_seconds}s"
+                )
+            yield line
+    except requests.exceptions.ConnectionError as e:
+        if any(isinstance(arg, ReadTimeoutError) for arg in e.args):
+            raise requests.exceptions.ReadTimeout(e) from e
+        raise
@@ -0,0 +1,65 @@
+"""
+Serialización JSON de requests y respuestas HTTP de los adapters de LLM
+y de los archivos JSON que escriben los adapters.
+Usa orjson si está instalado (más rápido con cuerpos grandes); si no, json de stdlib.
+"""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson es opcional
+    orjson = None
+
+
+def loads_json(content: bytes) -> Any:
+    """
+    Parsea un cuerpo JSON crudo sin decodificarlo antes a str.
+
+    Args:
+        content: Bytes del cuerpo de la respuesta
+
+    Returns:
+        Objeto Python parseado
+
+    Raises:
+        ValueError: Si el contenido no es JSON válido
+    """
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+def dumps_json(payload: Any) -> bytes:
+    """
+    Serializa el cuerpo de un request directamente a bytes UTF-8.
+
+    Args:
+        payload: Objeto serializable a JSON
+
+    Returns:
+        Cuerpo JSON codificado en UTF-8
+    """
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload, ensure_ascii=False).encode("utf-8")
+
+
+def dumps_json_indented(payload: Any) -> bytes:
+    """
+    Serializa un objeto legible (indentado a 2 espacios) en bytes UTF-8.
+
+    Equivalente a json.dumps(payload, indent=2, ensure_ascii=False): las
+    claves no string (p.ej. int) se convierten a string como en stdlib y solo
+    puede variar la notación de floats con exponente (1e20 vs 1e+20).
+
+    Args:
+        payload: Objeto serializable a JSON
+
+    Returns:
+        JSON indentado codificado en UTF-8
+    """
+    if orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(payload, indent=2, ensure_ascii=False).encode("utf-8")
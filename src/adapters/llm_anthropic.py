@@ -11,6 +11,8 @@ import requests
 from ..ports.llm_port import LLMPort
 from ..config.settings import settings
 from ..config.constants import Constants
+from .http_session import build_http_session
+from .json_codec import dumps_json, loads_json
 
 
 logger = logging.getLogger(__name__)
@@ -23,7 +25,8 @@ class AnthropicLLM(LLMPort):
         self,
         api_key: Optional[str] = None,
         model: Optional[str] = None,
-        timeout: Optional[int] = None
+        timeout: Optional[int] = None,
+        session: Optional[requests.Session] = None
     ):
         """
         Inicializa el cliente Anthropic.
@@ -32,12 +35,22 @@ class AnthropicLLM(LLMPort):
             api_key: API key de Anthropic
             model: Modelo Anthropic
             timeout: Timeout en segundos
+            session: Sesión HTTP reutilizable (si es None, crea una con pool)
         """
         self.api_key = api_key or settings.ANTHROPIC_API_KEY
         self.model = model or settings.ANTHROPIC_MODEL
         self.timeout = timeout or settings.REQUEST_TIMEOUT_SECONDS
         self.base_url = "https://api.anthropic.com/v1/messages"
         self.api_version = "2023-06-01"
+        self.session = session or build_http_session(
+            max_retries=settings.LLM_HTTP_MAX_RETRIES,
+            status_forcelist=(429, 500, 502, 503, 504)
+        )
+        self.session.headers.update({
+            "x-api-key": self.api_key,
+            "anthropic-version": self.api_version,
+            "Content-Type": "application/json"
+        })
 
     def generate_text(
         self,
@@ -67,21 +80,14 @@ class AnthropicLLM(LLMPort):
         if system_prompt:
             payload["system"] = system_prompt
 
-        headers = {
-            "x-api-key": self.api_key,
-            "anthropic-version": self.api_version,
-            "Content-Type": "application/json"
-        }
-
         try:
-            response = requests.post(
+            response = self.session.post(
                 self.base_url,
-                headers=headers,
-                json=payload,
+                data=dumps_json(payload),
                 timeout=self.timeout
             )
             response.raise_for_status()
-            data = response.json()
+            data = loads_json(response.content)
             content_blocks = data.get("content", [])
             if not content_blocks:
                 raise ValueError("Respuesta vacia del LLM")
@@ -103,3 +109,7 @@ class AnthropicLLM(LLMPort):
         except Exception as e:
             logger.error("Error inesperado al llamar a Anthropic: %s", e)
             raise Exception(f"{Constants.ERROR_LLM_FAILED}: {e}") from e
+
+    def close(self) -> None:
+        """Cierra la sesión HTTP y sus conexiones abiertas"""
+        self.session.close()
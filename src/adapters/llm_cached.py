@@ -0,0 +1,79 @@
+"""
+Decorator de LLMPort con cache de respuestas.
+Evita repetir la llamada al proveedor para un mismo prompt.
+"""
+
+import logging
+from typing import Any, Optional
+
+from ..ports.cache_port import CachePort
+from ..ports.llm_port import LLMPort
+from ..config.constants import Constants
+from .cache_key import build_cache_key
+from .cache_memory import MemoryCache
+
+
+logger = logging.getLogger(__name__)
+
+
+class CachedLLM(LLMPort):
+    """Envuelve un LLMPort y reutiliza respuestas ya generadas"""
+
+    def __init__(
+        self,
+        llm: LLMPort,
+        provider: str,
+        cache: Optional[CachePort] = None,
+        ttl_seconds: int = 3600
+    ):
+        """
+        Args:
+            llm: Proveedor LLM real
+            provider: Nombre del proveedor (forma parte de la key)
+            cache: Cache de respuestas (si es None, usa un MemoryCache propio)
+            ttl_seconds: Tiempo de vida de cada respuesta en cache
+        """
+        self._llm = llm
+        self._provider = provider
+        self._model = getattr(llm, "model", "") or ""
+        self._cache = cache if cache is not None else MemoryCache()
+        self._ttl_seconds = ttl_seconds
+
+    def generate_text(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None
+    ) -> str:
+        """
+        Devuelve la respuesta cacheada o delega en el LLM envuelto.
+
+        Args:
+            prompt: Prompt principal para el LLM
+            system_prompt: Prompt de sistema (opcional)
+
+        Returns:
+            Texto generado por el LLM
+        """
+        key = build_cache_key(prompt, self._provider, self._model, system_prompt)
+        cached = self._cache.get(key)
+        if cached is not None:
+            logger.debug("%s: respuesta LLM %s", Constants.LOG_CACHE_HIT, key)
+            return cached
+
+        result = self._llm.generate_text(prompt, system_prompt)
+        self._cache.set(key, result, ttl_seconds=self._ttl_seconds)
+        return result
+
+    def warm_up(self) -> None:
+        """Delegar precalentamiento al LLM envuelto"""
+        self._llm.warm_up()
+
+    def close(self) -> None:
+        """Delegar liberacion de recursos al LLM envuelto"""
+        self._llm.close()
+
+    def __getattr__(self, name: str) -> Any:
+        """Expone el resto de la API del adapter (p.ej. generate_text_stream, model)"""
+        if name == "_llm":
+            raise AttributeError(name)
+        return getattr(self._llm, name)
@@ -1,29 +1,48 @@
 """
 Factory para seleccionar proveedor LLM segun configuracion.
+Usa imports lazy: solo se carga el adapter del proveedor configurado.
 """
 
-from typing import Dict, Type
+from functools import lru_cache
+from importlib import import_module
+from typing import Dict, Tuple, Type
 
 from ..ports.llm_port import LLMPort
 from ..config.settings import settings
-from .llm_ollama import OllamaLLM
-from .llm_openai import OpenAILLM
-from .llm_anthropic import AnthropicLLM
-from .llm_google import GoogleLLM
 
 
-PROVIDERS: Dict[str, Type[LLMPort]] = {
-    "ollama": OllamaLLM,
-    "openai": OpenAILLM,
-    "anthropic": AnthropicLLM,
-    "google": GoogleLLM
+# Registry de modulos y clases de proveedores (lazy loading)
+PROVIDERS: Dict[str, Tuple[str, str]] = {
+    "ollama": (".llm_ollama", "OllamaLLM"),
+    "openai": (".llm_openai", "OpenAILLM"),
+    "anthropic": (".llm_anthropic", "AnthropicLLM"),
+    "google": (".llm_google", "GoogleLLM")
 }
 
 
+@lru_cache(maxsize=None)
+def _load_provider_class(module_name: str, class_name: str) -> Type[LLMPort]:
+    """
+    Importa la clase del proveedor la primera vez que se necesita.
+
+    Args:
+        module_name: Modulo relativo a este paquete
+        class_name: Nombre de la clase del adapter
+
+    Returns:
+        Clase que implementa LLMPort
+    """
+    module = import_module(module_name, package=__package__)
+    return getattr(module, class_name)
+
+
 def create_llm() -> LLMPort:
     """
     Crea el proveedor LLM basado en settings.LLM_PROVIDER.
 
+    Si settings.LLM_CACHE_ENABLED, lo envuelve en CachedLLM para no repetir
+    llamadas con el mismo prompt (en disco si se define LLM_CACHE_DIR).
+
     Returns:
         Instancia de LLMPort
 
@@ -31,7 +50,25 @@ def create_llm() -> LLMPort:
         ValueError: Si el proveedor no esta soportado
     """
     provider = settings.LLM_PROVIDER
-    llm_cls = PROVIDERS.get(provider)
-    if llm_cls is None:
+    spec = PROVIDERS.get(provider)
+    if spec is None:
         raise ValueError(f"Proveedor LLM no soportado: {provider}")
-    return llm_cls()
+    llm = _load_provider_class(*spec)()
+    if not settings.LLM_CACHE_ENABLED:
+        return llm
+
+    from .llm_cached import CachedLLM
+
+    if settings.LLM_CACHE_DIR is not None:
+        from .cache_file import FileCache
+        cache = FileCache(settings.LLM_CACHE_DIR)
+    else:
+        from .cache_memory import MemoryCache
+        cache = MemoryCache(max_entries=settings.LLM_CACHE_MAX_ENTRIES)
+
+    return CachedLLM(
+        llm,
+        provider=provider,
+        cache=cache,
+        ttl_seconds=settings.LLM_CACHE_TTL_SECONDS
+    )
@@ -11,6 +11,8 @@ import requests
 from ..ports.llm_port import LLMPort
 from ..config.settings import settings
 from ..config.constants import Constants
+from .http_session import build_http_session
+from .json_codec import dumps_json, loads_json
 
 
 logger = logging.getLogger(__name__)
@@ -23,7 +25,8 @@ class GoogleLLM(LLMPort):
         self,
         api_key: Optional[str] = None,
         model: Optional[str] = None,
-        timeout: Optional[int] = None
+        timeout: Optional[int] = None,
+        session: Optional[requests.Session] = None
     ):
         """
         Inicializa el cliente Google.
@@ -32,10 +35,16 @@ class GoogleLLM(LLMPort):
             api_key: API key de Google
             model: Modelo Gemini
             timeout: Timeout en segundos
+            session: Sesión HTTP reutilizable (si es None, crea una con pool)
         """
         self.api_key = api_key or settings.GOOGLE_API_KEY
         self.model = model or settings.GOOGLE_MODEL
         self.timeout = timeout or settings.REQUEST_TIMEOUT_SECONDS
+        self.session = session or build_http_session(
+            max_retries=settings.LLM_HTTP_MAX_RETRIES,
+            status_forcelist=(429, 500, 502, 503, 504)
+        )
+        self.session.headers.update({"Content-Type": "application/json"})
 
     def generate_text(
         self,
@@ -73,13 +82,13 @@ class GoogleLLM(LLMPort):
         }
 
         try:
-            response = requests.post(
+            response = self.session.post(
                 url,
-                json=payload,
+                data=dumps_json(payload),
                 timeout=self.timeout
             )
             response.raise_for_status()
-            data = response.json()
+            data = loads_json(response.content)
             candidates = data.get("candidates", [])
             if not candidates:
                 raise ValueError("Respuesta vacia del LLM")
@@ -105,3 +114,7 @@ class GoogleLLM(LLMPort):
         except Exception as e:
             logger.error("Error inesperado al llamar a Google: %s", e)
             raise Exception(f"{Constants.ERROR_LLM_FAILED}: {e}") from e
+
+    def close(self) -> None:
+        """Cierra la sesión HTTP y sus conexiones abiertas"""
+        self.session.close()
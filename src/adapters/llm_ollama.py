@@ -5,17 +5,22 @@ Implementa LLMPort para interactuar con Ollama API local.
 
 import json
 import logging
-from typing import Optional
+from typing import Iterator, Optional
 
 import requests
 
 from ..ports.llm_port import LLMPort
 from ..config.settings import settings
 from ..config.constants import Constants
+from .http_session import build_http_session, iter_stream_lines
+from .json_codec import loads_json
 
 
 logger = logging.getLogger(__name__)
 
+# Tamaño de lectura al consumir la respuesta en streaming
+STREAM_CHUNK_SIZE = 8192
+
 
 class OllamaLLM(LLMPort):
     """Cliente para Ollama API local"""
@@ -24,7 +29,8 @@ class OllamaLLM(LLMPort):
         self,
         base_url: Optional[str] = None,
         model: Optional[str] = None,
-        timeout: Optional[int] = None
+        timeout: Optional[int] = None,
+        session: Optional[requests.Session] = None
     ):
         """
         Inicializa el cliente de Ollama.
@@ -32,12 +38,18 @@ class OllamaLLM(LLMPort):
         Args:
             base_url: URL base de Ollama (si es None, usa settings)
             model: Nombre del modelo (si es None, usa settings)
-            timeout: Timeout en segundos (si es None, usa settings)
+            timeout: Timeout de lectura en segundos (si es None, usa settings)
+            session: Sesión HTTP reutilizable (si es None, crea una con pool)
         """
         self.base_url = base_url or settings.OLLAMA_BASE_URL
         self.model = model or settings.OLLAMA_MODEL
-        self.timeout = timeout or settings.REQUEST_TIMEOUT_SECONDS
+        self.timeout = timeout or settings.OLLAMA_TIMEOUT_READ
+        self.connect_timeout = settings.OLLAMA_TIMEOUT_CONNECT
+        self.max_output_tokens = settings.OLLAMA_MAX_OUTPUT_TOKENS
         self.generate_url = f"{self.base_url}/api/generate"
+        self.session = session or build_http_session(
+            max_retries=settings.OLLAMA_MAX_RETRIES
+        )
 
         if not self.model:
             raise ValueError("OLLAMA_MODEL no configurado")
@@ -63,19 +75,59 @@ class OllamaLLM(LLMPort):
         
         Raises:
             ConnectionError: Si no se puede conectar a Ollama
-            TimeoutError: Si el request excede el timeout
+            TimeoutError: Si el request o la generación completa exceden el timeout
             Exception: Otros errores
         """
         logger.info(f"{Constants.LOG_CALLING_LLM}: modelo={self.model}")
         logger.debug(f"Prompt length: {len(prompt)} caracteres")
+        logger.info(
+            "Tokens de entrada estimados: ~%s",
+            (len(prompt) + len(system_prompt or "")) // 4
+        )
+        
+        generated_text = "".join(self.generate_text_stream(prompt, system_prompt))
+        
+        if not generated_text:
+            logger.warning("Ollama devolvió respuesta vacía")
+            raise Exception(f"{Constants.ERROR_LLM_FAILED}: Respuesta vacía del LLM")
+        
+        logger.info(
+            f"Texto generado exitosamente: {len(generated_text)} caracteres"
+        )
+        
+        return generated_text
+    
+    def generate_text_stream(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None
+    ) -> Iterator[str]:
+        """
+        Genera texto con Ollama en modo streaming.
+        
+        Devuelve los fragmentos a medida que Ollama los produce, para que el
+        consumidor pueda procesarlos sin esperar la respuesta completa.
+        
+        Args:
+            prompt: Prompt principal
+            system_prompt: Prompt de sistema (opcional)
+        
+        Yields:
+            Fragmentos de texto generados
         
+        Raises:
+            ConnectionError: Si no se puede conectar a Ollama
+            TimeoutError: Si el request o la generación completa exceden el timeout
+            Exception: Otros errores
+        """
         # Construir payload para Ollama
         payload = {
             "model": self.model,
             "prompt": prompt,
-            "stream": False,
+            "stream": True,
             "options": {
                 "temperature": 0.7,
+                "num_predict": self.max_output_tokens,
             }
         }
         
@@ -83,29 +135,28 @@ class OllamaLLM(LLMPort):
             payload["system"] = system_prompt
         
         try:
-            # Llamar a Ollama API
-            response = requests.post(
+            # Llamar a Ollama API (una línea JSON por fragmento)
+            with self.session.post(
                 self.generate_url,
                 json=payload,
-                timeout=self.timeout
-            )
-            
-            response.raise_for_status()
-            
-            # Parsear respuesta
-            result = response.json()
-            generated_text = result.get("response", "")
-            
-            if not generated_text:
-                logger.warning("Ollama devolvió respuesta vacía")
-                raise ValueError("Respuesta vacía del LLM")
-            
-            logger.info(
-                f"Texto generado exitosamente: {len(generated_text)} caracteres"
-            )
-            logger.debug(f"Stats: {result.get('eval_count', '?')} tokens evaluados")
-            
-            return generated_text
+                timeout=(self.connect_timeout, self.timeout),
+                stream=True
+            ) as response:
+                response.raise_for_status()
+                
+                # El timeout acota la generación completa, no solo cada lectura
+                for line in iter_stream_lines(response, self.timeout, STREAM_CHUNK_SIZE):
+                    if not line:
+                        continue
+                    chunk = loads_json(line)
+                    if chunk.get("error"):
+                        raise ValueError(chunk["error"])
+                    fragment = chunk.get("response", "")
+                    if fragment:
+                        yield fragment
+                    if chunk.get("done"):
+                        logger.debug(f"Stats: {chunk.get('eval_count', '?')} tokens evaluados")
+                        break
             
         except requests.exceptions.Timeout as e:
             logger.error(f"Timeout al llamar a Ollama: {e}")
@@ -119,6 +170,10 @@ class OllamaLLM(LLMPort):
                 f"No se puede conectar a Ollama en {self.base_url}"
             ) from e
         
+        except requests.exceptions.ChunkedEncodingError as e:
+            logger.error(f"Respuesta de Ollama truncada: {e}")
+            raise Exception(f"{Constants.ERROR_LLM_FAILED}: respuesta incompleta ({e})") from e
+        
         except requests.exceptions.HTTPError as e:
             logger.error(f"Error HTTP de Ollama: {e}")
             raise Exception(f"{Constants.ERROR_LLM_FAILED}: {e}") from e
@@ -126,3 +181,31 @@ class OllamaLLM(LLMPort):
         except Exception as e:
             logger.error(f"Error inesperado al llamar a Ollama: {e}")
             raise Exception(f"{Constants.ERROR_LLM_FAILED}: {e}") from e
+    
+    def warm_up(self) -> None:
+        """
+        Abre la conexión con Ollama y carga el modelo en memoria.
+        
+        Hace un HEAD a la URL base y una generación de 1 token, para que el
+        primer /analyze no pague el handshake ni la carga del modelo.
+        
+        Raises:
+            requests.exceptions.RequestException: Si Ollama no responde
+        """
+        self.session.head(self.base_url, timeout=self.connect_timeout)
+        response = self.session.post(
+            self.generate_url,
+            json={
+                "model": self.model,
+                "prompt": "ping",
+                "stream": False,
+                "options": {"num_predict": 1},
+            },
+            timeout=(self.connect_timeout, self.timeout)
+        )
+        response.raise_for_status()
+        logger.info(f"Modelo precargado en Ollama: {self.model}")
+    
+    def close(self) -> None:
+        """Cierra la sesión HTTP y sus conexiones abiertas"""
+        self.session.close()
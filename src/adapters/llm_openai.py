@@ -4,17 +4,22 @@ Implementa LLMPort para interactuar con OpenAI API.
 """
 
 import logging
-from typing import Optional
+from typing import Dict, Iterator, List, Optional
 
 import requests
 
 from ..ports.llm_port import LLMPort
 from ..config.settings import settings
 from ..config.constants import Constants
+from .http_session import build_http_session, iter_stream_lines
+from .json_codec import dumps_json, loads_json
 
 
 logger = logging.getLogger(__name__)
 
+# Tamaño de lectura al consumir la respuesta en streaming
+STREAM_CHUNK_SIZE = 8192
+
 
 class OpenAILLM(LLMPort):
     """Cliente HTTP para OpenAI Chat Completions"""
@@ -23,7 +28,8 @@ class OpenAILLM(LLMPort):
         self,
         api_key: Optional[str] = None,
         model: Optional[str] = None,
-        timeout: Optional[int] = None
+        timeout: Optional[int] = None,
+        session: Optional[requests.Session] = None
     ):
         """
         Inicializa el cliente OpenAI.
@@ -32,11 +38,20 @@ class OpenAILLM(LLMPort):
             api_key: API key de OpenAI
             model: Modelo OpenAI
             timeout: Timeout en segundos
+            session: Sesión HTTP reutilizable (si es None, crea una con pool)
         """
         self.api_key = api_key or settings.OPENAI_API_KEY
         self.model = model or settings.OPENAI_MODEL
         self.timeout = timeout or settings.REQUEST_TIMEOUT_SECONDS
         self.base_url = "https://api.openai.com/v1/chat/completions"
+        self.session = session or build_http_session(
+            max_retries=settings.LLM_HTTP_MAX_RETRIES,
+            status_forcelist=(429, 500, 502, 503, 504)
+        )
+        self.session.headers.update({
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json"
+        })
 
     def generate_text(
         self,
@@ -53,41 +68,69 @@ class OpenAILLM(LLMPort):
         Returns:
             Texto generado
         """
+        content = "".join(self.generate_text_stream(prompt, system_prompt))
+        if not content:
+            logger.error("Error inesperado al llamar a OpenAI: Respuesta vacia del LLM")
+            raise Exception(f"{Constants.ERROR_LLM_FAILED}: Respuesta vacia del LLM")
+        return content
+
+    def generate_text_stream(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None
+    ) -> Iterator[str]:
+        """
+        Genera texto con OpenAI en modo streaming (server-sent events).
+
+        Devuelve los fragmentos a medida que llegan, sin esperar a que la
+        respuesta completa esté generada.
+
+        Args:
+            prompt: Prompt principal
+            system_prompt: Prompt de sistema (opcional)
+
+        Yields:
+            Fragmentos de texto generados
+
+        Raises:
+            ConnectionError: Si no se puede conectar a OpenAI
+            TimeoutError: Si el request o la generación completa exceden el timeout
+            Exception: Otros errores
+        """
         if not self.api_key:
             raise ValueError("OPENAI_API_KEY no configurada")
 
-        messages = []
-        if system_prompt:
-            messages.append({"role": "system", "content": system_prompt})
-        messages.append({"role": "user", "content": prompt})
-
         payload = {
             "model": self.model,
-            "messages": messages,
-            "temperature": 0.7
-        }
-
-        headers = {
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json"
+            "messages": self._build_messages(prompt, system_prompt),
+            "temperature": 0.7,
+            "stream": True
         }
 
         try:
-            response = requests.post(
+            with self.session.post(
                 self.base_url,
-                headers=headers,
-                json=payload,
-                timeout=self.timeout
-            )
-            response.raise_for_status()
-            data = response.json()
-            choices = data.get("choices", [])
-            if not choices:
-                raise ValueError("Respuesta vacia del LLM")
-            content = choices[0].get("message", {}).get("content", "")
-            if not content:
-                raise ValueError("Respuesta vacia del LLM")
-            return content
+                data=dumps_json(payload),
+                timeout=self.timeout,
+                stream=True
+            ) as response:
+                response.raise_for_status()
+
+                # Cada evento llega como una línea "data: {json}"; el último es "data: [DONE]".
+                # El timeout acota la generación completa, no solo cada lectura
+                for line in iter_stream_lines(response, self.timeout, STREAM_CHUNK_SIZE):
+                    if not line.startswith(b"data:"):
+                        continue
+                    data = line[5:].strip()
+                    if data == b"[DONE]":
+                        break
+                    chunk = loads_json(data)
+                    if chunk.get("error"):
+                        raise ValueError(chunk["error"])
+                    for choice in chunk.get("choices", ()):
+                        fragment = (choice.get("delta") or {}).get("content")
+                        if fragment:
+                            yield fragment
         except requests.exceptions.Timeout as e:
             logger.error("Timeout al llamar a OpenAI: %s", e)
             raise TimeoutError(
@@ -96,9 +139,42 @@ class OpenAILLM(LLMPort):
         except requests.exceptions.ConnectionError as e:
             logger.error("Error de conexion con OpenAI: %s", e)
             raise ConnectionError("No se puede conectar a OpenAI") from e
+        except requests.exceptions.ChunkedEncodingError as e:
+            logger.error("Respuesta de OpenAI truncada: %s", e)
+            raise Exception(f"{Constants.ERROR_LLM_FAILED}: respuesta incompleta ({e})") from e
         except requests.exceptions.HTTPError as e:
             logger.error("Error HTTP de OpenAI: %s", e)
             raise Exception(f"{Constants.ERROR_LLM_FAILED}: {e}") from e
         except Exception as e:
             logger.error("Error inesperado al llamar a OpenAI: %s", e)
             raise Exception(f"{Constants.ERROR_LLM_FAILED}: {e}") from e
+
+    def _build_messages(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None
+    ) -> List[Dict[str, str]]:
+        """
+        Arma los mensajes con el contenido estático primero.
+
+        El prompt caching de OpenAI solo reutiliza un prefijo idéntico byte a
+        byte: el system prompt (fijo) va antes que el prompt del usuario, y
+        este debe dejar lo que cambia por request al final
+        (ver Constants.LLM_USER_PROMPT_TEMPLATE).
+
+        Args:
+            prompt: Prompt principal (parte dinámica al final)
+            system_prompt: Prompt de sistema estático (opcional)
+
+        Returns:
+            Lista de mensajes para Chat Completions
+        """
+        messages = []
+        if system_prompt:
+            messages.append({"role": "system", "content": system_prompt})
+        messages.append({"role": "user", "content": prompt})
+        return messages
+
+    def close(self) -> None:
+        """Cierra la sesión HTTP y sus conexiones abiertas"""
+        self.session.close()
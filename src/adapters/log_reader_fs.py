@@ -4,6 +4,7 @@ Implementa LogReaderPort para leer archivos locales.
 """
 
 import logging
+import os
 from pathlib import Path
 from typing import List, Dict, Optional
 
@@ -14,6 +15,23 @@ from ..config.constants import Constants
 logger = logging.getLogger(__name__)
 
 
+def _advise_sequential(f) -> None:
+    """
+    Avisa al kernel que el archivo se leerá secuencialmente (si la plataforma lo soporta).
+
+    Con POSIX_FADV_SEQUENTIAL Linux duplica la ventana de readahead, así las
+    lecturas por bloques encuentran los datos ya en page cache.
+
+    Args:
+        f: Archivo abierto
+    """
+    if hasattr(os, "posix_fadvise"):
+        try:
+            os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        except OSError:
+            pass
+
+
 class FileSystemLogReader(LogReaderPort):
     """Lee logs desde archivos del sistema de archivos local"""
     
@@ -32,27 +50,51 @@ class FileSystemLogReader(LogReaderPort):
             IOError: Si hay error de lectura
         """
         path = Path(source)
+        logger.debug("Leyendo archivo: %s", source)
         
-        if not path.exists():
-            logger.error(f"{Constants.ERROR_FILE_NOT_FOUND}: {source}")
-            raise FileNotFoundError(f"Archivo no encontrado: {source}")
+        # Abrir directamente (sin exists/is_file previos) y traducir errores
+        try:
+            # read() y no mmap: un log truncado mientras está mapeado
+            # (rotación) mata el proceso con SIGBUS
+            with open(path, 'rb') as f:
+                _advise_sequential(f)
+                content = self._decode(f.read())
         
-        if not path.is_file():
-            logger.error(f"La ruta no es un archivo: {source}")
-            raise ValueError(f"La ruta no es un archivo: {source}")
+        except FileNotFoundError as e:
+            logger.error("%s: %s", Constants.ERROR_FILE_NOT_FOUND, source)
+            raise FileNotFoundError(f"Archivo no encontrado: {source}") from e
         
-        logger.debug(f"Leyendo archivo: {source}")
+        except (IsADirectoryError, PermissionError) as e:
+            if path.is_dir():
+                logger.error("La ruta no es un archivo: %s", source)
+                raise ValueError(f"La ruta no es un archivo: {source}") from e
+            logger.error("Error al leer archivo %s: %s", source, e)
+            raise IOError(f"Error al leer archivo: {e}") from e
         
-        try:
-            with open(path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            logger.debug(f"Archivo leído: {len(content)} caracteres")
-            return content
-            
         except Exception as e:
-            logger.error(f"Error al leer archivo {source}: {e}")
+            logger.error("Error al leer archivo %s: %s", source, e)
             raise IOError(f"Error al leer archivo: {e}") from e
+        
+        logger.debug("Archivo leído: %s caracteres", len(content))
+        return content
+
+    @staticmethod
+    def _decode(data: bytes) -> str:
+        """
+        Decodifica el contenido leído en binario.
+
+        Los saltos de línea se normalizan a \\n igual que al leer en modo texto.
+
+        Args:
+            data: Contenido del archivo
+
+        Returns:
+            Contenido decodificado como UTF-8
+        """
+        content = str(data, 'utf-8')
+        if '\r' in content:
+            content = content.replace('\r\n', '\n').replace('\r', '\n')
+        return content
 
     def list_logs(self, directory: str) -> List[Dict[str, Optional[int]]]:
         """
@@ -68,31 +110,35 @@ class FileSystemLogReader(LogReaderPort):
             FileNotFoundError: Si el directorio no existe
             IOError: Si hay error de lectura del directorio
         """
-        dir_path = Path(directory)
+        base_dir = str(Path(directory).absolute())
+        logger.debug("Listando archivos en: %s", directory)
         
-        if not dir_path.exists():
-            logger.error(f"{Constants.ERROR_FILE_NOT_FOUND}: {directory}")
+        # scandir devuelve el tipo de cada entrada junto con el nombre:
+        # solo se hace stat de los .txt (para el tamaño), no de todo el directorio
+        try:
+            entries = os.scandir(base_dir)
+        except FileNotFoundError:
+            logger.error("%s: %s", Constants.ERROR_FILE_NOT_FOUND, directory)
             raise FileNotFoundError(f"Directorio no encontrado: {directory}")
-        
-        if not dir_path.is_dir():
-            logger.error(f"La ruta no es un directorio: {directory}")
+        except NotADirectoryError:
+            logger.error("La ruta no es un directorio: %s", directory)
             raise ValueError(f"La ruta no es un directorio: {directory}")
         
-        logger.debug(f"Listando archivos en: {directory}")
-        
         try:
             logs = []
-            for file_path in sorted(dir_path.glob("*.txt")):
-                if file_path.is_file():
-                    logs.append({
-                        "name": file_path.name,
-                        "path": str(file_path.absolute()),
-                        "size_bytes": file_path.stat().st_size
-                    })
+            with entries:
+                for entry in entries:
+                    if entry.name.endswith(".txt") and entry.is_file():
+                        logs.append({
+                            "name": entry.name,
+                            "path": os.path.join(base_dir, entry.name),
+                            "size_bytes": entry.stat().st_size
+                        })
+            logs.sort(key=lambda log: log["name"])
             
-            logger.debug(f"Se encontraron {len(logs)} archivos de log")
+            logger.debug("Se encontraron %s archivos de log", len(logs))
             return logs
             
         except Exception as e:
-            logger.error(f"Error al listar archivos en {directory}: {e}")
+            logger.error("Error al listar archivos en %s: %s", directory, e)
             raise IOError(f"Error al listar directorio: {e}") from e
@@ -0,0 +1,76 @@
+"""
+Rate limiter in-memory por cliente (ventana deslizante).
+"""
+
+import threading
+import time
+from collections import deque
+from typing import Deque, Dict
+
+
+class SlidingWindowRateLimiter:
+    """Permite hasta `limit` requests por cliente dentro de `window_seconds`"""
+
+    def __init__(self, limit: int, window_seconds: float = 60.0):
+        """
+        Args:
+            limit: Requests permitidos por ventana (0 = sin limite)
+            window_seconds: Duracion de la ventana en segundos
+        """
+        self.limit = limit
+        self.window_seconds = window_seconds
+        self._hits: Dict[str, Deque[float]] = {}
+        self._lock = threading.Lock()
+        self._next_sweep = 0.0
+
+    def allow(self, key: str) -> bool:
+        """
+        Registra un request del cliente si todavia tiene cupo.
+
+        Args:
+            key: Identificador del cliente (p.ej. IP remota)
+
+        Returns:
+            True si el request esta permitido, False si excede el limite
+        """
+        if self.limit <= 0:
+            return True
+
+        now = time.monotonic()
+        with self._lock:
+            if now >= self._next_sweep:
+                self._sweep(now)
+            hits = self._hits.get(key)
+            if hits is None:
+                hits = self._hits[key] = deque()
+            while hits and now - hits[0] >= self.window_seconds:
+                hits.popleft()
+            if len(hits) >= self.limit:
+                return False
+            hits.append(now)
+            return True
+
+    def reset(self) -> None:
+        """Olvida todos los requests registrados"""
+        with self._lock:
+            self._hits.clear()
+            self._next_sweep = 0.0
+
+    def _sweep(self, now: float) -> None:
+        """
+        Elimina los clientes sin requests dentro de la ventana.
+
+        Se ejecuta como mucho una vez por ventana, así la memoria queda acotada
+        por los clientes activos y no por todos los que alguna vez llamaron.
+        Debe llamarse con el lock tomado.
+
+        Args:
+            now: Instante actual (time.monotonic)
+        """
+        stale = [
+            key for key, hits in self._hits.items()
+            if not hits or now - hits[-1] >= self.window_seconds
+        ]
+        for key in stale:
+            del self._hits[key]
+        self._next_sweep = now + self.window_seconds
@@ -0,0 +1,116 @@
+"""
+Exporter de reportes en formato Apache Arrow (Feather v2).
+Pensado para consumidores programáticos (dashboards, notebooks): el archivo
+se carga sin parsear XML ni texto, a diferencia de Excel o CSV.
+Requiere pyarrow (opcional: el factory informa si falta).
+"""
+
+import logging
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Tuple
+
+import pyarrow as pa
+from pyarrow import feather
+
+from ..ports.report_exporter_port import ReportExporterPort
+
+
+logger = logging.getLogger(__name__)
+
+# Compresión de los archivos Feather
+FEATHER_COMPRESSION = "zstd"
+FEATHER_COMPRESSION_LEVEL = 3
+
+# Columnas de la tabla de errores: (nombre, clave en el análisis, valor por defecto)
+ERROR_COLUMNS = (
+    ("exception", "exception", "Unknown"),
+    ("count", "count", 0),
+    ("logger", "logger", "Unknown"),
+    ("first_ts", "first_ts", "N/A"),
+    ("last_ts", "last_ts", "N/A"),
+)
+
+
+class ArrowExporter(ReportExporterPort):
+    """Exporta el análisis como tablas Arrow en archivos Feather"""
+
+    def export(
+        self,
+        output_dir: str,
+        output_filename: str,
+        report_content: str,
+        analysis: Optional[Dict] = None
+    ) -> str:
+        """
+        Exporta el análisis en formato Feather (.arrow).
+        Un archivo Feather guarda una sola tabla: se exportan los grupos de
+        errores, con el resumen en la metadata del schema.
+
+        Args:
+            output_dir: Directorio de salida
+            output_filename: Nombre del archivo (sin extensión)
+            report_content: Contenido del reporte (no usado, Arrow usa analysis)
+            analysis: Análisis estructurado (requerido)
+
+        Returns:
+            Path absoluto del archivo generado
+
+        Raises:
+            IOError: Si hay error de escritura
+            ValueError: Si no hay analysis disponible
+        """
+        if analysis is None:
+            raise ValueError("Análisis estructurado requerido para exportar a Arrow")
+
+        output_path = Path(output_dir)
+        output_path.mkdir(parents=True, exist_ok=True)
+
+        file_path = output_path / f"{output_filename}.arrow"
+
+        logger.debug("Exportando reporte Arrow a %s", file_path)
+
+        try:
+            errors = self._table(analysis.get("error_groups", ()), ERROR_COLUMNS)
+            errors = errors.replace_schema_metadata({
+                f"summary.{key}": str(value)
+                for key, value in analysis.get("summary", {}).items()
+            })
+            self._write(errors, file_path)
+
+            logger.info("Reporte Arrow exportado: %s", file_path)
+            return str(file_path.absolute())
+
+        except Exception as e:
+            logger.error("Error al exportar reporte Arrow: %s", e)
+            raise IOError(f"Error al escribir archivo Arrow: {e}") from e
+
+    @staticmethod
+    def _table(records: Iterable[Dict], columns: Tuple[Tuple[str, str, object], ...]) -> "pa.Table":
+        """
+        Arma una tabla columnar a partir de los dicts del análisis.
+
+        Las columnas se fijan de antemano (en vez de Table.from_pylist) para
+        que el schema no dependa de qué claves trae el primer registro.
+
+        Args:
+            records: Grupos de errores
+            columns: Columnas (nombre, clave, valor por defecto)
+
+        Returns:
+            Tabla con una columna por entrada de columns
+        """
+        data = {name: [] for name, _, _ in columns}
+        for record in records:
+            for name, key, default in columns:
+                data[name].append(record.get(key, default))
+        return pa.table(data)
+
+    @staticmethod
+    def _write(table: "pa.Table", path: Path) -> None:
+        """Escribe una tabla en formato Feather v2 comprimido"""
+        feather.write_feather(
+            table,
+            str(path),
+            compression=FEATHER_COMPRESSION,
+            compression_level=FEATHER_COMPRESSION_LEVEL
+        )
@@ -4,18 +4,62 @@ Genera documentos Word con formato profesional.
 """
 
 import logging
+import re
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 
 from docx import Document
 from docx.shared import Inches, Pt, RGBColor
+from docx.enum.style import WD_STYLE_TYPE
 from docx.enum.text import WD_ALIGN_PARAGRAPH
 
 from ..ports.report_exporter_port import ReportExporterPort
+from ..config.constants import Constants
+from .export_rows import error_rows, warning_rows
 
 
 logger = logging.getLogger(__name__)
 
+# Encabezado (#, ##, ###) o item de lista (- / *) de una línea ya recortada
+MD_LINE_RE = re.compile(r"(?P<hashes>#{1,3}) (?P<heading>.*)|[-*] (?P<item>.*)")
+
+# Marcas de énfasis que se quitan del texto (negrita y código inline)
+MD_EMPHASIS_RE = re.compile(r"\*\*|__|`")
+
+# Style id de cada estilo de párrafo usado. Todos los documentos salen de la
+# misma plantilla por defecto, así que se resuelve una vez por proceso.
+_PARAGRAPH_STYLE_IDS: Dict[str, Optional[str]] = {}
+
+
+def _add_styled_paragraph(document: Document, text: str, style_name: str):
+    """
+    Agrega un párrafo con estilo escribiendo el w:pStyle directamente.
+
+    python-docx resuelve el nombre del estilo recorriendo todos los estilos
+    del documento en cada add_paragraph/add_heading; aquí se resuelve una vez.
+
+    Args:
+        document: Documento destino
+        text: Texto del párrafo
+        style_name: Nombre del estilo (p.ej. 'Heading 1', 'List Bullet')
+
+    Returns:
+        Párrafo agregado
+    """
+    style_id = _PARAGRAPH_STYLE_IDS.get(style_name)
+    if style_name not in _PARAGRAPH_STYLE_IDS:
+        style_id = document.part.get_style_id(style_name, WD_STYLE_TYPE.PARAGRAPH)
+        _PARAGRAPH_STYLE_IDS[style_name] = style_id
+
+    paragraph = document.add_paragraph(text)
+    paragraph._p.style = style_id
+    return paragraph
+
+
+def _add_heading(document: Document, text: str, level: int):
+    """Equivalente a document.add_heading con el estilo ya resuelto"""
+    return _add_styled_paragraph(document, text, "Title" if level == 0 else f"Heading {level}")
+
 
 class DocExporter(ReportExporterPort):
     """Exporta reportes en formato DOCX (Microsoft Word)"""
@@ -49,7 +93,7 @@ class DocExporter(ReportExporterPort):
         filename = f"{output_filename}.docx"
         file_path = output_path / filename
         
-        logger.debug(f"Exportando reporte DOCX a {file_path}")
+        logger.debug("Exportando reporte DOCX a %s", file_path)
         
         try:
             document = Document()
@@ -58,7 +102,7 @@ class DocExporter(ReportExporterPort):
             self._setup_document_style(document)
             
             # Título principal
-            title = document.add_heading('Reporte de Análisis de Logs', 0)
+            title = _add_heading(document, 'Reporte de Análisis de Logs', 0)
             title.alignment = WD_ALIGN_PARAGRAPH.CENTER
             
             # Separador
@@ -88,11 +132,11 @@ class DocExporter(ReportExporterPort):
             # Guardar documento
             document.save(str(file_path))
             
-            logger.info(f"Reporte DOCX exportado: {file_path}")
+            logger.info("Reporte DOCX exportado: %s", file_path)
             return str(file_path.absolute())
         
         except Exception as e:
-            logger.error(f"Error al exportar reporte DOCX: {e}")
+            logger.error("Error al exportar reporte DOCX: %s", e)
             raise IOError(f"Error al escribir archivo DOCX: {e}") from e
     
     def _setup_document_style(self, document: Document):
@@ -103,7 +147,7 @@ class DocExporter(ReportExporterPort):
     
     def _add_summary_section(self, document: Document, summary: Dict):
         """Agrega sección de resumen ejecutivo"""
-        document.add_heading('Resumen Ejecutivo', level=1)
+        _add_heading(document, 'Resumen Ejecutivo', 1)
         
         # Crear tabla para el resumen
         table = document.add_table(rows=1, cols=2)
@@ -124,50 +168,53 @@ class DocExporter(ReportExporterPort):
         document.add_paragraph()
     
     def _add_report_content(self, document: Document, content: str):
-        """Agrega el contenido principal del reporte"""
-        document.add_heading('Análisis Detallado', level=1)
+        """
+        Agrega el contenido principal del reporte.
         
-        # Convertir markdown básico a párrafos
-        lines = content.split('\n')
-        current_list = None
+        Las líneas de texto consecutivas (sin línea en blanco entre ellas)
+        forman un único párrafo, como en Markdown; los reportes más largos que
+        Constants.MAX_REPORT_CHARS_IN_DOC se recortan con una nota final.
+        """
+        _add_heading(document, 'Análisis Detallado', 1)
+        
+        if len(content) > Constants.MAX_REPORT_CHARS_IN_DOC:
+            content = content[:Constants.MAX_REPORT_CHARS_IN_DOC] + '\n\n... (truncado)'
+        
+        # Líneas del párrafo en curso (se vuelcan al cambiar de bloque)
+        pending: List[str] = []
         
-        for line in lines:
+        def flush_paragraph():
+            if pending:
+                document.add_paragraph('\n'.join(pending))
+                pending.clear()
+        
+        # Convertir markdown básico a párrafos: un match por línea decide el tipo
+        for line in content.split('\n'):
             line = line.strip()
-            
             if not line:
-                current_list = None
+                flush_paragraph()
                 continue
             
-            # Encabezados
-            if line.startswith('# '):
-                document.add_heading(line[2:], level=1)
-                current_list = None
-            elif line.startswith('## '):
-                document.add_heading(line[3:], level=2)
-                current_list = None
-            elif line.startswith('### '):
-                document.add_heading(line[4:], level=3)
-                current_list = None
-            
-            # Listas
-            elif line.startswith('- ') or line.startswith('* '):
-                text = line[2:]
-                # Remover formato markdown básico
-                text = text.replace('**', '').replace('__', '').replace('`', '')
-                document.add_paragraph(text, style='List Bullet')
-                current_list = True
+            match = MD_LINE_RE.match(line)
+            if match is None:
+                # Texto normal (sin formato markdown básico)
+                text = MD_EMPHASIS_RE.sub('', line)
+                if text:
+                    pending.append(text)
+                continue
             
-            # Párrafo normal
+            flush_paragraph()
+            if match.lastgroup == 'heading':
+                _add_heading(document, match.group('heading'), len(match.group('hashes')))
             else:
-                # Remover formato markdown básico
-                text = line.replace('**', '').replace('__', '').replace('`', '')
-                if text:
-                    p = document.add_paragraph(text)
-                    current_list = None
+                text = MD_EMPHASIS_RE.sub('', match.group('item'))
+                _add_styled_paragraph(document, text, 'List Bullet')
+        
+        flush_paragraph()
     
     def _add_errors_section(self, document: Document, error_groups: list):
         """Agrega sección de errores detallados"""
-        document.add_heading('Detalle de Errores', level=1)
+        _add_heading(document, 'Detalle de Errores', 1)
         
         if not error_groups:
             document.add_paragraph('No se encontraron errores.')
@@ -184,34 +231,30 @@ class DocExporter(ReportExporterPort):
         hdr_cells[2].text = 'Componente'
         hdr_cells[3].text = 'Primera Aparición'
         
-        # Datos (limitar a 20 errores)
-        for error_group in error_groups[:20]:
-            row_cells = table.add_row().cells
-            row_cells[0].text = error_group.get('exception', 'Unknown')
-            row_cells[1].text = str(error_group.get('count', 0))
-            row_cells[2].text = error_group.get('logger', 'Unknown')
-            row_cells[3].text = error_group.get('first_ts', 'N/A')
+        # Datos (limitar a 20 errores), aplanados antes de tocar la tabla
+        for error in error_rows(error_groups[:20]):
+            cells = table.add_row().cells
+            cells[0].text = error.exception
+            cells[1].text = str(error.count)
+            cells[2].text = error.logger
+            cells[3].text = error.first_ts
         
         document.add_paragraph()
     
     def _add_warnings_section(self, document: Document, warnings: list):
         """Agrega sección de advertencias"""
-        document.add_heading('Advertencias', level=1)
+        _add_heading(document, 'Advertencias', 1)
         
         if not warnings:
             document.add_paragraph('No se encontraron advertencias.')
             return
         
-        # Limitar a 10 warnings
-        for warning in warnings[:10]:
-            timestamp = warning.get('timestamp', 'N/A')
-            component = warning.get('logger', 'Unknown')
-            message = warning.get('message', '')
-            
+        # Limitar a 10 warnings, aplanados antes de generar los párrafos
+        for warning in warning_rows(warnings[:10]):
             p = document.add_paragraph()
-            p.add_run(f'[{timestamp}] ').bold = True
-            p.add_run(f'{component}: ')
-            p.add_run(message)
+            p.add_run(f'[{warning.timestamp}] ').bold = True
+            p.add_run(f'{warning.logger}: ')
+            p.add_run(warning.message)
         
         if len(warnings) > 10:
             document.add_paragraph(
@@ -1,20 +1,43 @@
 """
 Exporter de reportes en formato Excel (.xlsx).
 Genera hojas de cálculo con tablas estructuradas y formato profesional.
+Usa xlsxwriter si está instalado (escritura en streaming, más rápida); si no, openpyxl.
 """
 
 import logging
+from itertools import islice
 from pathlib import Path
-from typing import Dict, Optional
-
-from openpyxl import Workbook
-from openpyxl.styles import Font, Border, Side, Alignment, PatternFill
+from typing import Dict, Iterator, Optional, Tuple
 
 from ..ports.report_exporter_port import ReportExporterPort
 
 
 logger = logging.getLogger(__name__)
 
+# Nombres de los estilos registrados en cada workbook exportado
+HEADER_STYLE = "header"
+HEADER_CENTER_STYLE = "header_center"
+BODY_STYLE = "body"
+BODY_CENTER_STYLE = "body_center"
+
+# Encabezados y anchos de columna de cada hoja
+SUMMARY_HEADERS = ("Métrica", "Valor")
+SUMMARY_WIDTHS = (25, 15)
+ERROR_HEADERS = ("Tipo de Error", "Ocurrencias", "Componente", "Ubicación", "Primera Vez", "Última Vez")
+ERROR_WIDTHS = (35, 12, 30, 35, 20, 20)
+WARNING_HEADERS = ("Timestamp", "Componente", "Mensaje")
+WARNING_WIDTHS = (20, 30, 60)
+
+# Máximo de warnings exportados
+MAX_WARNINGS = 50
+
+# Formatos xlsxwriter equivalentes a los estilos de openpyxl
+HEADER_FORMAT = {
+    "bold": True, "font_color": "#FFFFFF", "font_size": 11,
+    "bg_color": "#4472C4", "pattern": 1, "border": 1
+}
+CENTER_FORMAT = {"align": "center", "valign": "vcenter"}
+
 
 class ExcelExporter(ReportExporterPort):
     """Exporta reportes en formato Excel con formato profesional"""
@@ -52,197 +75,199 @@ class ExcelExporter(ReportExporterPort):
         filename = f"{output_filename}.xlsx"
         file_path = output_path / filename
         
-        logger.debug(f"Exportando reporte Excel a {file_path}")
+        logger.debug("Exportando reporte Excel a %s", file_path)
         
         try:
-            workbook = Workbook()
-            
-            # Remover hoja por defecto
-            if 'Sheet' in workbook.sheetnames:
-                workbook.remove(workbook['Sheet'])
+            xlsxwriter = _import_xlsxwriter()
+            if xlsxwriter is not None:
+                self._export_xlsxwriter(xlsxwriter, file_path, analysis)
+            else:
+                self._export_openpyxl(file_path, analysis)
             
-            # Estilos
-            header_font = Font(bold=True, color="FFFFFF", size=11)
-            header_fill = PatternFill(start_color="4472C4", end_color="4472C4", fill_type="solid")
-            thin_border = Border(
-                left=Side(style="thin"),
-                right=Side(style="thin"),
-                top=Side(style="thin"),
-                bottom=Side(style="thin")
-            )
-            center_alignment = Alignment(horizontal="center", vertical="center")
+            logger.info("Reporte Excel exportado: %s", file_path)
+            return str(file_path.absolute())
+        
+        except Exception as e:
+            logger.error("Error al exportar reporte Excel: %s", e)
+            raise IOError(f"Error al escribir archivo Excel: {e}") from e
+    
+    def _export_xlsxwriter(self, xlsxwriter, file_path: Path, analysis: Dict):
+        """
+        Escribe el workbook con xlsxwriter.
+        
+        constant_memory vuelca cada fila a disco al pasar a la siguiente,
+        así la memoria no crece con la cantidad de errores. strings_to_urls
+        se desactiva para que los mensajes que empiezan con una URL se
+        escriban como texto, igual que con openpyxl.
+        """
+        workbook = xlsxwriter.Workbook(
+            str(file_path),
+            {"constant_memory": True, "strings_to_urls": False}
+        )
+        try:
+            header = workbook.add_format(HEADER_FORMAT)
+            header_center = workbook.add_format({**HEADER_FORMAT, **CENTER_FORMAT})
+            body = workbook.add_format({"border": 1})
+            body_center = workbook.add_format({"border": 1, **CENTER_FORMAT})
             
-            # Crear hojas
-            self._create_summary_sheet(
-                workbook, 
-                analysis, 
-                header_font, 
-                header_fill, 
-                thin_border,
-                center_alignment
+            sheet = self._add_xlsxwriter_sheet(
+                workbook, "Resumen", SUMMARY_HEADERS, SUMMARY_WIDTHS, header_center
             )
+            for row, (label, value) in enumerate(self._summary_rows(analysis), start=1):
+                sheet.write(row, 0, label, body)
+                sheet.write(row, 1, value, body_center)
             
-            self._create_errors_sheet(
-                workbook, 
-                analysis, 
-                header_font, 
-                header_fill, 
-                thin_border
+            sheet = self._add_xlsxwriter_sheet(
+                workbook, "Errores", ERROR_HEADERS, ERROR_WIDTHS, header
             )
+            for row, values in enumerate(self._error_rows(analysis), start=1):
+                sheet.write_row(row, 0, values, body)
             
-            self._create_warnings_sheet(
-                workbook, 
-                analysis, 
-                header_font, 
-                header_fill, 
-                thin_border
+            sheet = self._add_xlsxwriter_sheet(
+                workbook, "Advertencias", WARNING_HEADERS, WARNING_WIDTHS, header
             )
-            
-            # Guardar archivo
-            workbook.save(file_path)
-            
-            logger.info(f"Reporte Excel exportado: {file_path}")
-            return str(file_path.absolute())
+            for row, values in enumerate(self._warning_rows(analysis), start=1):
+                sheet.write_row(row, 0, values, body)
+        finally:
+            workbook.close()
+    
+    @staticmethod
+    def _add_xlsxwriter_sheet(workbook, title: str, headers: Tuple, widths: Tuple, header_format):
+        """Crea una hoja xlsxwriter con anchos de columna y fila de encabezados"""
+        sheet = workbook.add_worksheet(title)
+        for col, width in enumerate(widths):
+            sheet.set_column(col, col, width)
+        sheet.write_row(0, 0, headers, header_format)
+        return sheet
+    
+    def _export_openpyxl(self, file_path: Path, analysis: Dict):
+        """Escribe el workbook con openpyxl en modo write_only"""
+        from openpyxl import Workbook
+        from openpyxl.cell import WriteOnlyCell
         
-        except Exception as e:
-            logger.error(f"Error al exportar reporte Excel: {e}")
-            raise IOError(f"Error al escribir archivo Excel: {e}") from e
+        def cell(sheet, value, style: str) -> WriteOnlyCell:
+            # Celda con un estilo con nombre ya registrado en el workbook
+            new_cell = WriteOnlyCell(sheet, value=value)
+            new_cell.style = style
+            return new_cell
+        
+        # write_only: las filas se serializan al agregarlas, sin mantener
+        # cada celda en memoria (tampoco crea la hoja por defecto)
+        workbook = Workbook(write_only=True)
+        
+        # Estilos con nombre: cada celda referencia uno ya registrado
+        # en lugar de resolver fuente/relleno/borde por separado
+        self._register_styles(workbook)
+        
+        sheet = self._add_openpyxl_sheet(
+            workbook, cell, "Resumen", SUMMARY_HEADERS, SUMMARY_WIDTHS, HEADER_CENTER_STYLE
+        )
+        for label, value in self._summary_rows(analysis):
+            sheet.append([
+                cell(sheet, label, BODY_STYLE),
+                cell(sheet, value, BODY_CENTER_STYLE)
+            ])
+        
+        sheet = self._add_openpyxl_sheet(
+            workbook, cell, "Errores", ERROR_HEADERS, ERROR_WIDTHS, HEADER_STYLE
+        )
+        for values in self._error_rows(analysis):
+            sheet.append([cell(sheet, value, BODY_STYLE) for value in values])
+        
+        sheet = self._add_openpyxl_sheet(
+            workbook, cell, "Advertencias", WARNING_HEADERS, WARNING_WIDTHS, HEADER_STYLE
+        )
+        for values in self._warning_rows(analysis):
+            sheet.append([cell(sheet, value, BODY_STYLE) for value in values])
+        
+        workbook.save(file_path)
     
-    def _create_summary_sheet(
-        self,
-        workbook: Workbook,
-        analysis: Dict,
-        header_font: Font,
-        header_fill: PatternFill,
-        border: Border,
-        alignment: Alignment
-    ):
-        """Crea hoja de resumen"""
-        sheet = workbook.create_sheet("Resumen", 0)
-        
-        # Encabezados
-        sheet['A1'] = "Métrica"
-        sheet['B1'] = "Valor"
-        
-        sheet['A1'].font = header_font
-        sheet['A1'].fill = header_fill
-        sheet['A1'].border = border
-        sheet['A1'].alignment = alignment
-        
-        sheet['B1'].font = header_font
-        sheet['B1'].fill = header_fill
-        sheet['B1'].border = border
-        sheet['B1'].alignment = alignment
-        
-        # Datos del resumen
-        if "summary" in analysis:
-            row = 2
-            for key, value in analysis["summary"].items():
-                label = key.replace('_', ' ').title()
-                sheet[f'A{row}'] = label
-                sheet[f'B{row}'] = value
-                sheet[f'A{row}'].border = border
-                sheet[f'B{row}'].border = border
-                sheet[f'B{row}'].alignment = alignment
-                row += 1
-        
-        # Autoajustar ancho de columnas
-        sheet.column_dimensions['A'].width = 25
-        sheet.column_dimensions['B'].width = 15
+    @staticmethod
+    def _add_openpyxl_sheet(workbook, cell, title: str, headers: Tuple, widths: Tuple, header_style: str):
+        """Crea una hoja write_only con anchos de columna y fila de encabezados"""
+        from openpyxl.utils import get_column_letter
+        
+        sheet = workbook.create_sheet(title)
+        
+        # En write_only los anchos deben fijarse antes de la primera fila
+        for col, width in enumerate(widths):
+            sheet.column_dimensions[get_column_letter(col + 1)].width = width
+        
+        sheet.append([cell(sheet, header, header_style) for header in headers])
+        return sheet
     
-    def _create_errors_sheet(
-        self,
-        workbook: Workbook,
-        analysis: Dict,
-        header_font: Font,
-        header_fill: PatternFill,
-        border: Border
-    ):
-        """Crea hoja de errores detallados"""
-        sheet = workbook.create_sheet("Errores")
-        
-        # Encabezados
-        headers = ["Tipo de Error", "Ocurrencias", "Componente", "Ubicación", "Primera Vez", "Última Vez"]
-        for col, header in enumerate(headers, start=1):
-            cell = sheet.cell(row=1, column=col, value=header)
-            cell.font = header_font
-            cell.fill = header_fill
-            cell.border = border
-        
-        # Datos de errores
-        if "error_groups" in analysis:
-            row = 2
-            for error_group in analysis["error_groups"]:
-                exception = error_group.get("exception", "Unknown")
-                count = error_group.get("count", 0)
-                component = error_group.get("logger", "Unknown")
-                
-                # Ubicación del error
-                location = ""
-                if "top_frame" in error_group and error_group["top_frame"]:
-                    frame = error_group["top_frame"]
-                    location = f"{frame.get('file', 'unknown')}:{frame.get('line', '?')}"
-                
-                first_ts = error_group.get("first_ts", "N/A")
-                last_ts = error_group.get("last_ts", "N/A")
-                
-                sheet[f'A{row}'] = exception
-                sheet[f'B{row}'] = count
-                sheet[f'C{row}'] = component
-                sheet[f'D{row}'] = location
-                sheet[f'E{row}'] = first_ts
-                sheet[f'F{row}'] = last_ts
-                
-                for col in range(1, 7):
-                    sheet.cell(row=row, column=col).border = border
-                
-                row += 1
-        
-        # Autoajustar columnas
-        sheet.column_dimensions['A'].width = 35
-        sheet.column_dimensions['B'].width = 12
-        sheet.column_dimensions['C'].width = 30
-        sheet.column_dimensions['D'].width = 35
-        sheet.column_dimensions['E'].width = 20
-        sheet.column_dimensions['F'].width = 20
+    def _register_styles(self, workbook):
+        """Registra en el workbook los estilos de encabezado y de datos"""
+        from openpyxl.styles import Font, Border, Side, Alignment, PatternFill, NamedStyle
+        
+        header_font = Font(bold=True, color="FFFFFF", size=11)
+        header_fill = PatternFill(start_color="4472C4", end_color="4472C4", fill_type="solid")
+        thin_border = Border(
+            left=Side(style="thin"),
+            right=Side(style="thin"),
+            top=Side(style="thin"),
+            bottom=Side(style="thin")
+        )
+        center_alignment = Alignment(horizontal="center", vertical="center")
+        
+        workbook.add_named_style(NamedStyle(
+            name=HEADER_STYLE, font=header_font, fill=header_fill, border=thin_border
+        ))
+        workbook.add_named_style(NamedStyle(
+            name=HEADER_CENTER_STYLE, font=header_font, fill=header_fill,
+            border=thin_border, alignment=center_alignment
+        ))
+        workbook.add_named_style(NamedStyle(name=BODY_STYLE, border=thin_border))
+        workbook.add_named_style(NamedStyle(
+            name=BODY_CENTER_STYLE, border=thin_border, alignment=center_alignment
+        ))
     
-    def _create_warnings_sheet(
-        self,
-        workbook: Workbook,
-        analysis: Dict,
-        header_font: Font,
-        header_fill: PatternFill,
-        border: Border
-    ):
-        """Crea hoja de warnings"""
-        sheet = workbook.create_sheet("Advertencias")
-        
-        # Encabezados
-        headers = ["Timestamp", "Componente", "Mensaje"]
-        for col, header in enumerate(headers, start=1):
-            cell = sheet.cell(row=1, column=col, value=header)
-            cell.font = header_font
-            cell.fill = header_fill
-            cell.border = border
-        
-        # Datos de warnings
-        if "warnings" in analysis:
-            row = 2
-            for warning in analysis["warnings"][:50]:  # Limitar a 50
-                timestamp = warning.get("timestamp", "N/A")
-                component = warning.get("logger", "Unknown")
-                message = warning.get("message", "")
-                
-                sheet[f'A{row}'] = timestamp
-                sheet[f'B{row}'] = component
-                sheet[f'C{row}'] = message
-                
-                for col in range(1, 4):
-                    sheet.cell(row=row, column=col).border = border
-                
-                row += 1
-        
-        # Autoajustar columnas
-        sheet.column_dimensions['A'].width = 20
-        sheet.column_dimensions['B'].width = 30
-        sheet.column_dimensions['C'].width = 60
+    @staticmethod
+    def _summary_rows(analysis: Dict) -> Iterator[Tuple]:
+        """Filas (métrica, valor) de la hoja de resumen"""
+        for key, value in analysis.get("summary", {}).items():
+            yield key.replace('_', ' ').title(), value
+    
+    @staticmethod
+    def _error_rows(analysis: Dict) -> Iterator[Tuple]:
+        """Filas de la hoja de errores detallados"""
+        for error_group in analysis.get("error_groups", ()):
+            # Ubicación del error
+            location = ""
+            frame = error_group.get("top_frame")
+            if frame:
+                location = f"{frame.get('file', 'unknown')}:{frame.get('line', '?')}"
+            
+            yield (
+                error_group.get("exception", "Unknown"),
+                error_group.get("count", 0),
+                error_group.get("logger", "Unknown"),
+                location,
+                error_group.get("first_ts", "N/A"),
+                error_group.get("last_ts", "N/A")
+            )
+    
+    @staticmethod
+    def _warning_rows(analysis: Dict) -> Iterator[Tuple]:
+        """Filas de la hoja de warnings (limitadas a MAX_WARNINGS)"""
+        for warning in islice(analysis.get("warnings", ()), MAX_WARNINGS):
+            yield (
+                warning.get("timestamp", "N/A"),
+                warning.get("logger", "Unknown"),
+                warning.get("message", "")
+            )
+
+
+def _import_xlsxwriter():
+    """
+    Importa xlsxwriter solo al exportar (es opcional).
+
+    Returns:
+        Módulo xlsxwriter, o None si no está instalado
+    """
+    try:
+        import xlsxwriter
+    except ImportError:  # pragma: no cover - xlsxwriter es opcional
+        return None
+    return xlsxwriter
+
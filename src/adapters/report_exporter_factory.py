@@ -28,19 +28,25 @@ class ReportExporterFactory:
         OutputFormat.TXT: ('.report_exporter_txt', 'TxtExporter'),
         OutputFormat.EXCEL: ('.report_exporter_excel', 'ExcelExporter'),
         OutputFormat.DOC: ('.report_exporter_doc', 'DocExporter'),
+        OutputFormat.ARROW: ('.report_exporter_arrow', 'ArrowExporter'),
     }
     
+    # Exporters ya creados: no guardan estado entre llamadas a export(),
+    # así que se comparte una instancia por formato
+    _instances: Dict[OutputFormat, ReportExporterPort] = {}
+    
     @classmethod
     def create(cls, output_format: OutputFormat) -> ReportExporterPort:
         """
-        Crea una instancia del exporter apropiado según el formato.
-        Usa lazy import para cargar solo el exporter necesario.
+        Devuelve el exporter apropiado según el formato.
+        Usa lazy import para cargar solo el exporter necesario; la instancia
+        se crea una vez y se reutiliza (los exporters deben ser stateless).
         
         Args:
             output_format: Formato de salida requerido
         
         Returns:
-            Instancia del exporter correspondiente
+            Instancia (compartida) del exporter correspondiente
         
         Raises:
             ValueError: Si el formato no está soportado
@@ -52,8 +58,12 @@ class ReportExporterFactory:
                 f"Formatos disponibles: {', '.join([f.value for f in cls._exporter_modules.keys()])}"
             )
         
+        exporter = cls._instances.get(output_format)
+        if exporter is not None:
+            return exporter
+        
         module_name, class_name = cls._exporter_modules[output_format]
-        logger.debug(f"Creando exporter para formato: {output_format.value}")
+        logger.debug("Creando exporter para formato: %s", output_format.value)
         
         try:
             # Lazy import: importar solo cuando se necesita
@@ -61,7 +71,7 @@ class ReportExporterFactory:
             module = import_module(module_name, package=__package__)
             exporter_class = getattr(module, class_name)
             
-            return exporter_class()
+            return cls._instances.setdefault(output_format, exporter_class())
             
         except ImportError as e:
             error_msg = (
@@ -82,8 +92,9 @@ class ReportExporterFactory:
             module_path: Path del módulo (ej: '.report_exporter_custom')
             class_name: Nombre de la clase del exporter
         """
-        logger.info(f"Registrando exporter para formato: {output_format.value}")
+        logger.info("Registrando exporter para formato: %s", output_format.value)
         cls._exporter_modules[output_format] = (module_path, class_name)
+        cls._instances.pop(output_format, None)
     
     @classmethod
     def supported_formats(cls) -> list:
@@ -43,15 +43,15 @@ class MarkdownExporter(ReportExporterPort):
         filename = f"{output_filename}.md"
         file_path = output_path / filename
         
-        logger.debug(f"Exportando reporte Markdown a {file_path}")
+        logger.debug("Exportando reporte Markdown a %s", file_path)
         
         try:
             with open(file_path, 'w', encoding='utf-8') as f:
                 f.write(report_content)
             
-            logger.info(f"Reporte Markdown exportado: {file_path}")
+            logger.info("Reporte Markdown exportado: %s", file_path)
             return str(file_path.absolute())
         
         except Exception as e:
-            logger.error(f"Error al exportar reporte Markdown: {e}")
+            logger.error("Error al exportar reporte Markdown: %s", e)
             raise IOError(f"Error al escribir archivo Markdown: {e}") from e
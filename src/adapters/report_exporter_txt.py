@@ -3,6 +3,7 @@ Exporter de reportes en formato texto plano (.txt).
 """
 
 import logging
+import re
 from pathlib import Path
 from typing import Dict, Optional
 
@@ -11,6 +12,9 @@ from ..ports.report_exporter_port import ReportExporterPort
 
 logger = logging.getLogger(__name__)
 
+# Marca de encabezado (#, ##, ### o ####) al inicio de línea
+MD_HEADING_RE = re.compile(r"^#{1,4} ", re.MULTILINE)
+
 
 class TxtExporter(ReportExporterPort):
     """Exporta reportes en formato texto plano"""
@@ -44,7 +48,7 @@ class TxtExporter(ReportExporterPort):
         filename = f"{output_filename}.txt"
         file_path = output_path / filename
         
-        logger.debug(f"Exportando reporte TXT a {file_path}")
+        logger.debug("Exportando reporte TXT a %s", file_path)
         
         try:
             # Convertir markdown a texto plano (remover marcas de formato básicas)
@@ -58,11 +62,11 @@ class TxtExporter(ReportExporterPort):
             with open(file_path, 'w', encoding='utf-8') as f:
                 f.write(plain_text)
             
-            logger.info(f"Reporte TXT exportado: {file_path}")
+            logger.info("Reporte TXT exportado: %s", file_path)
             return str(file_path.absolute())
         
         except Exception as e:
-            logger.error(f"Error al exportar reporte TXT: {e}")
+            logger.error("Error al exportar reporte TXT: %s", e)
             raise IOError(f"Error al escribir archivo TXT: {e}") from e
     
     def _markdown_to_plain(self, markdown_text: str) -> str:
@@ -75,27 +79,25 @@ class TxtExporter(ReportExporterPort):
         Returns:
             Texto plano sin marcas de formato
         """
-        text = markdown_text
-        
-        # Remover marcas de encabezados
-        text = text.replace('# ', '')
-        text = text.replace('## ', '')
-        text = text.replace('### ', '')
-        text = text.replace('#### ', '')
-        
-        # Remover énfasis
-        text = text.replace('**', '')
-        text = text.replace('__', '')
-        text = text.replace('*', '')
-        text = text.replace('_', '')
-        
-        # Remover código inline
-        text = text.replace('`', '')
+        # Texto ya plano (sin ninguna marca): los chequeos con 'in' son un
+        # recorrido en C cada uno, mucho más baratos que regex + replaces
+        if (
+            '#' not in markdown_text
+            and '*' not in markdown_text
+            and '_' not in markdown_text
+            and '`' not in markdown_text
+            and '- ' not in markdown_text
+        ):
+            return markdown_text
+        
+        # Remover marcas de encabezados (de cualquier nivel)
+        text = MD_HEADING_RE.sub('', markdown_text)
+        
+        # Remover énfasis y código inline: quitar '*' y '_' ya cubre '**' y '__'
+        text = text.replace('*', '').replace('_', '').replace('`', '')
         
         # Remover bullets
-        text = text.replace('- ', '  • ')
-        
-        return text
+        return text.replace('- ', '  • ')
     
     def _format_summary(self, summary: Dict) -> str:
         """
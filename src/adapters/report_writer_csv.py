@@ -8,8 +8,13 @@ import csv
 from pathlib import Path
 from typing import Dict, Optional
 
+from .file_output import open_for_write
+
 logger = logging.getLogger(__name__)
 
+# Buffer de escritura del archivo CSV
+WRITE_BUFFER_SIZE = 1 << 20
+
 
 class CSVReportWriter:
     """Escribe reportes en formato CSV"""
@@ -38,15 +43,14 @@ class CSVReportWriter:
             IOError: Si hay error de escritura
         """
         output_path = Path(output_dir)
-        output_path.mkdir(parents=True, exist_ok=True)
         
         filename = f"{run_id}_report.csv"
         file_path = output_path / filename
         
-        logger.debug(f"Escribiendo reporte CSV a {file_path}")
+        logger.debug("Escribiendo reporte CSV a %s", file_path)
         
         try:
-            with open(file_path, 'w', newline='', encoding='utf-8') as f:
+            with open_for_write(file_path, 'w', newline='', encoding='utf-8', buffering=WRITE_BUFFER_SIZE) as f:
                 writer = csv.writer(f)
                 
                 # Escribir encabezados
@@ -54,25 +58,26 @@ class CSVReportWriter:
                 
                 # Escribir resumen si está disponible
                 if analysis and "summary" in analysis:
-                    summary = analysis["summary"]
-                    for key, value in summary.items():
-                        writer.writerow([key, value])
+                    writer.writerows(analysis["summary"].items())
                 
                 # Escribir grupos de errores si están disponibles
                 if analysis and "error_groups" in analysis:
                     writer.writerow([])  # Fila vacía para separación
                     writer.writerow(["Error Type", "Count", "First Occurrence"])
                     
-                    for error_group in analysis["error_groups"]:
-                        exception = error_group.get("exception", "Unknown")
-                        count = error_group.get("count", 0)
-                        first_ts = error_group.get("first_ts", "N/A")
-                        
-                        writer.writerow([exception, count, first_ts])
+                    # writerows consume el generador de filas desde C
+                    writer.writerows(
+                        (
+                            error_group.get("exception", "Unknown"),
+                            error_group.get("count", 0),
+                            error_group.get("first_ts", "N/A")
+                        )
+                        for error_group in analysis["error_groups"]
+                    )
             
-            logger.info(f"Reporte CSV generado: {file_path}")
+            logger.info("Reporte CSV generado: %s", file_path)
             return str(file_path.absolute())
         
         except Exception as e:
-            logger.error(f"Error al escribir reporte CSV: {e}")
+            logger.error("Error al escribir reporte CSV: %s", e)
             raise IOError(f"Error al escribir archivo CSV: {e}") from e
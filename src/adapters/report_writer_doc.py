@@ -4,11 +4,47 @@ Genera archivos RTF que pueden ser abiertos por Microsoft Word.
 """
 
 import logging
+import re
+from itertools import islice
 from pathlib import Path
 from typing import Dict, Optional
 
+from .file_output import open_for_write
+
 logger = logging.getLogger(__name__)
 
+# Reemplazos básicos para RTF (el backslash primero, para no re-escapar los demás)
+RTF_ESCAPES = (
+    ("\\", "\\\\"),      # Backslash
+    ("{", "\\{"),        # Llave abierta
+    ("}", "\\}"),        # Llave cerrada
+    ("\n", "\\par\n"),   # Salto de línea
+    ("\t", "\\tab "),    # Tabulación
+)
+
+# Caracteres fuera de ASCII imprimible que quedan tras RTF_ESCAPES
+RTF_NON_ASCII_RE = re.compile(r"[^\n\x20-\x7e]")
+
+
+def _rtf_char(match: re.Match) -> str:
+    """
+    Codifica un carácter no ASCII como secuencia RTF.
+
+    Los códigos < 256 van como \\'hh; el resto como \\uN? con N entero con
+    signo de 16 bits (los fuera del BMP, como par de surrogates UTF-16).
+    """
+    code = ord(match.group())
+    if code < 256:
+        return "\\'%02x" % code
+    if code > 0xFFFF:
+        code -= 0x10000
+        units = (0xD800 + (code >> 10), 0xDC00 + (code & 0x3FF))
+    else:
+        units = (code,)
+    return "".join(
+        f"\\u{unit - 0x10000 if unit > 0x7FFF else unit}?" for unit in units
+    )
+
 
 class DocReportWriter:
     """Escribe reportes en formato DOC (RTF compatible con Word)"""
@@ -37,25 +73,24 @@ class DocReportWriter:
             IOError: Si hay error de escritura
         """
         output_path = Path(output_dir)
-        output_path.mkdir(parents=True, exist_ok=True)
         
         filename = f"{run_id}_report.doc"
         file_path = output_path / filename
         
-        logger.debug(f"Escribiendo reporte RTF/DOC a {file_path}")
+        logger.debug("Escribiendo reporte RTF/DOC a %s", file_path)
         
         try:
             # Construir documento RTF válido
             rtf_content = self._generate_rtf(report_content, analysis)
             
-            with open(file_path, 'w', encoding='utf-8') as f:
+            with open_for_write(file_path, 'w', encoding='utf-8') as f:
                 f.write(rtf_content)
             
-            logger.info(f"Reporte DOC generado: {file_path}")
+            logger.info("Reporte DOC generado: %s", file_path)
             return str(file_path.absolute())
         
         except Exception as e:
-            logger.error(f"Error al escribir reporte DOC: {e}")
+            logger.error("Error al escribir reporte DOC: %s", e)
             raise IOError(f"Error al escribir archivo DOC: {e}") from e
     
     def _generate_rtf(self, report_content: str, analysis: Optional[Dict] = None) -> str:
@@ -73,46 +108,47 @@ class DocReportWriter:
         escaped_content = self._escape_rtf(report_content)
         
         # Encabezado RTF obligatorio
-        rtf = "{\\rtf1\\ansi\\ansicpg1252\\deff0\\deflang1033\n"
+        parts = ["{\\rtf1\\ansi\\ansicpg1252\\deff0\\deflang1033\n"]
         
         # Tabla de fuentes
-        rtf += "{\\fonttbl"
-        rtf += "{\\f0\\fnil\\fcharset0 Calibri;}}\\n"
+        parts.append("{\\fonttbl")
+        parts.append("{\\f0\\fnil\\fcharset0 Calibri;}}\n")
         
         # Esquema de colores
-        rtf += "{\\colortbl;\\red0\\green0\\blue0;}\n"
+        parts.append("{\\colortbl;\\red0\\green0\\blue0;}\n")
         
         # Configuración del documento
-        rtf += "\\viewkind4\\uc1\\pard\\f0\\fs20\n"
+        parts.append("\\viewkind4\\uc1\\pard\\f0\\fs20\n")
         
         # Título
-        rtf += "{\\b\\fs28 Reporte de An\\\'e1lisis de Logs}\\par\\par\n"
+        parts.append("{\\b\\fs28 Reporte de An\\\'e1lisis de Logs}\\par\\par\n")
         
         # Contenido principal
-        rtf += escaped_content + "\\par\\par\n"
+        parts.append(escaped_content)
+        parts.append("\\par\\par\n")
         
         # Análisis adicional si está disponible
         if analysis and "summary" in analysis:
-            rtf += "{\\b Resumen:}\\par\n"
+            parts.append("{\\b Resumen:}\\par\n")
             for key, value in analysis["summary"].items():
-                rtf += f"  {key}: {value}\\par\n"
-            rtf += "\\par\n"
+                parts.append(f"  {key}: {value}\\par\n")
+            parts.append("\\par\n")
         
         if analysis and "error_groups" in analysis:
-            rtf += "{\\b Grupos de Errores:}\\par\n"
-            for group in analysis["error_groups"][:5]:  # Limitar a 5 grupos
+            parts.append("{\\b Grupos de Errores:}\\par\n")
+            for group in islice(analysis["error_groups"], 5):  # Limitar a 5 grupos
                 exception = group.get("exception", "Unknown")
                 count = group.get("count", 0)
-                rtf += f"  {exception}: {count} ocurrencias\\par\n"
-            rtf += "\\par\n"
+                parts.append(f"  {exception}: {count} ocurrencias\\par\n")
+            parts.append("\\par\n")
         
         # Pie de página
-        rtf += "{\\i Generado automáticamente por Log Analyzer}\\par\n"
+        parts.append("{\\i Generado autom\\'e1ticamente por Log Analyzer}\\par\n")
         
         # Cierre
-        rtf += "}"
+        parts.append("}")
         
-        return rtf
+        return "".join(parts)
     
     def _escape_rtf(self, text: str) -> str:
         """
@@ -124,31 +160,8 @@ class DocReportWriter:
         Returns:
             Texto escapado para RTF
         """
-        # Reemplazos básicos para RTF
-        replacements = {
-            "\\": "\\\\",      # Backslash
-            "{": "\\{",        # Llave abierta
-            "}": "\\}",        # Llave cerrada
-            "\n": "\\par\n",   # Salto de línea
-            "\t": "\\tab ",    # Tabulación
-        }
-        
-        result = text
-        for old, new in replacements.items():
-            result = result.replace(old, new)
-        
-        # Manejar caracteres acentuados (codificarlos a octal RTF)
-        safe_result = ""
-        for char in result:
-            code = ord(char)
-            # ASCII imprimible (excepto los que ya escapamos)
-            if 32 <= code <= 126 and char not in "\\{}":
-                safe_result += char
-            # Caracteres especiales
-            elif code < 256:
-                safe_result += f"\\'{'%02x' % code}"
-            # Caracteres Unicode
-            else:
-                safe_result += f"\\u{code}?"
-        
-        return safe_result
+        # str.replace recorre el texto en C (más rápido que str.translate con
+        # reemplazos de varios caracteres); solo los no ASCII pasan por Python
+        for old, new in RTF_ESCAPES:
+            text = text.replace(old, new)
+        return RTF_NON_ASCII_RE.sub(_rtf_char, text)
@@ -1,13 +1,11 @@
 """
 Adapter para generar reportes Excel.
+Usa xlsxwriter si está instalado (escritura en streaming, más rápida); si no, openpyxl.
 """
 
 import logging
 from pathlib import Path
-from typing import Dict, List, Optional
-
-from openpyxl import Workbook
-from openpyxl.styles import Font, Border, Side
+from typing import Dict, List, Optional, Tuple
 
 from ..config.constants import Constants
 from ..domain.log_analyzer.report_schema import get_report_schema
@@ -15,18 +13,26 @@ from ..domain.log_analyzer.report_schema import get_report_schema
 
 logger = logging.getLogger(__name__)
 
+# Estilos con nombre registrados en cada workbook
+HEADER_STYLE = "header"
+BODY_STYLE = "body"
+
+# Ancho mínimo de columna (en caracteres)
+MIN_COLUMN_WIDTH = 12
+
 
 class ExcelReportWriter:
     """Genera reportes Excel con formato profesional"""
 
-    def __init__(self, reports_dir: Path):
+    def __init__(self, reports_dir: Optional[Path] = None):
         self.reports_dir = reports_dir
 
     def write_report(
         self,
         run_id: str,
         report_content: str,
-        analysis: Optional[Dict] = None
+        analysis: Optional[Dict] = None,
+        output_dir: Optional[str] = None
     ) -> str:
         """
         Escribe el reporte en formato Excel.
@@ -35,6 +41,7 @@ class ExcelReportWriter:
             run_id: Identificador de la ejecucion
             report_content: Contenido Markdown (no usado en Excel)
             analysis: Analisis estructurado
+            output_dir: Directorio de salida (por defecto, el reports_dir del writer)
 
         Returns:
             Path absoluto del archivo generado
@@ -42,81 +49,132 @@ class ExcelReportWriter:
         if analysis is None:
             raise ValueError("Analisis requerido para generar Excel")
 
-        self.reports_dir.mkdir(parents=True, exist_ok=True)
-        filename = f"{run_id}{Constants.REPORT_FILE_EXTENSION_XLSX}"
-        filepath = self.reports_dir / filename
+        reports_dir = Path(output_dir) if output_dir is not None else self.reports_dir
+        if reports_dir is None:
+            raise ValueError("Directorio de salida requerido para generar Excel")
 
-        workbook = Workbook()
-        workbook.remove(workbook.active)
+        reports_dir.mkdir(parents=True, exist_ok=True)
+        filename = f"{run_id}{Constants.REPORT_FILE_EXTENSION_XLSX}"
+        filepath = reports_dir / filename
 
         schema = get_report_schema()
+        sections = [
+            ("summary", schema.get("summary", []), [analysis.get("summary", {})]),
+            ("error_groups", schema.get("error_groups", []), analysis.get("error_groups", [])),
+            ("warnings", schema.get("warnings", []), analysis.get("warnings", []))
+        ]
+
+        xlsxwriter = _import_xlsxwriter()
+        if xlsxwriter is not None:
+            self._write_xlsxwriter(xlsxwriter, filepath, sections)
+        else:
+            self._write_openpyxl(filepath, sections)
+        return str(filepath.absolute())
+
+    def _write_xlsxwriter(self, xlsxwriter, filepath: Path, sections: List[Tuple]) -> None:
+        """
+        Escribe el workbook con xlsxwriter, volcando cada fila a disco (constant_memory).
+        Los mensajes que empiezan con una URL se escriben como texto (strings_to_urls).
+        """
+        workbook = xlsxwriter.Workbook(
+            str(filepath),
+            {"constant_memory": True, "strings_to_urls": False}
+        )
+        try:
+            header_format = workbook.add_format({"bold": True, "border": 1})
+            body_format = workbook.add_format({"border": 1})
+
+            for title, columns, rows in sections:
+                values, widths = self._section_values(columns, rows)
+                sheet = workbook.add_worksheet(title)
+                for col_index, width in enumerate(widths):
+                    sheet.set_column(col_index, col_index, width)
+                sheet.write_row(0, 0, [column["label"] for column in columns], header_format)
+                for row_index, row_values in enumerate(values, start=1):
+                    sheet.write_row(row_index, 0, row_values, body_format)
+        finally:
+            workbook.close()
+
+    def _write_openpyxl(self, filepath: Path, sections: List[Tuple]) -> None:
+        """Escribe el workbook con openpyxl en modo write_only"""
+        from openpyxl import Workbook
+        from openpyxl.cell import WriteOnlyCell
+        from openpyxl.styles import Font, Border, Side, NamedStyle
+        from openpyxl.utils import get_column_letter
+
+        def styled_row(sheet, values, style: str) -> List:
+            cells = [WriteOnlyCell(sheet, value=value) for value in values]
+            for cell in cells:
+                cell.style = style
+            return cells
+
+        # write_only: filas serializadas al agregarlas, sin hoja por defecto
+        workbook = Workbook(write_only=True)
+
         thin_border = Border(
             left=Side(style="thin"),
             right=Side(style="thin"),
             top=Side(style="thin"),
             bottom=Side(style="thin")
         )
-        header_font = Font(bold=True)
-
-        self._write_section(
-            workbook,
-            "summary",
-            schema.get("summary", []),
-            [analysis.get("summary", {})],
-            header_font,
-            thin_border
-        )
-        self._write_section(
-            workbook,
-            "error_groups",
-            schema.get("error_groups", []),
-            analysis.get("error_groups", []),
-            header_font,
-            thin_border
-        )
-        self._write_section(
-            workbook,
-            "warnings",
-            schema.get("warnings", []),
-            analysis.get("warnings", []),
-            header_font,
-            thin_border
+        workbook.add_named_style(
+            NamedStyle(name=HEADER_STYLE, font=Font(bold=True), border=thin_border)
         )
+        workbook.add_named_style(NamedStyle(name=BODY_STYLE, border=thin_border))
 
-        workbook.save(filepath)
-        return str(filepath.resolve())
+        for title, columns, rows in sections:
+            values, widths = self._section_values(columns, rows)
+            sheet = workbook.create_sheet(title=title)
 
-    def _write_section(
-        self,
-        workbook: Workbook,
-        title: str,
-        columns: List[Dict[str, str]],
-        rows: List[Dict],
-        header_font: Font,
-        border: Border
-    ) -> None:
-        sheet = workbook.create_sheet(title=title)
-
-        for col_index, column in enumerate(columns, start=1):
-            cell = sheet.cell(row=1, column=col_index, value=column["label"])
-            cell.font = header_font
-            cell.border = border
+            # En write_only los anchos deben fijarse antes de la primera fila
+            for col_index, width in enumerate(widths, start=1):
+                sheet.column_dimensions[get_column_letter(col_index)].width = width
 
-        for row_index, row in enumerate(rows, start=2):
-            for col_index, column in enumerate(columns, start=1):
-                value = row.get(column["key"], "")
-                cell = sheet.cell(row=row_index, column=col_index, value=value)
-                cell.border = border
+            sheet.append(styled_row(sheet, [column["label"] for column in columns], HEADER_STYLE))
+            for row_values in values:
+                sheet.append(styled_row(sheet, row_values, BODY_STYLE))
 
-        self._auto_fit_columns(sheet, min_width=12)
+        workbook.save(filepath)
 
     @staticmethod
-    def _auto_fit_columns(sheet, min_width: int) -> None:
-        for col in sheet.columns:
-            max_len = min_width
-            col_letter = col[0].column_letter
-            for cell in col:
-                if cell.value is None:
+    def _section_values(
+        columns: List[Dict[str, str]],
+        rows: List[Dict]
+    ) -> Tuple[List[List], List[int]]:
+        """
+        Arma en una pasada los valores de cada fila y el ancho de cada columna.
+
+        Args:
+            columns: Columnas de la sección (key y label)
+            rows: Filas del análisis
+
+        Returns:
+            Tupla (valores por fila, ancho por columna)
+        """
+        keys = [column["key"] for column in columns]
+        widths = [max(MIN_COLUMN_WIDTH, len(str(column["label"]))) for column in columns]
+        values = []
+        for row in rows:
+            row_values = [row.get(key, "") for key in keys]
+            for col_index, value in enumerate(row_values):
+                if value is None:
                     continue
-                max_len = max(max_len, len(str(cell.value)))
-            sheet.column_dimensions[col_letter].width = max_len
+                width = len(str(value))
+                if width > widths[col_index]:
+                    widths[col_index] = width
+            values.append(row_values)
+        return values, widths
+
+
+def _import_xlsxwriter():
+    """
+    Importa xlsxwriter solo al escribir un reporte (es opcional).
+
+    Returns:
+        Módulo xlsxwriter, o None si no está instalado
+    """
+    try:
+        import xlsxwriter
+    except ImportError:  # pragma: no cover - xlsxwriter es opcional
+        return None
+    return xlsxwriter
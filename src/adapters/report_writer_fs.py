@@ -4,18 +4,16 @@ Implementa ReportWriterPort para escribir archivos locales.
 Registra y despacha a format-specific writers (excel, txt, csv, doc).
 """
 
-import json
 import logging
+from importlib import import_module
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, Optional, Tuple
 
 from ..ports.report_writer_port import ReportWriterPort
 from ..config.settings import settings
 from ..config.constants import Constants
-from .report_writer_excel import ExcelReportWriter
-from .report_writer_txt import TextReportWriter
-from .report_writer_csv import CSVReportWriter
-from .report_writer_doc import DocReportWriter
+from .file_output import open_for_write
+from .json_codec import dumps_json_indented
 
 
 logger = logging.getLogger(__name__)
@@ -27,23 +25,26 @@ class FileSystemReportWriter(ReportWriterPort):
     Despacha a writers específicos según el formato solicitado.
     """
     
+    # Registry de writers por formato: (módulo, clase). Se importan y crean
+    # al primer uso, así solo se cargan los de los formatos que se piden
+    _writer_modules: Dict[str, Tuple[str, str]] = {
+        Constants.REPORT_FORMAT_EXCEL: ('.report_writer_excel', 'ExcelReportWriter'),
+        Constants.REPORT_FORMAT_TXT: ('.report_writer_txt', 'TextReportWriter'),
+        Constants.REPORT_FORMAT_CSV: ('.report_writer_csv', 'CSVReportWriter'),
+        Constants.REPORT_FORMAT_DOC: ('.report_writer_doc', 'DocReportWriter'),
+    }
+    
     def __init__(self):
-        """Inicializa el writer con todos los format writers disponibles"""
+        """Inicializa el writer; los format writers se crean al primer uso"""
         self.reports_dir = settings.REPORTS_DIR
         self.analysis_dir = settings.ANALYSIS_DIR
         
-        # Registrar todos los writers disponibles
-        self.writers = {
-            Constants.REPORT_FORMAT_EXCEL: ExcelReportWriter(self.reports_dir),
-            Constants.REPORT_FORMAT_TXT: TextReportWriter(),
-            Constants.REPORT_FORMAT_CSV: CSVReportWriter(),
-            Constants.REPORT_FORMAT_DOC: DocReportWriter(),
-        }
+        # Writers ya creados, por formato
+        self._writers: Dict[str, object] = {}
         
         logger.debug(
-            f"FileSystemReportWriter: "
-            f"reports={self.reports_dir}, analysis={self.analysis_dir}, "
-            f"formats={list(self.writers.keys())}"
+            "FileSystemReportWriter: reports=%s, analysis=%s, formats=%s",
+            self.reports_dir, self.analysis_dir, list(self._writer_modules)
         )
     
     def write_analysis(self, run_id: str, analysis: Dict) -> str:
@@ -57,24 +58,25 @@ class FileSystemReportWriter(ReportWriterPort):
         Returns:
             Path absoluto del archivo generado
         """
-        # Asegurar que existe el directorio
-        self.analysis_dir.mkdir(parents=True, exist_ok=True)
-        
         # Construir path del archivo
         filename = f"{run_id}{Constants.ANALYSIS_FILE_EXTENSION}"
         filepath = self.analysis_dir / filename
         
-        logger.debug(f"Escribiendo análisis: {filepath}")
+        logger.debug("Escribiendo análisis: %s", filepath)
         
         try:
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(analysis, f, indent=2, ensure_ascii=False)
+            # Serializar completo y escribir de una vez (json.dump hace un
+            # write por cada token)
+            with open_for_write(filepath, 'wb') as f:
+                f.write(dumps_json_indented(analysis))
             
-            logger.info(f"Análisis guardado: {filepath}")
-            return str(filepath.resolve())
+            logger.info("Análisis guardado: %s", filepath)
+            # Los directorios de settings ya son absolutos: absolute() no
+            # toca el filesystem (resolve() hace stat/readlink por componente)
+            return str(filepath.absolute())
             
         except Exception as e:
-            logger.error(f"Error al escribir análisis: {e}")
+            logger.error("Error al escribir análisis: %s", e)
             raise IOError(f"{Constants.ERROR_WRITE_FAILED}: {e}") from e
     
     def write_report(
@@ -104,8 +106,8 @@ class FileSystemReportWriter(ReportWriterPort):
         format_lower = report_format.lower() if report_format else "markdown"
         
         # Comprobar si el formato está registrado
-        if format_lower in self.writers:
-            writer = self.writers[format_lower]
+        if format_lower in self._writer_modules:
+            writer = self._get_writer(format_lower)
             return writer.write_report(
                 run_id=run_id,
                 report_content=report_content,
@@ -119,6 +121,23 @@ class FileSystemReportWriter(ReportWriterPort):
         
         raise ValueError(f"Formato no soportado: {report_format}")
     
+    def _get_writer(self, format_name: str):
+        """
+        Devuelve el writer de un formato registrado, importándolo y creándolo al primer uso.
+        
+        Args:
+            format_name: Formato normalizado (clave de _writer_modules)
+        
+        Returns:
+            Instancia del writer del formato
+        """
+        writer = self._writers.get(format_name)
+        if writer is None:
+            module_name, class_name = self._writer_modules[format_name]
+            module = import_module(module_name, package=__package__)
+            writer = self._writers[format_name] = getattr(module, class_name)()
+        return writer
+    
     def _write_markdown(self, run_id: str, report_content: str) -> str:
         """
         Escribe el reporte en formato Markdown.
@@ -130,25 +149,18 @@ class FileSystemReportWriter(ReportWriterPort):
         Returns:
             Path al archivo generado
         """
-        self.reports_dir.mkdir(parents=True, exist_ok=True)
         filename = f"{run_id}{Constants.REPORT_FILE_EXTENSION}"
         filepath = self.reports_dir / filename
 
         logger.debug("Escribiendo reporte Markdown: %s", filepath)
 
         try:
-            with open(filepath, "w", encoding="utf-8") as f:
+            with open_for_write(filepath, "w", encoding="utf-8") as f:
                 f.write(report_content)
             
-            logger.info(f"Reporte Markdown generado: {filepath}")
-            return str(filepath.resolve())
+            logger.info("Reporte Markdown generado: %s", filepath)
+            return str(filepath.absolute())
             
         except Exception as e:
-            logger.error(f"Error al escribir reporte Markdown: {e}")
-            raise IOError(f"{Constants.ERROR_WRITE_FAILED}: {e}") from e
-
-            logger.info("Reporte guardado: %s", filepath)
-            return str(filepath.resolve())
-        except Exception as e:
-            logger.error("Error al escribir reporte: %s", e)
+            logger.error("Error al escribir reporte Markdown: %s", e)
             raise IOError(f"{Constants.ERROR_WRITE_FAILED}: {e}") from e
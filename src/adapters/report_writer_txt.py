@@ -7,6 +7,8 @@ import logging
 from pathlib import Path
 from typing import Dict, Optional
 
+from .file_output import open_for_write
+
 logger = logging.getLogger(__name__)
 
 
@@ -36,20 +38,19 @@ class TextReportWriter:
             IOError: Si hay error de escritura
         """
         output_path = Path(output_dir)
-        output_path.mkdir(parents=True, exist_ok=True)
         
         filename = f"{run_id}_report.txt"
         file_path = output_path / filename
         
-        logger.debug(f"Escribiendo reporte de texto a {file_path}")
+        logger.debug("Escribiendo reporte de texto a %s", file_path)
         
         try:
-            with open(file_path, 'w', encoding='utf-8') as f:
+            with open_for_write(file_path, 'w', encoding='utf-8') as f:
                 f.write(report_content)
             
-            logger.info(f"Reporte de texto generado: {file_path}")
+            logger.info("Reporte de texto generado: %s", file_path)
             return str(file_path.absolute())
         
         except Exception as e:
-            logger.error(f"Error al escribir reporte de texto: {e}")
+            logger.error("Error al escribir reporte de texto: %s", e)
             raise IOError(f"Error al escribir archivo: {e}") from e
@@ -11,6 +11,8 @@ class Constants:
     OUT_DIR_NAME = "out"
     REPORTS_DIR_NAME = "reports"
     ANALYSIS_DIR_NAME = "analysis"
+    # Reportes cacheados por contenido (oculto: un run_id sanitizado no puede empezar con '.')
+    ARTIFACTS_DIR_NAME = ".artifacts"
     
     # Extensiones y formatos
     REPORT_FILE_EXTENSION = ".md"
@@ -23,12 +25,14 @@ class Constants:
     REPORT_FORMAT_TXT = "txt"
     REPORT_FORMAT_CSV = "csv"
     REPORT_FORMAT_DOC = "doc"
+    REPORT_FORMAT_ARROW = "arrow"
     
     # MIME types para descarga
     MIME_TYPE_EXCEL = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
     MIME_TYPE_TXT = "text/plain"
     MIME_TYPE_CSV = "text/csv"
     MIME_TYPE_DOC = "application/msword"
+    MIME_TYPE_ARROW = "application/vnd.apache.arrow.file"
     
     # Default MIME type para formatos
     FORMAT_MIME_TYPES = {
@@ -36,6 +40,7 @@ class Constants:
         REPORT_FORMAT_TXT: MIME_TYPE_TXT,
         REPORT_FORMAT_CSV: MIME_TYPE_CSV,
         REPORT_FORMAT_DOC: MIME_TYPE_DOC,
+        REPORT_FORMAT_ARROW: MIME_TYPE_ARROW,
     }
     
     # Extensiones de archivo por formato
@@ -44,6 +49,7 @@ class Constants:
         REPORT_FORMAT_TXT: ".txt",
         REPORT_FORMAT_CSV: ".csv",
         REPORT_FORMAT_DOC: ".doc",
+        REPORT_FORMAT_ARROW: ".arrow",
     }
     
     # Nombres default
@@ -76,23 +82,17 @@ class Constants:
     MAX_HOTSPOTS = 5
     MAX_WARNING_SAMPLES = 5
     MAX_SAMPLES_PER_GROUP = 2
+    MAX_REPORT_CHARS_IN_DOC = 200_000
     
     # Prompts para LLM
     LLM_SYSTEM_PROMPT = """Eres un experto analista de logs y sistemas distribuidos.
 Tu tarea es generar un reporte profesional en formato Markdown a partir del análisis estructurado de logs.
 El reporte debe ser claro, técnico y orientado a desarrolladores/operadores."""
     
-    LLM_USER_PROMPT_TEMPLATE = """Genera un reporte técnico profesional en formato Markdown basado en el siguiente análisis de logs.
-
-ANÁLISIS ESTRUCTURADO (JSON):
-```json
-{analysis_json}
-```
-
-EXTRACTO DE LOGS (primeras líneas):
-```
-{log_excerpt}
-```
+    # Lo estático (instrucciones y requisitos) va primero y lo que cambia por
+    # log (análisis y extracto) al final: así el prefijo del prompt es idéntico
+    # entre llamadas y aprovecha el prompt caching del proveedor.
+    LLM_USER_PROMPT_TEMPLATE = """Genera un reporte técnico profesional en formato Markdown basado en el análisis de logs que se incluye al final.
 
 REQUISITOS DEL REPORTE:
 1. Título principal con emoji
@@ -104,6 +104,16 @@ REQUISITOS DEL REPORTE:
 7. Conclusión breve
 
 Usa formato Markdown profesional con secciones, bullets, code blocks y énfasis apropiado.
+
+ANÁLISIS ESTRUCTURADO (JSON):
+```json
+{analysis_json}
+```
+
+EXTRACTO DE LOGS (primeras líneas):
+```
+{log_excerpt}
+```
 """
     
     # Mensajes de logging
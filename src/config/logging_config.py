@@ -3,8 +3,11 @@ Configuración de logging para el proyecto log_analyzer.
 Usa el módulo logging estándar de Python.
 """
 
+import atexit
 import logging
+import queue
 import sys
+from logging.handlers import QueueHandler, QueueListener
 from typing import Optional
 
 from .settings import settings
@@ -16,6 +19,9 @@ LOG_FORMAT = "[%(levelname)s] [%(name)s] %(message)s"
 # Formato con timestamp para logs más detallados
 LOG_FORMAT_DETAILED = "%(asctime)s [%(levelname)s] [%(name)s] %(message)s"
 
+# Listener que escribe los logs encolados (uno por proceso)
+_queue_listener: Optional[QueueListener] = None
+
 
 def setup_logging(
     level: Optional[str] = None,
@@ -34,13 +40,15 @@ def setup_logging(
     
     log_format = LOG_FORMAT_DETAILED if detailed else LOG_FORMAT
     
+    handlers = [logging.StreamHandler(sys.stdout)]
+    if settings.LOG_ASYNC and not logging.getLogger().handlers:
+        handlers = [_start_queue_listener(handlers[0], log_format)]
+    
     # Configurar logging raíz
     logging.basicConfig(
         level=getattr(logging, level, logging.INFO),
         format=log_format,
-        handlers=[
-            logging.StreamHandler(sys.stdout)
-        ]
+        handlers=handlers
     )
     
     # Silenciar logs verbosos de librerías externas
@@ -48,6 +56,35 @@ def setup_logging(
     logging.getLogger("requests").setLevel(logging.WARNING)
 
 
+def _start_queue_listener(handler: logging.Handler, log_format: str) -> QueueHandler:
+    """
+    Mueve la escritura de logs a un thread de fondo.
+    
+    El thread que loguea solo encola el registro; el QueueListener lo formatea
+    y lo escribe con el handler real.
+    
+    Args:
+        handler: Handler real (stdout)
+        log_format: Formato aplicado por el handler real
+    
+    Returns:
+        QueueHandler a instalar en el logger raíz
+    """
+    global _queue_listener
+    
+    log_queue = queue.SimpleQueue()
+    handler.setFormatter(logging.Formatter(log_format))
+    
+    _queue_listener = QueueListener(log_queue, handler, respect_handler_level=True)
+    _queue_listener.start()
+    atexit.register(_queue_listener.stop)
+    
+    # Formato mínimo: el prefijo lo agrega el handler real al escribir
+    queue_handler = QueueHandler(log_queue)
+    queue_handler.setFormatter(logging.Formatter("%(message)s"))
+    return queue_handler
+
+
 def get_logger(name: str) -> logging.Logger:
     """
     Obtiene un logger con el nombre especificado.
@@ -35,6 +35,34 @@ class Settings:
             "mistral"
         )
 
+        # Límites de las llamadas a Ollama
+        self.OLLAMA_TIMEOUT_CONNECT = float(os.environ.get(
+            "OLLAMA_TIMEOUT_CONNECT",
+            "2.0"
+        ))
+        self.OLLAMA_TIMEOUT_READ = float(os.environ.get(
+            "OLLAMA_TIMEOUT_READ",
+            os.environ.get("REQUEST_TIMEOUT_SECONDS", "120")
+        ))
+        self.OLLAMA_MAX_RETRIES = int(os.environ.get(
+            "OLLAMA_MAX_RETRIES",
+            "3"
+        ))
+        self.OLLAMA_MAX_OUTPUT_TOKENS = int(os.environ.get(
+            "OLLAMA_MAX_OUTPUT_TOKENS",
+            "2048"
+        ))
+        self.LLM_WARMUP_ENABLED = os.environ.get(
+            "LLM_WARMUP_ENABLED",
+            "true"
+        ).lower() == "true"
+
+        # Reintentos para las APIs remotas (OpenAI, Anthropic, Google)
+        self.LLM_HTTP_MAX_RETRIES = int(os.environ.get(
+            "LLM_HTTP_MAX_RETRIES",
+            "2"
+        ))
+
         # OpenAI
         self.OPENAI_API_KEY = os.environ.get("OPENAI_API_KEY", "")
         self.OPENAI_MODEL = os.environ.get(
@@ -73,6 +101,10 @@ class Settings:
             "REPORT_DOWNLOAD_MAX_FILES",
             "10"
         ))
+        self.IO_MAX_WORKERS = int(os.environ.get(
+            "IO_MAX_WORKERS",
+            "4"
+        ))
 
         # Cache
         self.CACHE_ENABLED = os.environ.get(
@@ -83,6 +115,32 @@ class Settings:
             "CACHE_TTL_SECONDS",
             "60"
         ))
+        self.CACHE_MAX_ENTRIES = int(os.environ.get(
+            "CACHE_MAX_ENTRIES",
+            "256"
+        ))
+        self.DATASETS_CACHE_TTL_SECONDS = int(os.environ.get(
+            "DATASETS_CACHE_TTL_SECONDS",
+            "30"
+        ))
+        # Cache de respuestas del LLM por prompt (CachedLLM)
+        self.LLM_CACHE_ENABLED = os.environ.get(
+            "LLM_CACHE_ENABLED",
+            "false"
+        ).lower() == "true"
+        self.LLM_CACHE_TTL_SECONDS = int(os.environ.get(
+            "LLM_CACHE_TTL_SECONDS",
+            "3600"
+        ))
+        self.LLM_CACHE_MAX_ENTRIES = int(os.environ.get(
+            "LLM_CACHE_MAX_ENTRIES",
+            "128"
+        ))
+        # Si se define, las respuestas se guardan en disco (persisten entre ejecuciones)
+        llm_cache_dir_str = os.environ.get("LLM_CACHE_DIR", "")
+        self.LLM_CACHE_DIR = Path(llm_cache_dir_str) if llm_cache_dir_str else None
+        if self.LLM_CACHE_DIR is not None and not self.LLM_CACHE_DIR.is_absolute():
+            self.LLM_CACHE_DIR = self._project_root / self.LLM_CACHE_DIR
 
         # Reporte
         self.REPORT_FORMAT = os.environ.get(
@@ -95,6 +153,17 @@ class Settings:
             "LOG_LEVEL",
             "INFO"
         ).upper()
+        # Escribir logs desde un thread de fondo (QueueHandler + QueueListener)
+        self.LOG_ASYNC = os.environ.get(
+            "LOG_ASYNC",
+            "true"
+        ).lower() == "true"
+
+        # Swagger UI (/apidocs) y spec (/apispec.json)
+        self.SWAGGER_ENABLED = os.environ.get(
+            "SWAGGER_ENABLED",
+            "true"
+        ).lower() == "true"
         
         # Timeout para requests HTTP
         self.REQUEST_TIMEOUT_SECONDS = int(os.environ.get(
@@ -102,6 +171,40 @@ class Settings:
             "120"
         ))
         
+        # Máximo de llamadas concurrentes al LLM por proceso de la API
+        self.LLM_MAX_CONCURRENCY = int(os.environ.get(
+            "LLM_MAX_CONCURRENCY",
+            "2"
+        ))
+        self.LLM_QUEUE_TIMEOUT_SECONDS = float(os.environ.get(
+            "LLM_QUEUE_TIMEOUT_SECONDS",
+            "0"
+        ))
+        self.ANALYZE_RATE_LIMIT_PER_MINUTE = int(os.environ.get(
+            "ANALYZE_RATE_LIMIT_PER_MINUTE",
+            "10"
+        ))
+        
+        # Servidor WSGI (gunicorn): workers = 2*CPU+1 por defecto
+        self.API_WORKERS = int(os.environ.get(
+            "API_WORKERS",
+            str(2 * (os.cpu_count() or 1) + 1)
+        ))
+        self.API_THREADS = int(os.environ.get(
+            "API_THREADS",
+            "4"
+        ))
+        self.API_TIMEOUT_SECONDS = int(os.environ.get(
+            "API_TIMEOUT_SECONDS",
+            "300"
+        ))
+        
+        # Conexiones HTTP reutilizables por host hacia el proveedor LLM
+        self.HTTP_POOL_MAXSIZE = int(os.environ.get(
+            "HTTP_POOL_MAXSIZE",
+            "20"
+        ))
+        
         # Endpoint completo de generación de Ollama
         self.OLLAMA_GENERATE_URL = f"{self.OLLAMA_BASE_URL}/api/generate"
         
@@ -131,7 +234,10 @@ class Settings:
             f"DATASETS_DIR={self.DATASETS_DIR}, "
             f"REPORT_DOWNLOAD_MAX_FILES={self.REPORT_DOWNLOAD_MAX_FILES}, "
             f"LOG_LEVEL={self.LOG_LEVEL}, "
-            f"REQUEST_TIMEOUT_SECONDS={self.REQUEST_TIMEOUT_SECONDS})"
+            f"REQUEST_TIMEOUT_SECONDS={self.REQUEST_TIMEOUT_SECONDS}, "
+            f"LLM_MAX_CONCURRENCY={self.LLM_MAX_CONCURRENCY}, "
+            f"API_WORKERS={self.API_WORKERS}, "
+            f"API_THREADS={self.API_THREADS})"
         )
 
 
@@ -3,12 +3,18 @@ Caso de uso: Anรกlisis de logs con formato configurable.
 Orquesta el proceso completo: carga, anรกlisis, generaciรณn de reporte y exportaciรณn.
 """
 
+import functools
+import hashlib
 import logging
+import os
+import shutil
+import tempfile
+import time
 from pathlib import Path
 from typing import Optional, Dict
 
 from .dtos import AnalyzeRequest, AnalyzeResponse
-from .enums import OutputFormat
+from .enums import OutputFormat, ErrorCode
 from ..ports.log_reader_port import LogReaderPort
 from ..ports.analyzer_port import AnalyzerPort
 from ..ports.llm_port import LLMPort
@@ -16,12 +22,33 @@ from ..ports.cache_port import CachePort
 from ..config.settings import settings
 from ..config.constants import Constants
 from ..config.logging_config import log_with_run_id
-from ..adapters.cache_key import build_cache_key
+from ..adapters.cache_key import build_cache_key, build_artifact_cache_key, file_sha256
 
 
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=8)
+def _dataset_index(datasets_dir: str, mtime_ns: int) -> frozenset:
+    """
+    Nombres presentes en el directorio de datasets.
+    
+    El mtime del directorio forma parte de la key: al agregar, borrar o
+    renombrar un archivo cambia y el índice se reconstruye.
+    """
+    return frozenset(os.listdir(datasets_dir))
+
+
+@functools.lru_cache(maxsize=64)
+def _log_digest(path: str, mtime_ns: int, size: int) -> str:
+    """
+    SHA-256 de un log, memorizado mientras no cambien su mtime ni su tamaño.
+    
+    Así un hit del cache de reportes cuesta un stat y no releer el archivo.
+    """
+    return file_sha256(path)
+
+
 class AnalyzeLogUseCase:
     """
     Caso de uso principal para analizar logs con formato de salida configurable.
@@ -77,8 +104,16 @@ class AnalyzeLogUseCase:
         log_with_run_id(logger, logging.INFO, run_id, "Iniciando anรกlisis de logs")
         
         try:
+            # 0. Validar el archivo contra el índice y reutilizar el reporte
+            #    ya exportado si el contenido no cambió
+            log_path = self._resolve_log_path(request)
+            artifact_key = self._artifact_cache_key(request, log_path)
+            cached_response = self._cached_response(request, artifact_key)
+            if cached_response is not None:
+                return cached_response
+            
             # 1. Cargar texto del log
-            log_text = self._load_log_text(request, run_id)
+            log_text = self._load_log_text(log_path, run_id)
             
             log_with_run_id(
                 logger,
@@ -103,6 +138,10 @@ class AnalyzeLogUseCase:
             log_with_run_id(logger, logging.INFO, run_id, "Generando reporte con LLM")
             report_content = self._generate_report_with_llm(log_text, analysis_dict, run_id)
             
+            # El texto completo del log ya no se usa: liberarlo antes de la
+            # exportación (Excel/DOC), que es el pico de memoria del request
+            del log_text
+            
             # 4. Preparar estructura de reporte
             report_data = self._prepare_report_data(report_content, analysis_dict)
             
@@ -129,6 +168,15 @@ class AnalyzeLogUseCase:
                 f"Reporte generado exitosamente: {output_path}"
             )
             
+            if artifact_key is not None:
+                artifact_path = self._store_artifact(artifact_key, output_path, run_id)
+                if artifact_path is not None:
+                    self.cache.set(
+                        artifact_key,
+                        {'artifact_path': artifact_path, 'summary': analysis_dict.get('summary', {})},
+                        ttl_seconds=settings.CACHE_TTL_SECONDS
+                    )
+            
             # 6. Construir respuesta exitosa
             return AnalyzeResponse.success(
                 run_id=run_id,
@@ -139,15 +187,27 @@ class AnalyzeLogUseCase:
         
         except FileNotFoundError as e:
             log_with_run_id(logger, logging.ERROR, run_id, f"Archivo no encontrado: {e}")
-            return AnalyzeResponse.error(run_id=run_id, error_message=str(e))
+            return AnalyzeResponse.error(
+                run_id=run_id,
+                error_message=str(e),
+                error_code=ErrorCode.NOT_FOUND
+            )
         
         except ConnectionError as e:
             log_with_run_id(logger, logging.ERROR, run_id, f"Error de conexiรณn: {e}")
-            return AnalyzeResponse.error(run_id=run_id, error_message=str(e))
+            return AnalyzeResponse.error(
+                run_id=run_id,
+                error_message=str(e),
+                error_code=ErrorCode.CONNECTION
+            )
         
         except TimeoutError as e:
             log_with_run_id(logger, logging.ERROR, run_id, f"Timeout: {e}")
-            return AnalyzeResponse.error(run_id=run_id, error_message=str(e))
+            return AnalyzeResponse.error(
+                run_id=run_id,
+                error_message=str(e),
+                error_code=ErrorCode.TIMEOUT
+            )
         
         except Exception as e:
             log_with_run_id(logger, logging.ERROR, run_id, f"Error inesperado: {e}")
@@ -157,28 +217,263 @@ class AnalyzeLogUseCase:
                 error_message=f"Error interno del servidor: {str(e)}"
             )
     
-    def _load_log_text(self, request: AnalyzeRequest, run_id: str) -> str:
+    def execute_cached(self, request: AnalyzeRequest) -> Optional[AnalyzeResponse]:
         """
-        Carga el texto del log desde archivo.
+        Devuelve el reporte ya exportado para el mismo contenido, sin usar el LLM.
+        
+        Permite al entrypoint responder los hits sin esperar cupo del LLM.
+        
+        Args:
+            request: Solicitud con parámetros validados
+        
+        Returns:
+            Respuesta exitosa, o None si no hay hit (los errores los reporta execute)
+        """
+        if not settings.CACHE_ENABLED or self.cache is None:
+            return None
+        
+        try:
+            log_path = self._resolve_log_path(request)
+            return self._cached_response(request, self._artifact_cache_key(request, log_path))
+        except Exception as e:
+            log_with_run_id(logger, logging.DEBUG, request.run_id, f"Sin reporte cacheado: {e}")
+            return None
+    
+    def _cached_response(
+        self,
+        request: AnalyzeRequest,
+        artifact_key: Optional[str]
+    ) -> Optional[AnalyzeResponse]:
+        """
+        Arma la respuesta a partir del reporte cacheado, si existe.
+        
+        Args:
+            request: Solicitud (run_id y output_filename de destino)
+            artifact_key: Key del artefacto (None si no aplica cache)
+        
+        Returns:
+            Respuesta exitosa, o None si no hay hit válido
+        """
+        cached = self._get_cached_artifact(artifact_key, request.run_id)
+        if cached is None:
+            return None
+        
+        restored_path = self._restore_artifact(cached['artifact_path'], request)
+        if restored_path is None:
+            return None
+        
+        return AnalyzeResponse.success(
+            run_id=request.run_id,
+            output_path=restored_path,
+            output_format=request.output_format.value,
+            summary=cached['summary']
+        )
+    
+    def _resolve_log_path(self, request: AnalyzeRequest) -> Path:
+        """
+        Valida que el log pedido exista en el directorio de datasets.
+        
+        Usa un índice en memoria de los nombres del directorio (1 stat por
+        request en lugar de consultar el archivo).
         
         Args:
             request: Solicitud con input_log_filename
-            run_id: ID de ejecución para logging
         
         Returns:
-            Texto del log
+            Path del archivo de log
         
         Raises:
             FileNotFoundError: Si el archivo no existe
         """
-        # Leer desde archivo en datasets/
-        log_path = settings.DATASETS_DIR / request.input_log_filename
+        datasets_dir = str(settings.DATASETS_DIR)
+        try:
+            index = _dataset_index(datasets_dir, os.stat(datasets_dir).st_mtime_ns)
+        except FileNotFoundError:
+            index = frozenset()
         
-        if not log_path.exists():
+        if request.input_log_filename not in index:
             raise FileNotFoundError(
                 f"Archivo '{request.input_log_filename}' no existe en {settings.DATASETS_DIR}"
             )
         
+        return settings.DATASETS_DIR / request.input_log_filename
+    
+    def _artifact_cache_key(self, request: AnalyzeRequest, log_path: Path) -> Optional[str]:
+        """
+        Calcula la key del reporte exportado: (sha256 del log, modelo, formato).
+        
+        Args:
+            request: Solicitud con output_format
+            log_path: Path del archivo de log ya validado
+        
+        Returns:
+            Key del cache, o None si el cache está deshabilitado
+        """
+        if not settings.CACHE_ENABLED or self.cache is None:
+            return None
+        
+        stat = os.stat(log_path)
+        return build_artifact_cache_key(
+            file_digest=_log_digest(str(log_path), stat.st_mtime_ns, stat.st_size),
+            provider=settings.LLM_PROVIDER,
+            model=self._resolve_model_name(),
+            output_format=request.output_format.value
+        )
+    
+    def _get_cached_artifact(self, artifact_key: Optional[str], run_id: str) -> Optional[Dict]:
+        """
+        Busca un reporte ya exportado para el mismo contenido de log.
+        
+        Args:
+            artifact_key: Key del artefacto (None si no aplica cache)
+            run_id: ID de ejecución para logging
+        
+        Returns:
+            Diccionario con artifact_path y summary, o None si no hay hit válido
+        """
+        if artifact_key is None:
+            return None
+        
+        cached = self.cache.get(artifact_key)
+        if cached is None or not Path(cached.get('artifact_path', '')).is_file():
+            return None
+        
+        log_with_run_id(
+            logger,
+            logging.INFO,
+            run_id,
+            f"{Constants.LOG_CACHE_HIT}: reutilizando {cached['artifact_path']}"
+        )
+        return cached
+    
+    @staticmethod
+    def _artifact_path(artifact_key: str, suffix: str) -> Path:
+        """
+        Path direccionado por contenido de un reporte cacheado.
+        
+        Vive fuera de los directorios de cada run (que los nombra el cliente),
+        así otro request no puede sobrescribirlo.
+        
+        Args:
+            artifact_key: Key del artefacto
+            suffix: Extensión del reporte (con punto)
+        
+        Returns:
+            Path dentro de OUT_DIR/.artifacts
+        """
+        digest = hashlib.sha256(artifact_key.encode("utf-8")).hexdigest()
+        return settings.OUT_DIR / Constants.ARTIFACTS_DIR_NAME / f"{digest}{suffix}"
+    
+    def _store_artifact(self, artifact_key: str, output_path: str, run_id: str) -> Optional[str]:
+        """
+        Copia el reporte exportado a su path direccionado por contenido.
+        
+        Se copia a un temporal y se renombra, para que un hit concurrente
+        nunca lea una copia a medio escribir.
+        
+        Args:
+            artifact_key: Key del artefacto
+            output_path: Path del reporte recién exportado
+            run_id: ID de ejecución para logging
+        
+        Returns:
+            Path del artefacto, o None si no se pudo guardar (no se cachea)
+        """
+        artifact_path = self._artifact_path(artifact_key, Path(output_path).suffix)
+        tmp_path = None
+        try:
+            artifact_path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=artifact_path.parent, suffix=".tmp")
+            os.close(fd)
+            shutil.copyfile(output_path, tmp_path)
+            os.replace(tmp_path, artifact_path)
+            self._sweep_artifacts(artifact_path)
+            return str(artifact_path)
+        except OSError as e:
+            log_with_run_id(logger, logging.WARNING, run_id, f"No se pudo cachear el reporte: {e}")
+            if tmp_path is not None:
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
+            return None
+    
+    @staticmethod
+    def _sweep_artifacts(stored_path: Path) -> None:
+        """
+        Acota los reportes cacheados en disco.
+        
+        Las entradas del cache que los referencian expiran (TTL) o se
+        descartan (LRU), pero los archivos quedarían para siempre: se borran
+        los más viejos que CACHE_TTL_SECONDS y, si aún sobran, los menos
+        usados hasta dejar CACHE_MAX_ENTRIES. Los hits renuevan el mtime.
+        
+        Args:
+            stored_path: Artefacto recién guardado (se conserva siempre)
+        """
+        oldest_allowed = time.time() - settings.CACHE_TTL_SECONDS
+        expired = []
+        entries = []
+        with os.scandir(stored_path.parent) as it:
+            for entry in it:
+                if entry.path == str(stored_path):
+                    continue
+                try:
+                    mtime = entry.stat().st_mtime
+                except FileNotFoundError:
+                    continue
+                if mtime < oldest_allowed:
+                    expired.append(entry.path)
+                elif not entry.name.endswith(".tmp"):
+                    # Los temporales recientes son copias en curso de otro request
+                    entries.append((mtime, entry.path))
+        
+        entries.sort(reverse=True)
+        surplus = [path for _, path in entries[max(settings.CACHE_MAX_ENTRIES - 1, 0):]]
+        for path in expired + surplus:
+            try:
+                os.unlink(path)
+            except FileNotFoundError:
+                pass
+    
+    @staticmethod
+    def _restore_artifact(artifact_path: str, request: AnalyzeRequest) -> Optional[str]:
+        """
+        Copia un reporte cacheado al directorio del run que lo pidió.
+        
+        Args:
+            artifact_path: Path del artefacto cacheado
+            request: Solicitud (run_id y output_filename de destino)
+        
+        Returns:
+            Path absoluto del reporte en OUT_DIR/<run_id>/, o None si el
+            artefacto se borró entretanto (se regenera como en un miss)
+        """
+        output_dir = settings.OUT_DIR / request.run_id
+        output_dir.mkdir(parents=True, exist_ok=True)
+        output_path = output_dir / f"{request.output_filename}{Path(artifact_path).suffix}"
+        try:
+            shutil.copyfile(artifact_path, output_path)
+            # Renueva el mtime: el barrido descarta primero los menos usados
+            os.utime(artifact_path)
+        except FileNotFoundError:
+            return None
+        return str(output_path.absolute())
+    
+    def _load_log_text(self, log_path: Path, run_id: str) -> str:
+        """
+        Carga el texto del log desde archivo.
+        
+        Args:
+            log_path: Path del archivo de log ya validado
+            run_id: ID de ejecución para logging
+        
+        Returns:
+            Texto del log
+        
+        Raises:
+            FileNotFoundError: Si el archivo no existe
+        """
         log_with_run_id(
             logger,
             logging.INFO,
@@ -9,7 +9,12 @@ from dataclasses import dataclass
 from typing import Optional, Dict, Any
 from pathlib import Path
 
-from .enums import OutputFormat
+from .enums import OutputFormat, ErrorCode
+
+
+# Validación de AnalyzeRequest construida una sola vez (no por request)
+ANALYZE_REQUIRED_FIELDS = ('input_log_filename', 'output_filename', 'output_format')
+UNSAFE_FILENAME_CHARS_RE = re.compile(r'[^\w\-\.]')
 
 
 @dataclass
@@ -69,7 +74,7 @@ class AnalyzeRequest:
         name = os.path.basename(name)
         
         # Remover caracteres peligrosos (permitir alfanuméricos, guiones, guiones bajos y puntos)
-        name = re.sub(r'[^\w\-\.]', '_', name)
+        name = UNSAFE_FILENAME_CHARS_RE.sub('_', name)
         
         # Prevenir nombres de archivo ocultos
         if name.startswith('.'):
@@ -96,8 +101,7 @@ class AnalyzeRequest:
             ValueError: Si falta algún campo requerido o el formato es inválido
         """
         # Validar campos requeridos
-        required_fields = ['input_log_filename', 'output_filename', 'output_format']
-        missing = [field for field in required_fields if field not in data or data[field] is None]
+        missing = [field for field in ANALYZE_REQUIRED_FIELDS if data.get(field) is None]
         
         if missing:
             raise ValueError(f"Campos requeridos faltantes: {', '.join(missing)}")
@@ -134,6 +138,7 @@ class AnalyzeResponse:
     output_format: Optional[str] = None
     summary: Optional[Dict[str, Any]] = None
     errors: Optional[str] = None
+    error_code: Optional[ErrorCode] = None
     
     def to_dict(self) -> Dict[str, Any]:
         """
@@ -159,6 +164,9 @@ class AnalyzeResponse:
         if self.errors is not None:
             result['errors'] = self.errors
         
+        if self.error_code is not None:
+            result['error_code'] = self.error_code.value
+        
         return result
     
     @classmethod
@@ -194,7 +202,8 @@ class AnalyzeResponse:
     def error(
         cls,
         run_id: str,
-        error_message: str
+        error_message: str,
+        error_code: ErrorCode = ErrorCode.INTERNAL
     ) -> 'AnalyzeResponse':
         """
         Crea una respuesta de error.
@@ -202,6 +211,7 @@ class AnalyzeResponse:
         Args:
             run_id: Identificador de la ejecución
             error_message: Mensaje de error
+            error_code: Categoría del error (define el código HTTP)
         
         Returns:
             Instancia de AnalyzeResponse con status error
@@ -212,7 +222,8 @@ class AnalyzeResponse:
             output_path=None,
             output_format=None,
             summary=None,
-            errors=error_message
+            errors=error_message,
+            error_code=error_code
         )
 
 
@@ -16,6 +16,7 @@ class OutputFormat(str, Enum):
     EXCEL = "excel"
     TXT = "txt"
     MARKDOWN = "markdown"
+    ARROW = "arrow"
     
     @classmethod
     def is_valid(cls, value: str) -> bool:
@@ -41,3 +42,14 @@ class OutputFormat(str, Enum):
     def values(cls) -> list:
         """Retorna todos los valores válidos del enum"""
         return [fmt.value for fmt in cls]
+
+
+class ErrorCode(str, Enum):
+    """
+    Categorías de error de AnalyzeResponse.
+    La API las traduce a códigos HTTP sin inspeccionar el mensaje.
+    """
+    NOT_FOUND = "not_found"
+    TIMEOUT = "timeout"
+    CONNECTION = "connection"
+    INTERNAL = "internal"
@@ -5,28 +5,22 @@ Implementa AnalyzerPort con parsing basado en regex.
 
 import logging
 import re
-from typing import Dict, List, Optional
+import sys
+from typing import Dict, List, Optional, Tuple
 
+from ..model import LogEvent
 from ..ports import AnalyzerPort
 from ...config.constants import Constants
-
-
-logger = logging.getLogger(__name__)
-
-
-HEADER_RE = re.compile(
-    r"^(?P<ts>\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2})\s+"
-    r"(?P<level>ERROR|WARN|INFO)\s+\[(?P<thread>[^\]]+)\]\s+"
-    r"(?P<logger>[\w\.\$]+)\s+-\s+(?P<message>.*)$"
+from .patterns import (
+    BLANK_LINES_RE,
+    EXC_SCAN_RE,
+    FRAME_SCAN_RE,
+    HEADER_SCAN_RE,
+    OTHER_LINE_BREAKS_RE
 )
 
-EXC_RE = re.compile(
-    r"^(?P<exc>[a-zA-Z0-9\._$]+Exception|Error)(?::\s*(?P<excmsg>.*))?$"
-)
 
-FRAME_RE = re.compile(
-    r"^\s*at\s+(?P<where>[\w\.\$]+)\((?P<file>[^:]+):(?P<line>\d+)\)\s*$"
-)
+logger = logging.getLogger(__name__)
 
 
 class LogAnalyzer(AnalyzerPort):
@@ -44,105 +38,168 @@ class LogAnalyzer(AnalyzerPort):
         """
         logger.debug("Analizando log de %s caracteres", len(log_text))
 
-        lines = log_text.splitlines()
-        events: List[Dict] = []
-
-        current: Optional[Dict] = None
-        stack: List[str] = []
-
-        def flush() -> None:
-            """Procesa el evento acumulado actual"""
-            nonlocal current, stack
-            if not current:
-                return
-
-            exc = None
-            excmsg = None
-            top_frame = None
-
-            for ln in stack:
-                match = EXC_RE.match(ln.strip())
-                if match and not exc:
-                    exc = match.group("exc")
-                    excmsg = (match.group("excmsg") or "").strip() or None
-
-                frame_match = FRAME_RE.match(ln)
-                if frame_match and not top_frame:
-                    top_frame = {
-                        "where": frame_match.group("where"),
-                        "file": frame_match.group("file"),
-                        "line": int(frame_match.group("line"))
-                    }
-
-            current["exception"] = exc
-            current["exception_message"] = excmsg
-            current["top_frame"] = top_frame
-            current["raw_block"] = "\n".join(stack).strip() or None
-
-            events.append(current)
-            current = None
-            stack = []
-
-        for ln in lines:
-            header_match = HEADER_RE.match(ln)
-            if header_match:
-                flush()
-                current = header_match.groupdict()
-                stack = []
-            else:
-                if current is not None and ln.strip() != "":
-                    stack.append(ln)
-
-        flush()
-
-        errors = [event for event in events if event["level"] == Constants.LEVEL_ERROR]
-        warns = [event for event in events if event["level"] == Constants.LEVEL_WARN]
-
-        groups: Dict[str, Dict] = {}
+        # Normalizar saltos de línea para que ^/$ multilinea corten igual que
+        # splitlines(), sin armar la lista de líneas (sub no copia si no hay cambios)
+        log_text = OTHER_LINE_BREAKS_RE.sub("\n", log_text)
+
+        # 1. Una sola pasada del motor de regex para ubicar todos los headers
+        headers = list(HEADER_SCAN_RE.finditer(log_text))
+        ends = [match.start() for match in headers[1:]] + [len(log_text)]
+
+        # Clasificar errores y warnings en un único recorrido de los headers
+        level_error = Constants.LEVEL_ERROR
+        level_warn = Constants.LEVEL_WARN
+        error_idx: List[int] = []
+        warn_idx: List[int] = []
+        for i, match in enumerate(headers):
+            level = match["level"]
+            if level == level_error:
+                error_idx.append(i)
+            elif level == level_warn:
+                warn_idx.append(i)
+
+        # 2. Materializar solo los eventos que se usan: los que se devuelven
+        #    (con raw_block) y los errores (para agrupar). Los bloques INFO
+        #    fuera del recorte no se vuelven a escanear.
+        returned_idx = set(range(min(len(headers), Constants.MAX_EVENTS_IN_ANALYSIS)))
+        returned_idx.update(warn_idx[:Constants.MAX_WARNINGS_IN_ANALYSIS])
+
+        built: Dict[int, LogEvent] = {}
+
+        def event_at(i: int) -> LogEvent:
+            """Construye (una vez) el evento i a partir de su header y su bloque"""
+            event = built.get(i)
+            if event is None:
+                event = self._build_event(
+                    log_text, headers[i], ends[i], with_raw_block=i in returned_idx
+                )
+                built[i] = event
+            return event
+
+        events = [event_at(i) for i in range(min(len(headers), Constants.MAX_EVENTS_IN_ANALYSIS))]
+        warns = [event_at(i) for i in warn_idx[:Constants.MAX_WARNINGS_IN_ANALYSIS]]
+        errors = [event_at(i) for i in error_idx]
+
+        groups: Dict[Tuple[Optional[str], Optional[str], Optional[int]], Dict] = {}
         for event in errors:
-            key = self._make_error_key(event)
-            group = groups.setdefault(key, {
-                "count": 0,
-                "exception": event.get("exception"),
-                "top_frame": event.get("top_frame"),
-                "logger": event.get("logger"),
-                "samples": [],
-                "first_ts": event.get("ts"),
-                "last_ts": event.get("ts")
-            })
-            group["count"] += 1
-            group["last_ts"] = event.get("ts")
-            if len(group["samples"]) < Constants.MAX_SAMPLES_PER_GROUP:
-                group["samples"].append({
-                    "ts": event.get("ts"),
-                    "message": event.get("message"),
-                    "exception_message": event.get("exception_message")
-                })
+            self._add_to_groups(groups, event)
 
         return {
             "summary": {
-                "total_events": len(events),
-                "total_errors": len(errors),
-                "total_warnings": len(warns)
+                "total_events": len(headers),
+                "total_errors": len(error_idx),
+                "total_warnings": len(warn_idx)
             },
             "error_groups": list(groups.values()),
-            "warnings": warns[:Constants.MAX_WARNINGS_IN_ANALYSIS],
-            "events": events[:Constants.MAX_EVENTS_IN_ANALYSIS]
+            "warnings": [event.to_dict() for event in warns],
+            "events": [event.to_dict() for event in events]
         }
 
-    def _make_error_key(self, error: Dict) -> str:
+    def _add_to_groups(
+        self,
+        groups: Dict[Tuple[Optional[str], Optional[str], Optional[int]], Dict],
+        event: LogEvent
+    ) -> None:
+        """
+        Suma un evento de error a su grupo (creándolo al verlo por primera vez).
+
+        Key tupla (sin formatear strings) y sin construir el dict por defecto
+        en cada error: solo al ver un grupo nuevo.
+
+        Args:
+            groups: Grupos acumulados, indexados por _make_error_key
+            event: Evento de nivel ERROR
+        """
+        key = self._make_error_key(event)
+        group = groups.get(key)
+        if group is None:
+            group = groups[key] = {
+                "count": 0,
+                "exception": event.exception,
+                "top_frame": event.top_frame,
+                "logger": event.logger,
+                "samples": [],
+                "first_ts": event.timestamp,
+                "last_ts": event.timestamp
+            }
+        group["count"] += 1
+        group["last_ts"] = event.timestamp
+        # Se conservan las primeras muestras de cada grupo
+        if group["count"] <= Constants.MAX_SAMPLES_PER_GROUP:
+            group["samples"].append({
+                "ts": event.timestamp,
+                "message": event.message,
+                "exception_message": event.exception_message
+            })
+
+    def _build_event(
+        self,
+        log_text: str,
+        header: re.Match,
+        block_end: int,
+        with_raw_block: bool
+    ) -> LogEvent:
+        """
+        Construye un evento a partir de su header y del bloque que le sigue.
+
+        Args:
+            log_text: Texto completo del log (con saltos normalizados a \\n)
+            header: Match de HEADER_SCAN_RE
+            block_end: Posición donde empieza el siguiente header (o fin del texto)
+            with_raw_block: Si True, incluye el bloque crudo sin líneas vacías
+
+        Returns:
+            LogEvent del bloque (se pasa a dict solo al devolver el análisis)
+        """
+        block_start = header.end()
+
+        exc_match = EXC_SCAN_RE.search(log_text, block_start, block_end)
+        if exc_match:
+            exception = sys.intern(exc_match.group("exc"))
+            exception_message = (exc_match.group("excmsg") or "").strip() or None
+        else:
+            exception = None
+            exception_message = None
+
+        frame_match = FRAME_SCAN_RE.search(log_text, block_start, block_end)
+        top_frame = {
+            "where": frame_match.group("where"),
+            "file": frame_match.group("file"),
+            "line": int(frame_match.group("line"))
+        } if frame_match else None
+
+        raw_block = None
+        if with_raw_block:
+            raw_block = BLANK_LINES_RE.sub("", log_text[block_start:block_end].strip()) or None
+
+        # Valores con pocas variantes en todo el log: se comparte un único str
+        return LogEvent(
+            timestamp=header.group("ts"),
+            level=sys.intern(header.group("level")),
+            thread=sys.intern(header.group("thread")),
+            logger=sys.intern(header.group("logger")),
+            message=header.group("message"),
+            exception=exception,
+            exception_message=exception_message,
+            top_frame=top_frame,
+            raw_block=raw_block
+        )
+
+    def _make_error_key(
+        self,
+        error: LogEvent
+    ) -> Tuple[Optional[str], Optional[str], Optional[int]]:
         """
         Genera una clave para agrupar errores similares.
 
         Args:
-            error: Diccionario con informacion del error
+            error: Evento de nivel ERROR
 
         Returns:
-            Clave identificadora del grupo
+            Tupla (excepcion, where del top frame, linea del top frame)
         """
-        exc = error.get("exception")
-        top_frame = error.get("top_frame") or {}
-        where = top_frame.get("where")
-        line = top_frame.get("line")
+        top_frame = error.top_frame
+        if top_frame is None:
+            return (error.exception, None, None)
 
-        return f"{exc}|{where}|{line}"
+        return (error.exception, top_frame["where"], top_frame["line"])
@@ -0,0 +1,37 @@
+"""
+Expresiones regulares del dominio log_analyzer.
+
+Se compilan una sola vez, al importar el módulo; el analizador (y cualquier
+otro consumidor) las importa desde aquí en lugar de compilar las propias.
+"""
+
+import re
+
+
+# Patrones multilinea para recorrer el texto completo sin partirlo en líneas.
+# EXC_SCAN_RE y FRAME_SCAN_RE ignoran espacios en los extremos de la línea
+# ([^\S\n] = espacio que no cruza de línea).
+HEADER_SCAN_RE = re.compile(
+    r"^(?P<ts>\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2})[^\S\n]+"
+    r"(?P<level>ERROR|WARN|INFO)[^\S\n]+\[(?P<thread>[^\]\n]+)\][^\S\n]+"
+    r"(?P<logger>[\w\.\$]+)[^\S\n]+-[^\S\n]+(?P<message>.*)$",
+    re.MULTILINE
+)
+
+EXC_SCAN_RE = re.compile(
+    r"^[^\S\n]*(?P<exc>[a-zA-Z0-9\._$]+Exception|Error)"
+    r"(?::[^\S\n]*(?P<excmsg>.*?))?[^\S\n]*$",
+    re.MULTILINE
+)
+
+FRAME_SCAN_RE = re.compile(
+    r"^[^\S\n]*at[^\S\n]+(?P<where>[\w\.\$]+)\((?P<file>[^:\n]+):(?P<line>\d+)\)[^\S\n]*$",
+    re.MULTILINE
+)
+
+# Separadores de línea (además de \n) que reconoce str.splitlines();
+# \r\n cuenta como un único salto
+OTHER_LINE_BREAKS_RE = re.compile(r"\r\n?|[\x0b\x0c\x1c-\x1e\x85\u2028\u2029]")
+
+# Líneas vacías o solo con espacios dentro de un bloque ya recortado
+BLANK_LINES_RE = re.compile(r"\n[^\S\n]*(?=\n)")
@@ -63,23 +63,72 @@ class ReportArtifact:
             raise ValueError("El path del reporte no puede estar vacío")
 
 
-@dataclass
 class LogEvent:
-    """Representa un evento individual parseado del log"""
-    timestamp: str
-    level: str
-    thread: str
-    logger: str
-    message: str
-    exception: Optional[str] = None
-    exception_message: Optional[str] = None
-    top_frame: Optional[Dict] = None
-    raw_block: Optional[str] = None
+    """
+    Representa un evento individual parseado del log.
+
+    Clase con __slots__ escritos a mano: dataclass(slots=True) requiere
+    Python 3.10 y un dataclass no admite __slots__ junto con valores por defecto.
+    """
+    __slots__ = (
+        "timestamp", "level", "thread", "logger", "message",
+        "exception", "exception_message", "top_frame", "raw_block"
+    )
+
+    def __init__(
+        self,
+        timestamp: str,
+        level: str,
+        thread: str,
+        logger: str,
+        message: str,
+        exception: Optional[str] = None,
+        exception_message: Optional[str] = None,
+        top_frame: Optional[Dict] = None,
+        raw_block: Optional[str] = None
+    ):
+        self.timestamp = timestamp
+        self.level = level
+        self.thread = thread
+        self.logger = logger
+        self.message = message
+        self.exception = exception
+        self.exception_message = exception_message
+        self.top_frame = top_frame
+        self.raw_block = raw_block
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.__slots__)
+        return f"LogEvent({fields})"
+
+    def __eq__(self, other) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self.__slots__)
+
+    __hash__ = None
+
+    def to_dict(self) -> Dict:
+        """Convierte el evento al formato de dict del análisis (clave 'ts')"""
+        return {
+            "ts": self.timestamp,
+            "level": self.level,
+            "thread": self.thread,
+            "logger": self.logger,
+            "message": self.message,
+            "exception": self.exception,
+            "exception_message": self.exception_message,
+            "top_frame": self.top_frame,
+            "raw_block": self.raw_block
+        }
 
 
 @dataclass
 class ErrorGroup:
     """Grupo de errores similares (misma excepción + ubicación)"""
+    __slots__ = (
+        "count", "exception", "top_frame", "logger", "samples", "first_ts", "last_ts"
+    )
     count: int
     exception: Optional[str]
     top_frame: Optional[Dict]
@@ -5,6 +5,8 @@ Contiene la lógica de negocio principal.
 
 import json
 import logging
+import os
+from concurrent.futures import Executor
 from typing import Optional, List, Dict
 from uuid import uuid4
 
@@ -28,17 +30,21 @@ class ListLogsUseCase:
     Caso de uso: Listar archivos de logs disponibles.
     
     Flujo:
-    1. Consultar directorio de datasets
+    1. Consultar directorio de datasets (o cache si el directorio no cambió)
     2. Retornar lista de archivos .txt con metadatos
     """
     
-    def __init__(self, log_reader: LogReaderPort):
+    def __init__(self, log_reader: LogReaderPort, cache: Optional[CachePort] = None):
         self.log_reader = log_reader
+        self.cache = cache
     
     def execute(self, datasets_dir: str) -> Dict[str, any]:
         """
         Ejecuta el caso de uso de listado.
         
+        El listado se cachea con TTL corto y con el mtime del directorio en la
+        key, así agregar, borrar o renombrar un log invalida la entrada.
+        
         Args:
             datasets_dir: Ruta del directorio de datasets
         
@@ -52,15 +58,33 @@ class ListLogsUseCase:
         logger.info(f"Listando logs en {datasets_dir}")
         
         try:
+            cache_key = None
+            if settings.CACHE_ENABLED and self.cache is not None:
+                mtime_ns = os.stat(datasets_dir).st_mtime_ns
+                cache_key = f"datasets:{datasets_dir}:{mtime_ns}"
+                cached = self.cache.get(cache_key)
+                if cached is not None:
+                    logger.debug(f"{Constants.LOG_CACHE_HIT}: listado de {datasets_dir}")
+                    return cached
+            
             # Obtener lista de archivos del log reader
             log_files = self.log_reader.list_logs(datasets_dir)
             
             logger.info(f"Se encontraron {len(log_files)} archivos de logs")
             
-            return {
+            result = {
                 "files": log_files,
                 "count": len(log_files)
             }
+            
+            if cache_key is not None:
+                self.cache.set(
+                    cache_key,
+                    result,
+                    ttl_seconds=settings.DATASETS_CACHE_TTL_SECONDS
+                )
+            
+            return result
         
         except Exception as e:
             logger.error(f"Error listando logs: {e}")
@@ -163,6 +187,10 @@ class GenerateReportUseCase:
         log_with_run_id(logger, logging.INFO, run_id, Constants.LOG_GENERATING_REPORT)
         report_markdown = self._get_or_generate_report(prompt, log_text, run_id)
         
+        # El log y el prompt ya no se usan: liberarlos antes de escribir los
+        # reportes (si el log se leyó de log_path, esta es la única referencia)
+        del log_text, prompt
+        
         # 5. Escribir archivos de salida
         log_with_run_id(logger, logging.INFO, run_id, Constants.LOG_WRITING_OUTPUT)
         
@@ -340,7 +368,8 @@ class DownloadReportUseCase:
         llm: LLMPort,
         report_writer: ReportWriterPort,
         cache: Optional[CachePort] = None,
-        max_files: int = 10
+        max_files: int = 10,
+        executor: Optional[Executor] = None
     ):
         self.log_reader = log_reader
         self.analyzer = analyzer
@@ -348,6 +377,8 @@ class DownloadReportUseCase:
         self.report_writer = report_writer
         self.cache = cache
         self.max_files = max_files
+        # Pool para leer los archivos en paralelo (None = lectura en serie)
+        self.executor = executor
         self.generate_case = GenerateReportUseCase(
             log_reader=log_reader,
             analyzer=analyzer,
@@ -459,6 +490,11 @@ class DownloadReportUseCase:
         
         if not files or len(files) == 0:
             raise ValueError("Debe especificar al menos un archivo")
+        
+        # Solo nombres dentro del directorio de datasets (sin rutas)
+        for filename in files:
+            if not filename or os.path.basename(filename) != filename:
+                raise ValueError(f"Nombre de archivo inválido: {filename}")
     
     def _read_and_combine_logs(self, files: List[str], datasets_dir: str) -> str:
         """
@@ -471,21 +507,22 @@ class DownloadReportUseCase:
         Returns:
             Todo el contenido combinado
         """
-        combined = ""
-        for filename in files:
-            from pathlib import Path
-            file_path = Path(datasets_dir) / filename
-            content = self.log_reader.read_log(str(file_path))
-            
-            # Agregar separador entre archivos si hay más de uno
-            if combined:
-                combined += f"\n\n--- Archivo: {filename} ---\n\n"
-            else:
-                combined += f"--- Archivo: {filename} ---\n\n"
-            
-            combined += content
+        from pathlib import Path
+        paths = [str(Path(datasets_dir) / filename) for filename in files]
+        
+        # Lecturas independientes (I/O): en paralelo si hay pool, conservando el orden
+        if self.executor is not None and len(paths) > 1:
+            contents = list(self.executor.map(self.log_reader.read_log, paths))
+        else:
+            contents = [self.log_reader.read_log(path) for path in paths]
+        
+        # Separador antes de cada archivo (con línea en blanco extra a partir del segundo)
+        parts = []
+        for index, (filename, content) in enumerate(zip(files, contents)):
+            prefix = "\n\n" if index else ""
+            parts.append(f"{prefix}--- Archivo: {filename} ---\n\n{content}")
         
-        return combined
+        return "".join(parts)
     
     def _get_formatted_report(
         self,
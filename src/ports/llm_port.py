@@ -32,3 +32,17 @@ class LLMPort(ABC):
             Exception: Otros errores de generación
         """
         pass
+
+    def warm_up(self) -> None:
+        """
+        Precalienta conexiones y/o modelo antes del primer request.
+        Por defecto no hace nada.
+        """
+        pass
+
+    def close(self) -> None:
+        """
+        Libera recursos asociados al cliente (p.ej. conexiones HTTP).
+        Por defecto no hace nada.
+        """
+        pass
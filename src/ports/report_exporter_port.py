@@ -10,7 +10,8 @@ from typing import Dict, Optional
 class ReportExporterPort(ABC):
     """
     Interfaz para exporters de reportes.
-    Cada implementación exporta a un formato específico.
+    Cada implementación exporta a un formato específico y no guarda estado
+    entre llamadas: ReportExporterFactory comparte una instancia por formato.
     """
     
     @abstractmethod
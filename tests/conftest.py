@@ -0,0 +1,16 @@
+import sys
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def reset_analyze_rate_limiter():
+    """
+    Reinicia el rate limiter de /analyze entre tests.
+    Todos los test clients comparten 127.0.0.1, así que sin esto el
+    resultado dependería del orden de ejecución.
+    """
+    api = sys.modules.get("app.api")
+    if api is not None:
+        api.ANALYZE_RATE_LIMITER.reset()
+    yield
@@ -2,8 +2,10 @@
 Contract tests for ports and their adapters.
 """
 
+from src.adapters.cache_file import FileCache
 from src.adapters.cache_memory import MemoryCache
 from src.adapters.llm_anthropic import AnthropicLLM
+from src.adapters.llm_cached import CachedLLM
 from src.adapters.llm_google import GoogleLLM
 from src.adapters.llm_ollama import OllamaLLM
 from src.adapters.llm_openai import OpenAILLM
@@ -14,12 +16,13 @@ from src.ports.report_writer_port import ReportWriterPort
 
 
 def test_llm_adapters_implement_port():
-    for adapter_cls in (OllamaLLM, OpenAILLM, AnthropicLLM, GoogleLLM):
+    for adapter_cls in (OllamaLLM, OpenAILLM, AnthropicLLM, GoogleLLM, CachedLLM):
         assert issubclass(adapter_cls, LLMPort)
 
 
 def test_cache_adapter_implements_port():
-    assert issubclass(MemoryCache, CachePort)
+    for adapter_cls in (MemoryCache, FileCache):
+        assert issubclass(adapter_cls, CachePort)
 
 
 def test_report_writer_implements_port():
@@ -82,3 +82,104 @@ def test_analyze_requires_input(monkeypatch):
     payload = response.get_json()
     assert payload["status"] == "error"
     assert "log_filename" in payload["error"]
+
+
+def test_analyze_returns_429_when_llm_is_busy(monkeypatch):
+    import threading
+
+    busy = threading.BoundedSemaphore(1)
+    busy.acquire()
+    monkeypatch.setattr(api_module, "LLM_SEMAPHORE", busy)
+
+    api_module.app.testing = True
+    client = api_module.app.test_client()
+
+    response = client.post(
+        "/analyze",
+        json={
+            "input_log_filename": "app.txt",
+            "output_filename": "informe",
+            "output_format": "markdown",
+        },
+    )
+
+    assert response.status_code == 429
+    assert response.headers["Retry-After"] == "60"
+
+
+def test_analyze_serves_cached_report_while_llm_is_busy(monkeypatch, tmp_path):
+    import threading
+
+    from src.domain.dtos import AnalyzeResponse
+
+    report = tmp_path / "informe.md"
+    report.write_text("# cacheado", encoding="utf-8")
+
+    class CachedUseCase:
+        def execute_cached(self, analyze_request):
+            return AnalyzeResponse.success(
+                run_id=analyze_request.run_id,
+                output_path=str(report),
+                output_format="markdown",
+                summary={}
+            )
+
+        def execute(self, analyze_request):
+            raise AssertionError("un hit no debe llegar al LLM")
+
+    busy = threading.BoundedSemaphore(1)
+    busy.acquire()
+    monkeypatch.setattr(api_module, "LLM_SEMAPHORE", busy)
+    monkeypatch.setattr(api_module, "get_analyze_use_case", lambda: CachedUseCase())
+
+    api_module.app.testing = True
+    client = api_module.app.test_client()
+
+    response = client.post(
+        "/analyze",
+        json={
+            "input_log_filename": "app.txt",
+            "output_filename": "informe",
+            "output_format": "markdown",
+        },
+    )
+
+    assert response.status_code == 200
+    assert response.data == b"# cacheado"
+
+
+def test_analyze_rejects_non_object_json_body():
+    api_module.app.testing = True
+    client = api_module.app.test_client()
+
+    response = client.post(
+        "/analyze",
+        data="[1, 2",
+        content_type="application/json",
+    )
+
+    assert response.status_code == 400
+    assert response.get_json()["message"] == "Body JSON inválido"
+
+
+def test_lazy_singleton_builds_once_under_concurrent_calls():
+    import threading
+    import time
+
+    calls = []
+
+    def factory():
+        calls.append(1)
+        time.sleep(0.05)
+        return object()
+
+    getter = api_module._lazy_singleton(factory)
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(getter())) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 1
+    assert len(set(map(id, results))) == 1
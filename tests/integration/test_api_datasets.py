@@ -113,3 +113,22 @@ def test_datasets_endpoint_sorted_files():
                 file_names = [f["name"] for f in data["files"]]
                 assert file_names == sorted(file_names)
 
+
+
+def test_datasets_endpoint_returns_304_for_matching_etag():
+    """Debe responder 304 sin body si el listado no cambió"""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        (Path(tmp_dir) / "app.txt").write_text("app logs")
+
+        app = create_app()
+
+        with patch('app.api.settings.DATASETS_DIR', tmp_dir):
+            with app.test_client() as client:
+                first = client.get('/datasets')
+                etag = first.headers["ETag"]
+
+                second = client.get('/datasets', headers={"If-None-Match": etag})
+
+                assert first.status_code == 200
+                assert second.status_code == 304
+                assert second.data == b""
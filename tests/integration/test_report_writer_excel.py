@@ -2,14 +2,22 @@ import sys
 from pathlib import Path
 from tempfile import TemporaryDirectory
 
+import pytest
 from openpyxl import load_workbook
 
 sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
 
+from src.adapters import report_writer_excel
 from src.adapters.report_writer_excel import ExcelReportWriter
 
 
-def test_excel_writer_creates_formatted_report():
+@pytest.mark.parametrize("use_xlsxwriter", [True, False])
+def test_excel_writer_creates_formatted_report(monkeypatch, use_xlsxwriter):
+    if use_xlsxwriter:
+        pytest.importorskip("xlsxwriter")
+    else:
+        monkeypatch.setattr(report_writer_excel, "_import_xlsxwriter", lambda: None)
+
     analysis = {
         "summary": {
             "total_events": 2,
@@ -29,7 +37,7 @@ def test_excel_writer_creates_formatted_report():
             {
                 "ts": "2026-02-13 10:01:00",
                 "logger": "com.example",
-                "message": "warn"
+                "message": "http://svc/api timed out"
             }
         ]
     }
@@ -45,3 +53,11 @@ def test_excel_writer_creates_formatted_report():
         header_cell = summary_sheet.cell(row=1, column=1)
         assert header_cell.font.bold is True
         assert summary_sheet.column_dimensions["A"].width >= 12
+
+        errors_sheet = workbook["error_groups"]
+        assert errors_sheet.cell(row=2, column=1).value == "NullPointerException"
+        assert errors_sheet.cell(row=2, column=1).border.left.style == "thin"
+
+        warnings_sheet = workbook["warnings"]
+        assert warnings_sheet.cell(row=2, column=3).value == "http://svc/api timed out"
+        assert warnings_sheet.cell(row=2, column=3).hyperlink is None
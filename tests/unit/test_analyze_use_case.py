@@ -0,0 +1,208 @@
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from typing import Dict
+
+import pytest
+
+from src.domain.analyze_use_case import AnalyzeLogUseCase
+from src.domain.dtos import AnalyzeRequest
+from src.domain.enums import OutputFormat, ErrorCode
+from src.config.settings import settings
+
+
+class FakeLogReader:
+    def read_log(self, source: str) -> str:
+        return Path(source).read_text(encoding="utf-8")
+
+
+class FakeAnalyzer:
+    def analyze(self, log_text: str) -> Dict:
+        return {
+            "summary": {"total_events": 1, "total_errors": 0, "total_warnings": 0},
+            "error_groups": [],
+            "warnings": [],
+            "events": []
+        }
+
+
+class FakeLLM:
+    def __init__(self):
+        self.calls = 0
+
+    def generate_text(self, prompt: str, system_prompt: str = None) -> str:
+        self.calls += 1
+        return "# report"
+
+
+@pytest.fixture
+def datasets_dir(tmp_path, monkeypatch):
+    datasets = tmp_path / "datasets"
+    datasets.mkdir()
+    (datasets / "app.txt").write_text("2026-02-13 08:30:15 INFO [main] a.B - ok", encoding="utf-8")
+    monkeypatch.setattr(settings, "DATASETS_DIR", datasets)
+    monkeypatch.setattr(settings, "OUT_DIR", tmp_path / "out")
+    monkeypatch.setattr(settings, "CACHE_ENABLED", False)
+    return datasets
+
+
+def _build_use_case(llm=None):
+    return AnalyzeLogUseCase(
+        log_reader=FakeLogReader(),
+        analyzer=FakeAnalyzer(),
+        llm=llm or FakeLLM()
+    )
+
+
+def test_execute_writes_report(datasets_dir):
+    use_case = _build_use_case()
+    request = AnalyzeRequest(
+        input_log_filename="app.txt",
+        output_filename="informe",
+        output_format=OutputFormat.MARKDOWN,
+        run_id="run1"
+    )
+
+    response = use_case.execute(request)
+
+    assert response.status == "success"
+    assert Path(response.output_path).exists()
+
+
+def test_execute_missing_file_returns_error(datasets_dir):
+    use_case = _build_use_case()
+    request = AnalyzeRequest(
+        input_log_filename="missing.txt",
+        output_filename="informe",
+        output_format=OutputFormat.MARKDOWN,
+        run_id="run2"
+    )
+
+    response = use_case.execute(request)
+
+    assert response.status == "error"
+    assert "missing.txt" in response.errors
+    assert response.error_code == ErrorCode.NOT_FOUND
+
+
+def test_execute_reuses_exported_report_for_same_content(datasets_dir, monkeypatch):
+    from src.adapters.cache_memory import MemoryCache
+
+    monkeypatch.setattr(settings, "CACHE_ENABLED", True)
+    llm = FakeLLM()
+    use_case = AnalyzeLogUseCase(
+        log_reader=FakeLogReader(),
+        analyzer=FakeAnalyzer(),
+        llm=llm,
+        cache=MemoryCache()
+    )
+
+    first = use_case.execute(AnalyzeRequest(
+        input_log_filename="app.txt",
+        output_filename="informe",
+        output_format=OutputFormat.MARKDOWN,
+        run_id="run3"
+    ))
+    second = use_case.execute(AnalyzeRequest(
+        input_log_filename="app.txt",
+        output_filename="otro",
+        output_format=OutputFormat.MARKDOWN,
+        run_id="run4"
+    ))
+
+    assert second.status == "success"
+    assert Path(second.output_path) == settings.OUT_DIR / "run4" / "otro.md"
+    assert Path(second.output_path).read_text(encoding="utf-8") == Path(first.output_path).read_text(encoding="utf-8")
+    assert llm.calls == 1
+
+
+def test_execute_cached_answers_only_hits_without_calling_llm(datasets_dir, monkeypatch):
+    from src.adapters.cache_memory import MemoryCache
+
+    monkeypatch.setattr(settings, "CACHE_ENABLED", True)
+    llm = FakeLLM()
+    use_case = AnalyzeLogUseCase(
+        log_reader=FakeLogReader(),
+        analyzer=FakeAnalyzer(),
+        llm=llm,
+        cache=MemoryCache()
+    )
+    request_args = dict(input_log_filename="app.txt", output_format=OutputFormat.MARKDOWN)
+
+    assert use_case.execute_cached(AnalyzeRequest(output_filename="informe", run_id="run12", **request_args)) is None
+    use_case.execute(AnalyzeRequest(output_filename="informe", run_id="run12", **request_args))
+    hit = use_case.execute_cached(AnalyzeRequest(output_filename="otro", run_id="run13", **request_args))
+
+    assert hit.status == "success"
+    assert Path(hit.output_path) == settings.OUT_DIR / "run13" / "otro.md"
+    assert llm.calls == 1
+    assert use_case.execute_cached(AnalyzeRequest(
+        input_log_filename="missing.txt", output_filename="x", output_format=OutputFormat.MARKDOWN
+    )) is None
+
+
+def test_cached_report_is_not_affected_by_overwriting_the_original_run(datasets_dir, monkeypatch):
+    from src.adapters.cache_memory import MemoryCache
+
+    monkeypatch.setattr(settings, "CACHE_ENABLED", True)
+    llm = FakeLLM()
+    use_case = AnalyzeLogUseCase(
+        log_reader=FakeLogReader(),
+        analyzer=FakeAnalyzer(),
+        llm=llm,
+        cache=MemoryCache()
+    )
+    request_args = dict(input_log_filename="app.txt", output_format=OutputFormat.MARKDOWN)
+
+    first = use_case.execute(AnalyzeRequest(output_filename="informe", run_id="run7", **request_args))
+    # Otro cliente reutiliza run_id/output_filename y pisa el archivo del primer run
+    Path(first.output_path).write_text("otro contenido", encoding="utf-8")
+    second = use_case.execute(AnalyzeRequest(output_filename="informe", run_id="run8", **request_args))
+
+    assert Path(second.output_path).read_text(encoding="utf-8") == "# report"
+    assert llm.calls == 1
+
+
+def test_exported_report_cache_is_bounded_on_disk(datasets_dir, monkeypatch):
+    from src.adapters.cache_memory import MemoryCache
+
+    monkeypatch.setattr(settings, "CACHE_ENABLED", True)
+    monkeypatch.setattr(settings, "CACHE_MAX_ENTRIES", 1)
+    (datasets_dir / "other.txt").write_text("2026-02-13 08:30:16 INFO [main] a.B - otro", encoding="utf-8")
+    use_case = AnalyzeLogUseCase(
+        log_reader=FakeLogReader(),
+        analyzer=FakeAnalyzer(),
+        llm=FakeLLM(),
+        cache=MemoryCache()
+    )
+    request_args = dict(output_filename="informe", output_format=OutputFormat.MARKDOWN)
+
+    artifacts_dir = settings.OUT_DIR / ".artifacts"
+
+    use_case.execute(AnalyzeRequest(input_log_filename="app.txt", run_id="run9", **request_args))
+    app_artifacts = set(artifacts_dir.iterdir())
+    use_case.execute(AnalyzeRequest(input_log_filename="other.txt", run_id="run10", **request_args))
+
+    assert len(list(artifacts_dir.iterdir())) == 1
+    assert not app_artifacts & set(artifacts_dir.iterdir())
+
+    # El artefacto de app.txt se barrió: su entrada en cache cuenta como miss
+    again = use_case.execute(AnalyzeRequest(input_log_filename="app.txt", run_id="run11", **request_args))
+
+    assert again.status == "success"
+    assert Path(again.output_path).read_text(encoding="utf-8") == "# report"
+    assert set(artifacts_dir.iterdir()) == app_artifacts
+
+
+def test_execute_sees_files_added_after_first_lookup(datasets_dir):
+    use_case = _build_use_case()
+    request_args = dict(output_filename="informe", output_format=OutputFormat.MARKDOWN)
+
+    missing = use_case.execute(AnalyzeRequest(input_log_filename="new.txt", run_id="run5", **request_args))
+    (datasets_dir / "new.txt").write_text("2026-02-13 08:30:15 INFO [main] a.B - ok", encoding="utf-8")
+    found = use_case.execute(AnalyzeRequest(input_log_filename="new.txt", run_id="run6", **request_args))
+
+    assert missing.status == "error"
+    assert found.status == "success"
@@ -0,0 +1,41 @@
+"""
+Tests unitarios para el cache en disco.
+"""
+
+import shutil
+import threading
+
+from src.adapters.cache_file import FileCache
+
+
+def test_concurrent_set_of_same_key_does_not_fail(tmp_path):
+    """Varios threads guardando la misma key no deben pisarse el temporal"""
+    cache = FileCache(tmp_path)
+    errors = []
+
+    def store(value):
+        try:
+            for _ in range(20):
+                cache.set("k", value, ttl_seconds=60)
+        except Exception as e:  # pragma: no cover - solo si hay carrera
+            errors.append(e)
+
+    threads = [threading.Thread(target=store, args=(f"v{i}",)) for i in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    assert cache.get("k") in {f"v{i}" for i in range(8)}
+    assert list(tmp_path.glob("*.tmp")) == []
+
+
+def test_set_write_error_is_logged_not_raised(tmp_path):
+    """Si no se puede escribir, set no debe propagar el error"""
+    cache = FileCache(tmp_path / "cache")
+    shutil.rmtree(tmp_path / "cache")
+
+    cache.set("k", "v")
+
+    assert cache.get("k") is None
@@ -0,0 +1,34 @@
+import hashlib
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from src.adapters.cache_key import HASH_CHUNK_SIZE, build_cache_key, file_sha256
+
+
+def test_build_cache_key_is_deterministic_and_config_sensitive():
+    key = build_cache_key("log", provider="ollama", model="mistral", system_prompt="sys")
+
+    assert key == build_cache_key("log", provider="ollama", model="mistral", system_prompt="sys")
+    assert len(key) == 64
+    assert key != build_cache_key("log", provider="ollama", model="llama3", system_prompt="sys")
+    assert key != build_cache_key("log2", provider="ollama", model="mistral", system_prompt="sys")
+    assert key != build_cache_key("log", provider="ollama", model="mistral")
+
+
+def test_build_cache_key_matches_for_str_and_bytes_across_chunks():
+    text = "línea ñ\n" * 300_000
+
+    key_str = build_cache_key(text, provider="ollama", model="mistral")
+    key_bytes = build_cache_key(text.encode("utf-8"), provider="ollama", model="mistral")
+
+    assert key_str == key_bytes
+
+
+def test_file_sha256_hashes_across_chunks(tmp_path):
+    data = b"x" * (HASH_CHUNK_SIZE + 123)
+    path = tmp_path / "app.log"
+    path.write_bytes(data)
+
+    assert file_sha256(str(path)) == hashlib.sha256(data).hexdigest()
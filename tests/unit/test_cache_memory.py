@@ -13,3 +13,52 @@ def test_cache_memory_respects_ttl():
     assert cache.get("key") == "value"
     time.sleep(1.1)
     assert cache.get("key") is None
+
+
+def test_cache_memory_evicts_least_recently_used_entry_when_full():
+    cache = MemoryCache(max_entries=2)
+    cache.set("hot", "a")
+    cache.set("cold", "b")
+    cache.get("hot")
+
+    cache.set("new", "c")
+
+    assert cache.get("hot") == "a"
+    assert cache.get("cold") is None
+    assert cache.get("new") == "c"
+
+
+def test_cache_memory_ttl_ignores_wall_clock_jumps(monkeypatch):
+    cache = MemoryCache()
+    cache.set("key", "value", ttl_seconds=60)
+
+    monkeypatch.setattr(time, "time", lambda: 10**12)
+
+    assert cache.get("key") == "value"
+
+
+def test_cache_memory_is_safe_under_concurrent_access():
+    import threading
+
+    cache = MemoryCache(max_entries=8)
+    errors = []
+
+    def worker(offset):
+        try:
+            for i in range(2000):
+                key = f"k{(i + offset) % 16}"
+                cache.set(key, i, ttl_seconds=0 if i % 3 == 0 else 60)
+                cache.get(key)
+                if i % 5 == 0:
+                    cache.invalidate(key)
+        except Exception as e:  # pragma: no cover - solo si hay carrera
+            errors.append(e)
+
+    threads = [threading.Thread(target=worker, args=(n,)) for n in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    assert len(cache._store) <= 8
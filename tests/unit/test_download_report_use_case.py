@@ -0,0 +1,32 @@
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from src.domain.use_cases import DownloadReportUseCase
+from src.adapters.log_reader_fs import FileSystemLogReader
+
+
+def _build_use_case(executor=None):
+    return DownloadReportUseCase(
+        log_reader=FileSystemLogReader(),
+        analyzer=None,
+        llm=None,
+        report_writer=None,
+        executor=executor
+    )
+
+
+def test_read_and_combine_logs_keeps_file_order_with_executor(tmp_path):
+    files = ["b.txt", "a.txt", "c.txt"]
+    for name in files:
+        (tmp_path / name).write_text(f"contenido {name}")
+
+    serial = _build_use_case()._read_and_combine_logs(files, str(tmp_path))
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        parallel = _build_use_case(executor)._read_and_combine_logs(files, str(tmp_path))
+
+    assert parallel == serial
+    assert serial.startswith("--- Archivo: b.txt ---\n\ncontenido b.txt")
+    assert "contenido b.txt\n\n--- Archivo: a.txt ---\n\ncontenido a.txt" in serial
@@ -0,0 +1,46 @@
+"""
+Tests unitarios para el aplanado de filas de exportación.
+"""
+
+from src.adapters.export_rows import ErrorRow, WarningRow, flatten
+
+
+class TestFlatten:
+    """Tests para flatten()"""
+
+    def test_flatten_applies_defaults_and_location(self):
+        """Debe resolver valores por defecto y la ubicación del top_frame"""
+        analysis = {
+            "error_groups": [
+                {"exception": "NPE", "count": 2, "logger": "svc", "first_ts": "t0",
+                 "top_frame": {"file": "A.java", "line": 10}},
+                {"top_frame": {"file": "B.java"}},
+                {}
+            ],
+            "warnings": [{"timestamp": "t1", "logger": "svc", "message": "lento"}, {}]
+        }
+
+        errors, warnings = flatten(analysis)
+
+        assert errors == [
+            ErrorRow("NPE", 2, "svc", "t0", "A.java:10"),
+            ErrorRow("Unknown", 0, "Unknown", "N/A", "B.java:?"),
+            ErrorRow("Unknown", 0, "Unknown", "N/A", "")
+        ]
+        assert warnings == [
+            WarningRow("t1", "svc", "lento"),
+            WarningRow("N/A", "Unknown", "")
+        ]
+
+    def test_flatten_respects_limits_and_missing_keys(self):
+        """Debe recortar a los máximos y tolerar claves ausentes"""
+        analysis = {"warnings": [{"message": str(i)} for i in range(5)]}
+
+        errors, warnings = flatten(analysis, max_warnings=2)
+
+        assert errors == []
+        assert [w.message for w in warnings] == ["0", "1"]
+
+    def test_rows_use_slots(self):
+        """Las filas no deben tener __dict__ por instancia"""
+        assert not hasattr(WarningRow("t", "l", "m"), "__dict__")
@@ -0,0 +1,30 @@
+"""
+Tests unitarios para la apertura de archivos de salida.
+"""
+
+import tempfile
+from pathlib import Path
+
+from src.adapters.file_output import open_for_write
+
+
+def test_open_for_write_creates_missing_directories():
+    """Debe crear el directorio si falta y escribir el archivo"""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = Path(tmp_dir) / "a" / "b" / "reporte.txt"
+
+        with open_for_write(path, "w", encoding="utf-8") as f:
+            f.write("contenido")
+
+        assert path.read_text(encoding="utf-8") == "contenido"
+
+
+def test_open_for_write_uses_existing_directory():
+    """Con el directorio existente abre directamente"""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = Path(tmp_dir) / "reporte.bin"
+
+        with open_for_write(path, "wb") as f:
+            f.write(b"\x00\x01")
+
+        assert path.read_bytes() == b"\x00\x01"
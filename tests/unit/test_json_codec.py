@@ -0,0 +1,21 @@
+"""
+Tests unitarios para la serialización JSON de los adapters.
+"""
+
+import json
+
+from src.adapters.json_codec import dumps_json_indented
+
+
+def test_dumps_json_indented_matches_stdlib_output():
+    """Debe producir el mismo JSON indentado que json.dumps (sin escapar Unicode)"""
+    analysis = {
+        "summary": {"total_events": 3, "ratio": 0.5},
+        "error_groups": [{"exception": "NPE", "top_frame": None, "samples": []}],
+        "hourly": {10: 2},
+        "message": "conexión rechazada 😀"
+    }
+
+    expected = json.dumps(analysis, indent=2, ensure_ascii=False).encode("utf-8")
+
+    assert dumps_json_indented(analysis) == expected
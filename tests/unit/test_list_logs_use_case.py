@@ -0,0 +1,34 @@
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from src.domain.use_cases import ListLogsUseCase
+from src.adapters.cache_memory import MemoryCache
+from src.adapters.log_reader_fs import FileSystemLogReader
+from src.config.settings import settings
+
+
+class CountingLogReader(FileSystemLogReader):
+    def __init__(self):
+        self.calls = 0
+
+    def list_logs(self, directory: str):
+        self.calls += 1
+        return super().list_logs(directory)
+
+
+def test_list_logs_is_cached_until_directory_changes(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "CACHE_ENABLED", True)
+    (tmp_path / "app.txt").write_text("app logs")
+    reader = CountingLogReader()
+    use_case = ListLogsUseCase(log_reader=reader, cache=MemoryCache())
+
+    assert use_case.execute(str(tmp_path))["count"] == 1
+    assert use_case.execute(str(tmp_path))["count"] == 1
+    assert reader.calls == 1
+
+    (tmp_path / "system.txt").write_text("system logs")
+
+    assert use_case.execute(str(tmp_path))["count"] == 2
+    assert reader.calls == 2
@@ -0,0 +1,53 @@
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from src.adapters.llm_cached import CachedLLM
+from src.ports.llm_port import LLMPort
+
+
+class CountingLLM(LLMPort):
+    model = "fake-model"
+
+    def __init__(self):
+        self.calls = 0
+
+    def generate_text(self, prompt, system_prompt=None):
+        self.calls += 1
+        return f"report for {prompt}"
+
+
+def test_cached_llm_reuses_response_for_same_prompt():
+    inner = CountingLLM()
+    llm = CachedLLM(inner, provider="fake")
+
+    first = llm.generate_text("log A", "system")
+    second = llm.generate_text("log A", "system")
+
+    assert first == second == "report for log A"
+    assert inner.calls == 1
+
+
+def test_cached_llm_keys_on_system_prompt_and_prompt():
+    inner = CountingLLM()
+    llm = CachedLLM(inner, provider="fake")
+
+    llm.generate_text("log A", "system")
+    llm.generate_text("log A", "other system")
+    llm.generate_text("log B", "system")
+
+    assert inner.calls == 3
+
+
+def test_cached_llm_on_file_cache_survives_a_new_instance(tmp_path):
+    from src.adapters.cache_file import FileCache
+
+    first = CountingLLM()
+    CachedLLM(first, provider="fake", cache=FileCache(tmp_path)).generate_text("log A")
+
+    second = CountingLLM()
+    result = CachedLLM(second, provider="fake", cache=FileCache(tmp_path)).generate_text("log A")
+
+    assert result == "report for log A"
+    assert second.calls == 0
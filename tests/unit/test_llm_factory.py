@@ -20,3 +20,34 @@ def test_llm_factory_invalid_provider():
     settings.LLM_PROVIDER = "invalid"
     with pytest.raises(ValueError):
         create_llm()
+
+
+def test_llm_factory_does_not_import_unused_providers():
+    import subprocess
+
+    code = (
+        "import sys; import src.adapters.llm_factory; "
+        "print(any(m.startswith('src.adapters.llm_') and m != 'src.adapters.llm_factory' "
+        "for m in sys.modules))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=Path(__file__).resolve().parents[2],
+        capture_output=True,
+        text=True,
+        check=True
+    )
+
+    assert result.stdout.strip() == "False"
+
+
+def test_llm_factory_wraps_provider_in_cache_when_enabled(monkeypatch):
+    from src.adapters.llm_cached import CachedLLM
+
+    monkeypatch.setattr(settings, "LLM_PROVIDER", "ollama")
+    monkeypatch.setattr(settings, "LLM_CACHE_ENABLED", True)
+
+    llm = create_llm()
+
+    assert isinstance(llm, CachedLLM)
+    assert llm.model == settings.OLLAMA_MODEL
@@ -0,0 +1,166 @@
+from pathlib import Path
+import json
+import sys
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+import pytest
+import requests
+from urllib3.exceptions import ReadTimeoutError
+
+from src.adapters import http_session
+from src.adapters.llm_anthropic import AnthropicLLM
+from src.adapters.llm_google import GoogleLLM
+from src.adapters.llm_openai import OpenAILLM
+
+
+class FakeResponse:
+    def __init__(self, payload):
+        self._payload = payload
+
+    @property
+    def content(self):
+        return json.dumps(self._payload).encode("utf-8")
+
+    def raise_for_status(self):
+        pass
+
+    def iter_lines(self, chunk_size=512):
+        # Respuesta OpenAI en streaming: un evento SSE por fragmento
+        for choice in self._payload.get("choices", []):
+            delta = {"choices": [{"delta": {"content": choice["message"]["content"]}}]}
+            yield b"data: " + json.dumps(delta).encode("utf-8")
+            yield b""
+        yield b"data: [DONE]"
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+class FakeSession:
+    def __init__(self, payload):
+        self.payload = payload
+        self.headers = {}
+        self.calls = []
+        self.closed = False
+
+    def post(self, url, **kwargs):
+        self.calls.append((url, kwargs))
+        return FakeResponse(self.payload)
+
+    def close(self):
+        self.closed = True
+
+
+def test_anthropic_sets_headers_once_on_session():
+    session = FakeSession({"content": [{"text": "reporte"}]})
+    llm = AnthropicLLM(api_key="secret", model="claude", session=session)
+
+    assert llm.generate_text("hola") == "reporte"
+    assert llm.generate_text("hola otra vez") == "reporte"
+
+    assert session.headers["x-api-key"] == "secret"
+    assert len(session.calls) == 2
+    assert "headers" not in session.calls[0][1]
+
+
+def test_openai_and_google_post_through_session():
+    openai_session = FakeSession({"choices": [{"message": {"content": "ok"}}]})
+    google_session = FakeSession({"candidates": [{"content": {"parts": [{"text": "ok"}]}}]})
+
+    OpenAILLM(api_key="k", session=openai_session).generate_text("hola")
+    GoogleLLM(api_key="k", session=google_session).generate_text("hola")
+
+    assert openai_session.headers["Authorization"] == "Bearer k"
+    assert len(openai_session.calls) == 1
+    assert len(google_session.calls) == 1
+
+
+def test_default_session_retries_rate_limits():
+    llm = OpenAILLM(api_key="k")
+
+    retry = llm.session.get_adapter("https://api.openai.com").max_retries
+    llm.close()
+
+    assert isinstance(llm.session, requests.Session)
+    assert 429 in retry.status_forcelist
+    assert retry.respect_retry_after_header
+    assert retry.backoff_jitter > 0
+    assert retry.backoff_max == 30
+
+
+def test_openai_streams_sse_fragments_and_joins_them():
+    class StreamSession(FakeSession):
+        def post(self, url, **kwargs):
+            self.calls.append((url, kwargs))
+            response = FakeResponse({})
+            response.iter_lines = lambda chunk_size=512: iter([
+                b'data: {"choices": [{"delta": {"role": "assistant"}}]}',
+                b'data: {"choices": [{"delta": {"content": "# Rep"}}]}',
+                b"",
+                b'data: {"choices": [{"delta": {"content": "orte"}}]}',
+                b"data: [DONE]",
+            ])
+            return response
+
+    session = StreamSession({})
+    llm = OpenAILLM(api_key="k", session=session)
+
+    assert list(llm.generate_text_stream("hola")) == ["# Rep", "orte"]
+    assert llm.generate_text("hola") == "# Reporte"
+    _, kwargs = session.calls[0]
+    assert kwargs["stream"] is True
+    assert json.loads(kwargs["data"])["stream"] is True
+
+
+def _openai_failing_mid_stream(error=None, timeout=None):
+    def iter_lines(chunk_size=512):
+        yield b'data: {"choices": [{"delta": {"content": "# Rep"}}]}'
+        yield b'data: {"choices": [{"delta": {"content": "orte"}}]}'
+        if error is not None:
+            raise error
+        yield b"data: [DONE]"
+
+    response = FakeResponse({})
+    response.iter_lines = iter_lines
+    session = FakeSession({})
+    session.post = lambda url, **kwargs: response
+    return OpenAILLM(api_key="k", timeout=timeout, session=session)
+
+
+def test_openai_read_timeout_mid_stream_is_a_timeout():
+    # requests envuelve el ReadTimeoutError de urllib3 en un ConnectionError
+    error = requests.exceptions.ConnectionError(ReadTimeoutError(None, None, "Read timed out."))
+
+    with pytest.raises(TimeoutError):
+        _openai_failing_mid_stream(error).generate_text("hola")
+
+
+def test_openai_truncated_stream_is_an_llm_failure():
+    error = requests.exceptions.ChunkedEncodingError("Connection broken")
+
+    with pytest.raises(Exception, match="incompleta") as excinfo:
+        _openai_failing_mid_stream(error).generate_text("hola")
+    assert not isinstance(excinfo.value, (TimeoutError, ConnectionError))
+
+
+def test_openai_stream_is_bounded_by_total_timeout(monkeypatch):
+    clock = iter([0.0, 5.0, 31.0])
+    monkeypatch.setattr(http_session.time, "monotonic", lambda: next(clock))
+
+    with pytest.raises(TimeoutError):
+        _openai_failing_mid_stream(timeout=30).generate_text("hola")
+
+
+def test_remote_adapters_send_pre_serialized_json_bodies():
+    session = FakeSession({"content": [{"text": "ok"}]})
+    AnthropicLLM(api_key="k", model="claude", session=session).generate_text("hola ñ", "sistema")
+
+    _, kwargs = session.calls[0]
+    assert "json" not in kwargs
+    assert isinstance(kwargs["data"], bytes)
+    assert json.loads(kwargs["data"])["messages"][0]["content"] == "hola ñ"
+    assert session.headers["Content-Type"] == "application/json"
@@ -0,0 +1,147 @@
+from pathlib import Path
+import json
+import sys
+
+import pytest
+import requests
+from urllib3.exceptions import ReadTimeoutError
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from src.adapters import http_session
+from src.adapters.llm_ollama import OllamaLLM
+
+
+class FakeResponse:
+    def __init__(self, payload):
+        self._payload = payload
+
+    @property
+    def content(self):
+        return json.dumps(self._payload).encode("utf-8")
+
+    def raise_for_status(self):
+        pass
+
+    def iter_lines(self, chunk_size=512):
+        for fragment in self._payload.get("stream", [self._payload.get("response", "")]):
+            yield json.dumps({"response": fragment, "done": False}).encode("utf-8")
+        yield json.dumps({"response": "", "done": True}).encode("utf-8")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+class FakeSession:
+    def __init__(self, payload):
+        self.payload = payload
+        self.calls = []
+        self.closed = False
+
+    def post(self, url, **kwargs):
+        self.calls.append((url, kwargs))
+        return FakeResponse(self.payload)
+
+    def close(self):
+        self.closed = True
+
+
+def test_ollama_reuses_injected_session():
+    session = FakeSession({"response": "reporte"})
+    llm = OllamaLLM(base_url="http://ollama:11434", model="mistral", session=session)
+
+    assert llm.generate_text("hola") == "reporte"
+    assert llm.generate_text("hola otra vez") == "reporte"
+
+    assert len(session.calls) == 2
+    assert session.calls[0][0] == "http://ollama:11434/api/generate"
+
+
+def test_ollama_close_closes_session():
+    session = FakeSession({"response": "reporte"})
+    llm = OllamaLLM(model="mistral", session=session)
+
+    llm.close()
+
+    assert session.closed is True
+
+
+def test_ollama_bounds_timeout_and_output_tokens():
+    session = FakeSession({"response": "reporte"})
+    llm = OllamaLLM(model="mistral", timeout=30, session=session)
+
+    llm.generate_text("hola")
+
+    _, kwargs = session.calls[0]
+    assert kwargs["timeout"] == (llm.connect_timeout, 30)
+    assert kwargs["json"]["options"]["num_predict"] == llm.max_output_tokens
+
+
+def test_ollama_warm_up_loads_model_with_one_token():
+    session = FakeSession({"response": "pong"})
+    session.head = lambda url, **kwargs: session.calls.append((url, kwargs))
+    llm = OllamaLLM(base_url="http://ollama:11434", model="mistral", session=session)
+
+    llm.warm_up()
+
+    assert session.calls[0][0] == "http://ollama:11434"
+    url, kwargs = session.calls[1]
+    assert url == "http://ollama:11434/api/generate"
+    assert kwargs["json"]["options"]["num_predict"] == 1
+
+
+def test_ollama_streams_fragments_and_joins_them():
+    session = FakeSession({"stream": ["# Rep", "orte", " final"]})
+    llm = OllamaLLM(model="mistral", session=session)
+
+    fragments = list(llm.generate_text_stream("hola"))
+
+    assert fragments == ["# Rep", "orte", " final"]
+    assert llm.generate_text("hola") == "# Reporte final"
+    _, kwargs = session.calls[0]
+    assert kwargs["stream"] is True
+    assert kwargs["json"]["stream"] is True
+
+
+def _session_failing_mid_stream(error):
+    session = FakeSession({"stream": ["# Rep"]})
+
+    def iter_lines(chunk_size=512):
+        yield json.dumps({"response": "# Rep", "done": False}).encode("utf-8")
+        raise error
+
+    response = FakeResponse({})
+    response.iter_lines = iter_lines
+    session.post = lambda url, **kwargs: response
+    return session
+
+
+def test_ollama_read_timeout_mid_stream_is_a_timeout():
+    # requests envuelve el ReadTimeoutError de urllib3 en un ConnectionError
+    error = requests.exceptions.ConnectionError(ReadTimeoutError(None, None, "Read timed out."))
+    llm = OllamaLLM(model="mistral", session=_session_failing_mid_stream(error))
+
+    with pytest.raises(TimeoutError):
+        llm.generate_text("hola")
+
+
+def test_ollama_truncated_stream_is_an_llm_failure():
+    error = requests.exceptions.ChunkedEncodingError("Connection broken")
+    llm = OllamaLLM(model="mistral", session=_session_failing_mid_stream(error))
+
+    with pytest.raises(Exception, match="incompleta") as excinfo:
+        llm.generate_text("hola")
+    assert not isinstance(excinfo.value, (TimeoutError, ConnectionError))
+
+
+def test_ollama_stream_is_bounded_by_total_timeout(monkeypatch):
+    clock = iter([0.0, 5.0, 31.0])
+    monkeypatch.setattr(http_session.time, "monotonic", lambda: next(clock))
+    session = FakeSession({"stream": ["# Rep", "orte", " final"]})
+    llm = OllamaLLM(model="mistral", timeout=30, session=session)
+
+    with pytest.raises(TimeoutError):
+        llm.generate_text("hola")
@@ -0,0 +1,81 @@
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from src.domain.log_analyzer.analyzer import LogAnalyzer
+from src.domain.model import LogEvent
+
+
+LOG = """2026-02-13 08:30:15 INFO [main] com.app.Boot - started
+2026-02-13 08:31:00 ERROR [pool-1] com.app.Repo - query failed
+java.lang.IllegalStateException: connection closed
+\tat com.app.Repo.find(Repo.java:42)
+\tat com.app.Service.load(Service.java:10)
+
+2026-02-13 08:32:00 WARN [main] com.app.Cache - slow
+2026-02-13 08:33:00 ERROR [pool-2] com.app.Repo - query failed again
+java.lang.IllegalStateException: connection reset
+    at com.app.Repo.find(Repo.java:42)
+"""
+
+
+def test_analyze_extracts_exception_and_top_frame():
+    result = LogAnalyzer().analyze(LOG)
+
+    error = result["events"][1]
+    assert error["exception"] == "java.lang.IllegalStateException"
+    assert error["exception_message"] == "connection closed"
+    assert error["top_frame"] == {"where": "com.app.Repo.find", "file": "Repo.java", "line": 42}
+    assert error["raw_block"].endswith("Service.java:10)")
+    assert result["events"][0]["raw_block"] is None
+
+
+def test_analyze_groups_errors_by_exception_and_frame():
+    result = LogAnalyzer().analyze(LOG)
+
+    assert result["summary"] == {"total_events": 4, "total_errors": 2, "total_warnings": 1}
+    assert len(result["error_groups"]) == 1
+    group = result["error_groups"][0]
+    assert group["count"] == 2
+    assert group["first_ts"] == "2026-02-13 08:31:00"
+    assert group["last_ts"] == "2026-02-13 08:33:00"
+    assert [s["exception_message"] for s in group["samples"]] == ["connection closed", "connection reset"]
+
+
+def test_analyze_limits_events_but_keeps_later_warnings():
+    lines = [f"2026-02-13 08:30:{i % 60:02d} INFO [main] com.app.Job - tick {i}" for i in range(60)]
+    lines.append("2026-02-13 08:40:00 WARN [main] com.app.Job - late warning")
+    lines.append("  detail line")
+
+    result = LogAnalyzer().analyze("\r\n".join(lines))
+
+    assert result["summary"]["total_events"] == 61
+    assert len(result["events"]) == 50
+    assert result["warnings"][0]["message"] == "late warning"
+    assert result["warnings"][0]["raw_block"] == "detail line"
+
+
+def test_analyze_interns_repeated_event_fields():
+    text = "\n".join(
+        f"2026-02-13 08:30:1{i} ERROR [pool-1] com.app.Repo - fail {i}\n"
+        "java.lang.IllegalStateException: closed"
+        for i in range(2)
+    )
+
+    first, second = LogAnalyzer().analyze(text)["events"]
+
+    assert first["logger"] is second["logger"]
+    assert first["exception"] is second["exception"]
+
+
+def test_log_event_is_slotted_and_serializes_with_ts_key():
+    event = LogEvent(timestamp="2026-02-13 08:30:15", level="INFO", thread="main",
+                     logger="com.app.Boot", message="started")
+
+    assert not hasattr(event, "__dict__")
+    assert list(event.to_dict()) == list(LogAnalyzer().analyze(LOG)["events"][0])
+    assert event.to_dict()["ts"] == "2026-02-13 08:30:15"
+    assert event == LogEvent(timestamp="2026-02-13 08:30:15", level="INFO", thread="main",
+                             logger="com.app.Boot", message="started")
+    assert "message='started'" in repr(event)
@@ -139,3 +139,23 @@ class TestReadLog:
             reader = FileSystemLogReader()
             with pytest.raises(ValueError):
                 reader.read_log(tmp_dir)
+
+    def test_read_log_normalizes_newlines_like_text_mode(self):
+        """Debe decodificar UTF-8 y convertir \\r\\n y \\r a \\n"""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            test_file = Path(tmp_dir) / "test.txt"
+            test_file.write_bytes("línea 1\r\nlínea 2\rlínea 3".encode("utf-8"))
+
+            reader = FileSystemLogReader()
+            result = reader.read_log(str(test_file))
+
+            assert result == "línea 1\nlínea 2\nlínea 3"
+
+    def test_read_log_returns_empty_string_for_empty_file(self):
+        """Debe retornar cadena vacía para un archivo vacío"""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            test_file = Path(tmp_dir) / "empty.txt"
+            test_file.write_bytes(b"")
+
+            reader = FileSystemLogReader()
+            assert reader.read_log(str(test_file)) == ""
@@ -0,0 +1,43 @@
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from src.adapters.rate_limiter import SlidingWindowRateLimiter
+
+
+def test_rate_limiter_blocks_after_limit_per_client():
+    limiter = SlidingWindowRateLimiter(limit=2, window_seconds=60)
+
+    assert limiter.allow("10.0.0.1") is True
+    assert limiter.allow("10.0.0.1") is True
+    assert limiter.allow("10.0.0.1") is False
+    assert limiter.allow("10.0.0.2") is True
+
+
+def test_rate_limiter_zero_limit_disables_it():
+    limiter = SlidingWindowRateLimiter(limit=0)
+
+    assert all(limiter.allow("10.0.0.1") for _ in range(100))
+
+
+def test_rate_limiter_forgets_idle_clients(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr("src.adapters.rate_limiter.time.monotonic", lambda: now[0])
+    limiter = SlidingWindowRateLimiter(limit=1, window_seconds=60)
+
+    for client in range(100):
+        assert limiter.allow(f"10.0.0.{client}") is True
+    now[0] += 61
+    assert limiter.allow("10.0.1.1") is True
+
+    assert list(limiter._hits) == ["10.0.1.1"]
+
+
+def test_rate_limiter_reset_clears_all_clients():
+    limiter = SlidingWindowRateLimiter(limit=1, window_seconds=60)
+    assert limiter.allow("10.0.0.1") is True
+
+    limiter.reset()
+
+    assert limiter.allow("10.0.0.1") is True
@@ -0,0 +1,48 @@
+"""
+Tests unitarios para el exporter de reportes Arrow/Feather.
+Requieren pyarrow (dependencia opcional).
+"""
+
+import os
+import tempfile
+
+import pytest
+
+feather = pytest.importorskip("pyarrow.feather")
+
+from src.adapters.report_exporter_arrow import ArrowExporter
+
+
+ANALYSIS = {
+    "summary": {"total_events": 3, "total_errors": 2},
+    "error_groups": [
+        {"exception": "NullPointerException", "count": 2, "logger": "svc",
+         "first_ts": "t0", "last_ts": "t1"},
+        {"count": 1}
+    ],
+    "warnings": [{"ts": "t2", "logger": "svc", "message": "lento"}]
+}
+
+
+def test_export_writes_single_error_table():
+    """Debe escribir un único archivo Feather con los errores y el resumen en metadata"""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = ArrowExporter().export(tmp_dir, "reporte", "", ANALYSIS)
+
+        errors = feather.read_table(path)
+        assert errors.to_pydict() == {
+            "exception": ["NullPointerException", "Unknown"],
+            "count": [2, 1],
+            "logger": ["svc", "Unknown"],
+            "first_ts": ["t0", "N/A"],
+            "last_ts": ["t1", "N/A"],
+        }
+        assert errors.schema.metadata[b"summary.total_errors"] == b"2"
+        assert os.listdir(tmp_dir) == ["reporte.arrow"]
+
+
+def test_export_requires_analysis():
+    """Sin análisis estructurado no hay tablas que exportar"""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        with pytest.raises(ValueError):
+            ArrowExporter().export(tmp_dir, "reporte", "contenido", None)
@@ -0,0 +1,68 @@
+"""
+Tests unitarios para el exporter de reportes Excel.
+Verifica que ambos backends (xlsxwriter y openpyxl) generan las mismas hojas.
+"""
+
+import tempfile
+
+import pytest
+from openpyxl import load_workbook
+
+from src.adapters import report_exporter_excel
+from src.adapters.report_exporter_excel import ExcelExporter
+
+
+ANALYSIS = {
+    "summary": {"total_events": 3, "total_errors": 2},
+    "error_groups": [
+        {"exception": "NullPointerException", "count": 2, "logger": "svc",
+         "first_ts": "t0", "last_ts": "t1", "top_frame": {"file": "A.java", "line": 7}}
+    ],
+    "warnings": [{"timestamp": f"t{i}", "logger": "svc", "message": "lento"} for i in range(60)]
+}
+
+
+@pytest.mark.parametrize("use_xlsxwriter", [True, False])
+def test_export_writes_same_sheets_with_both_backends(monkeypatch, use_xlsxwriter):
+    """Debe generar Resumen, Errores y Advertencias con cualquiera de los backends"""
+    if use_xlsxwriter:
+        pytest.importorskip("xlsxwriter")
+    else:
+        monkeypatch.setattr(report_exporter_excel, "_import_xlsxwriter", lambda: None)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = ExcelExporter().export(tmp_dir, "reporte", "", ANALYSIS)
+        workbook = load_workbook(path)
+
+        assert workbook.sheetnames == ["Resumen", "Errores", "Advertencias"]
+
+        summary = list(workbook["Resumen"].iter_rows(values_only=True))
+        assert summary == [("Métrica", "Valor"), ("Total Events", 3), ("Total Errors", 2)]
+
+        errors = workbook["Errores"]
+        assert list(errors.iter_rows(min_row=2, values_only=True)) == [
+            ("NullPointerException", 2, "svc", "A.java:7", "t0", "t1")
+        ]
+        assert errors["A1"].font.bold is True
+        assert errors["A2"].border.left.style == "thin"
+
+        # Los warnings se limitan a 50
+        assert workbook["Advertencias"].max_row == 51
+
+
+def test_export_writes_url_messages_as_plain_text():
+    """Un mensaje que empieza con una URL se escribe como texto, sin hipervínculo"""
+    pytest.importorskip("xlsxwriter")
+    analysis = {
+        "summary": {},
+        "error_groups": [],
+        "warnings": [{"timestamp": "t0", "logger": "svc", "message": "http://svc/api timed out"}]
+    }
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = ExcelExporter().export(tmp_dir, "reporte", "", analysis)
+        sheet = load_workbook(path)["Advertencias"]
+
+        message = sheet.cell(row=2, column=3)
+        assert message.value == "http://svc/api timed out"
+        assert message.hyperlink is None
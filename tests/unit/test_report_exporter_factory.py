@@ -0,0 +1,32 @@
+"""
+Tests unitarios para el factory de exporters.
+"""
+
+from src.adapters.report_exporter_factory import ReportExporterFactory
+from src.adapters.report_exporter_txt import TxtExporter
+from src.adapters.report_exporter_markdown import MarkdownExporter
+from src.domain.enums import OutputFormat
+
+
+def test_create_returns_shared_instance_per_format(monkeypatch):
+    """Debe crear el exporter una sola vez por formato y reutilizarlo"""
+    monkeypatch.setattr(ReportExporterFactory, "_instances", {})
+
+    first = ReportExporterFactory.create(OutputFormat.TXT)
+    second = ReportExporterFactory.create(OutputFormat.TXT)
+
+    assert isinstance(first, TxtExporter)
+    assert first is second
+
+
+def test_register_invalidates_cached_class(monkeypatch):
+    """Registrar un formato debe descartar la instancia cacheada"""
+    monkeypatch.setattr(
+        ReportExporterFactory, "_exporter_modules", dict(ReportExporterFactory._exporter_modules)
+    )
+    monkeypatch.setattr(ReportExporterFactory, "_instances", {})
+    ReportExporterFactory.create(OutputFormat.TXT)
+
+    ReportExporterFactory.register(OutputFormat.TXT, ".report_exporter_markdown", "MarkdownExporter")
+
+    assert isinstance(ReportExporterFactory.create(OutputFormat.TXT), MarkdownExporter)
@@ -0,0 +1,21 @@
+"""
+Tests unitarios para el exporter de reportes en texto plano.
+"""
+
+from src.adapters.report_exporter_txt import TxtExporter
+
+
+def test_markdown_to_plain_strips_headings_emphasis_and_bullets():
+    """Debe quitar encabezados de cualquier nivel, énfasis y código inline"""
+    markdown = "# Título\n## Sección **clave**\n#### Sub `code`\n- item __a__\nid_1 # 3"
+
+    plain = TxtExporter()._markdown_to_plain(markdown)
+
+    assert plain == "Título\nSección clave\nSub code\n  • item a\nid1 # 3"
+
+
+def test_markdown_to_plain_returns_plain_text_unchanged():
+    """Sin marcas de Markdown debe devolver el mismo texto"""
+    text = "Reporte 2024-01-01\nErrores: 5 (servicio-a)"
+
+    assert TxtExporter()._markdown_to_plain(text) is text
@@ -0,0 +1,37 @@
+"""
+Tests unitarios para el writer de reportes al filesystem.
+"""
+
+from pathlib import Path
+
+from src.adapters.report_writer_fs import FileSystemReportWriter
+
+
+def _writer(tmp_path: Path) -> FileSystemReportWriter:
+    writer = FileSystemReportWriter()
+    writer.reports_dir = tmp_path / "reports"
+    writer.analysis_dir = tmp_path / "analysis"
+    return writer
+
+
+def test_format_writers_are_created_on_first_use(tmp_path):
+    """Solo debe crear el writer del formato pedido"""
+    writer = _writer(tmp_path)
+
+    path = writer.write_report("run1", "contenido", report_format="txt")
+
+    assert Path(path).read_text(encoding="utf-8") == "contenido"
+    assert list(writer._writers) == ["txt"]
+
+
+def test_excel_report_is_written_to_reports_dir(tmp_path):
+    """El writer Excel debe recibir el directorio de reportes como los demás"""
+    writer = _writer(tmp_path)
+
+    path = writer.write_report(
+        "run1", "", report_format="excel", analysis={"summary": {"total_errors": 1}}
+    )
+
+    assert Path(path) == tmp_path / "reports" / "run1.xlsx"
+    assert Path(path).exists()
+
@@ -184,6 +184,24 @@ class TestDocReportWriter:
             # Simplemente verificar que el archivo se creó sin errores
             assert Path(path).stat().st_size > 0
 
+    def test_escape_rtf_emits_control_words_and_encoded_chars(self):
+        """Debe escapar llaves/backslash y codificar acentos, Unicode y emojis"""
+        escaped = DocReportWriter()._escape_rtf("a\\b{c}\nd\té中😀")
+
+        assert escaped == "a\\\\b\\{c\\}\\par\nd\\tab \\'e9\\u20013?\\u-10179?\\u-8704?"
+
+    def test_generate_rtf_is_ascii_with_real_line_breaks(self):
+        """El RTF generado debe ser ASCII puro y sin '\\n' literales"""
+        rtf = DocReportWriter()._generate_rtf(
+            "Análisis",
+            {"summary": {"total_errors": 1}, "error_groups": [{"exception": "NPE", "count": 1}]}
+        )
+
+        assert rtf.isascii()
+        assert "Calibri;}}\n" in rtf
+        assert "}}\\n" not in rtf
+        assert rtf.endswith("}")
+
 
 class TestReportWriterInterface:
     """Tests comunes para todos los writers"""
@@ -0,0 +1,11 @@
+"""
+Entrypoint WSGI para servidores de producción.
+
+Uso:
+    gunicorn -w 5 -k gthread --threads 4 -b 0.0.0.0:8080 wsgi:app
+"""
+
+from app.api import create_app
+
+
+app = create_app()